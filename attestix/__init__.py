@@ -16,7 +16,7 @@ Canonical import paths (recommended)::
 
 Modules:
     - attestix.services: Identity, credentials, compliance, delegation, reputation, provenance
-    - attestix.tools: MCP tool definitions (47 tools across 9 modules)
+    - attestix.tools: MCP tool definitions (56 tools across 9 modules)
     - attestix.auth: Cryptographic utilities (Ed25519, SSRF protection)
     - attestix.blockchain: Merkle trees and EAS anchoring
     - attestix.storage: Pluggable persistence (Repository seam, file / memory / pg)
@@ -0,0 +1,65 @@
+"""Internal JSON codec for Attestix.
+
+Uses ``orjson`` when the optional ``[fast]`` extra is installed and falls back
+to the stdlib ``json`` module otherwise, so the default install pulls no extra
+runtime dependency. Both backends accept ``bytes``/``str`` input and raise a
+``ValueError`` subclass on malformed documents, so callers handle errors the
+same way regardless of which backend is active.
+
+Serialization is used for the on-disk documents and for JSON passed between
+tools, never for signing. The two backends format some values differently
+(orjson writes non-ASCII as UTF-8 and ``1e-05`` as ``0.00001``), which is fine
+where any conforming JSON reader round-trips either form, but not for signing
+payloads, which keep the stdlib canonical form in
+:func:`attestix.auth.crypto.canonicalize_json`.
+"""
+
+import json
+
+try:
+    import orjson as _orjson
+except ImportError:  # pragma: no cover - exercised only without the extra
+    _orjson = None
+
+if _orjson is not None:
+    _DOCUMENT_OPTIONS = _orjson.OPT_INDENT_2 | _orjson.OPT_NON_STR_KEYS
+
+#: True when the orjson fast path is active.
+HAS_ORJSON = _orjson is not None
+
+
+def loads(data):
+    """Parse a JSON document from ``bytes`` or ``str``."""
+    if _orjson is not None:
+        return _orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps_document(obj) -> bytes:
+    """Serialize a stored document as UTF-8 JSON bytes, indented two spaces.
+
+    Matches the layout of ``json.dump(obj, f, indent=2)``. Falls back to the
+    stdlib for values orjson refuses (integers wider than 64 bits, very deep
+    nesting) so a document that saved before still saves.
+    """
+    if _orjson is not None:
+        try:
+            return _orjson.dumps(obj, option=_DOCUMENT_OPTIONS)
+        except TypeError:
+            pass
+    return json.dumps(obj, indent=2).encode("utf-8")
+
+
+def dumps(obj, default=None) -> str:
+    """Serialize ``obj`` as compact JSON text.
+
+    ``default`` is called for values neither backend encodes natively, as
+    with ``json.dumps(obj, default=...)``. Falls back to the stdlib on the
+    same values as :func:`dumps_document`.
+    """
+    if _orjson is not None:
+        try:
+            return _orjson.dumps(obj, default=default, option=_orjson.OPT_NON_STR_KEYS).decode()
+        except TypeError:
+            pass
+    return json.dumps(obj, default=default)
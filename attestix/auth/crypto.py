@@ -9,6 +9,7 @@ import logging
 import os
 import stat
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Tuple
 
@@ -24,7 +25,7 @@ from cryptography.hazmat.primitives.serialization import (
     PublicFormat,
 )
 
-from attestix.config import SIGNING_KEY_FILE
+from attestix import config
 from attestix.errors import ErrorCategory, log_and_format_error
 
 logger = logging.getLogger(__name__)
@@ -68,8 +69,19 @@ def private_key_from_bytes(key_bytes: bytes) -> Ed25519PrivateKey:
 
 
 def public_key_from_bytes(key_bytes: bytes) -> Ed25519PublicKey:
-    """Deserialize public key from raw 32 bytes."""
-    return Ed25519PublicKey.from_public_bytes(key_bytes)
+    """Deserialize public key from raw 32 bytes.
+
+    Memoized per distinct key, like :func:`did_key_to_public_key`: verifying
+    against a recurring issuer reuses one key object instead of re-parsing.
+    """
+    return _public_key_from_raw(bytes(key_bytes))
+
+
+@lru_cache(maxsize=4096)
+def _public_key_from_raw(raw_bytes: bytes) -> Ed25519PublicKey:
+    # Keyed on immutable bytes (callers may pass a bytearray). Invalid input
+    # raises, and lru_cache never stores exceptions, so errors are not cached.
+    return Ed25519PublicKey.from_public_bytes(raw_bytes)
 
 
 def sign_message(private_key: Ed25519PrivateKey, message: bytes) -> bytes:
@@ -93,7 +105,13 @@ def public_key_to_did_key(public_key: Ed25519PublicKey) -> str:
 
     Format: did:key:z<base58btc(multicodec_prefix + raw_public_key)>
     """
-    raw_bytes = public_key_to_bytes(public_key)
+    return _did_key_from_raw(public_key_to_bytes(public_key))
+
+
+@lru_cache(maxsize=1024)
+def _did_key_from_raw(raw_bytes: bytes) -> str:
+    # Keyed on the raw bytes (key objects compare by identity), so re-deriving
+    # the DID of an already-seen key skips the pure-Python base58 encode.
     multicodec_bytes = ED25519_MULTICODEC_PREFIX + raw_bytes
     encoded = base58.b58encode(multicodec_bytes).decode("ascii")
     return f"did:key:z{encoded}"
@@ -112,8 +130,13 @@ def did_key_fragment(did: str) -> str:
     return f"#{multibase}"
 
 
+@lru_cache(maxsize=1024)
 def did_key_to_public_key(did: str) -> Ed25519PublicKey:
-    """Extract Ed25519 public key from did:key identifier."""
+    """Extract Ed25519 public key from did:key identifier.
+
+    Memoized: the mapping is pure and key objects are immutable, so every
+    verification against the same issuer reuses one decoded key.
+    """
     if not did.startswith("did:key:z"):
         raise ValueError(f"Invalid did:key format: {did}")
 
@@ -179,7 +202,8 @@ def load_or_create_signing_key(
     Returns:
         Tuple of (private_key, did_key_string).
     """
-    key_path = key_file or SIGNING_KEY_FILE
+    # Read at call time so a relocated (or test-patched) data dir is honoured.
+    key_path = key_file or config.SIGNING_KEY_FILE
     fernet_key = _get_key_encryption_key()
 
     if key_path.exists():
@@ -351,13 +375,21 @@ def canonicalize_json(payload: dict) -> bytes:
     return canonical.encode("utf-8")
 
 
-def sign_json_payload(private_key: Ed25519PrivateKey, payload: dict) -> str:
-    """Sign a JSON payload (RFC 8785 canonical form) and return base64url signature."""
-    canonical_bytes = canonicalize_json(payload)
+def sign_bytes(private_key: Ed25519PrivateKey, canonical_bytes: bytes) -> str:
+    """Sign already-canonicalized payload bytes and return base64url signature.
+
+    For callers that need the ``canonicalize_json`` bytes anyway (e.g. to hash a
+    Merkle leaf): reusing them skips a second serialization of the payload.
+    """
     sig_bytes = sign_message(private_key, canonical_bytes)
     return base64.urlsafe_b64encode(sig_bytes).decode("ascii")
 
 
+def sign_json_payload(private_key: Ed25519PrivateKey, payload: dict) -> str:
+    """Sign a JSON payload (RFC 8785 canonical form) and return base64url signature."""
+    return sign_bytes(private_key, canonicalize_json(payload))
+
+
 def verify_json_signature(
     public_key: Ed25519PublicKey, payload: dict, signature_b64: str
 ) -> bool:
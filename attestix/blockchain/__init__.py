@@ -10,7 +10,10 @@ from .merkle import (
     build_merkle_tree,
     compute_merkle_root,
     hash_leaf,
+    hash_leaf_bytes,
     hash_pair,
+    merkle_proof,
+    root_from_proof,
 )
 
 from .abi import EAS_ABI, SCHEMA_REGISTRY_ABI
@@ -26,6 +29,9 @@ __all__ = [
     "build_merkle_tree",
     "compute_merkle_root",
     "hash_leaf",
+    "hash_leaf_bytes",
     "hash_pair",
     "merkle",
+    "merkle_proof",
+    "root_from_proof",
 ]
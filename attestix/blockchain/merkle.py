@@ -7,7 +7,7 @@ Follows the Certificate Transparency (RFC 6962) convention.
 
 import hashlib
 import json
-from typing import List, Tuple
+from typing import List, Sequence, Tuple
 
 # Domain separation prefixes (RFC 6962 Section 2.1)
 _LEAF_PREFIX = b"\x00"
@@ -20,6 +20,11 @@ def hash_leaf(data: dict) -> bytes:
     return hashlib.sha256(_LEAF_PREFIX + canonical.encode("utf-8")).digest()
 
 
+def hash_leaf_bytes(data: bytes) -> bytes:
+    """SHA-256 hash of already-canonicalized bytes with leaf domain prefix."""
+    return hashlib.sha256(_LEAF_PREFIX + data).digest()
+
+
 def hash_pair(left: bytes, right: bytes) -> bytes:
     """SHA-256 hash of two child hashes with internal node domain prefix."""
     return hashlib.sha256(_NODE_PREFIX + left + right).digest()
@@ -61,3 +66,36 @@ def compute_merkle_root(entries: List[dict]) -> Tuple[str, int]:
     leaf_hashes = [hash_leaf(entry) for entry in entries]
     root, _ = build_merkle_tree(leaf_hashes)
     return root.hex(), len(leaf_hashes)
+
+
+def merkle_proof(levels: List[List[bytes]], index: int) -> List[Tuple[str, bytes]]:
+    """Return the inclusion proof for leaf ``index`` of a tree from :func:`build_merkle_tree`.
+
+    Each step is ``(side, sibling_hash)`` where ``side`` is ``"L"`` if the
+    sibling sits to the left of the running hash and ``"R"`` if it sits to the
+    right. Levels where the node was promoted unpaired contribute no step.
+    """
+    if not 0 <= index < len(levels[0]):
+        raise IndexError(f"Leaf index {index} out of range for {len(levels[0])} leaves")
+
+    proof = []
+    for level in levels[:-1]:
+        if index % 2 == 1:
+            proof.append(("L", level[index - 1]))
+        elif index + 1 < len(level):
+            proof.append(("R", level[index + 1]))
+        index //= 2
+    return proof
+
+
+def root_from_proof(leaf: bytes, proof: Sequence[Tuple[str, bytes]]) -> bytes:
+    """Recompute the Merkle root from a leaf hash and its inclusion proof."""
+    current = leaf
+    for side, sibling in proof:
+        if side == "L":
+            current = hash_pair(sibling, current)
+        elif side == "R":
+            current = hash_pair(current, sibling)
+        else:
+            raise ValueError(f"Invalid proof step side {side!r}")
+    return current
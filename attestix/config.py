@@ -11,6 +11,8 @@ from typing import Optional
 from dotenv import load_dotenv
 from filelock import FileLock
 
+from attestix import _json
+
 PROJECT_DIR = Path(__file__).parent
 
 # Data directory: use ATTESTIX_DATA_DIR env var, or ~/.attestix/ by default.
@@ -53,6 +55,10 @@ UNIVERSAL_RESOLVER_URL = _get_env(
     default="https://dev.uniresolver.io/1.0/identifiers/",
 )
 
+# Seconds a successfully fetched (did:web / Universal Resolver) DID Document is
+# reused before it is fetched again. 0 disables the cache.
+DID_CACHE_TTL = float(_get_env("DID_CACHE_TTL", default="30"))
+
 # UAIT defaults
 UAIT_VERSION = "0.1.0"
 DEFAULT_EXPIRY_DAYS = int(_get_env("DEFAULT_EXPIRY_DAYS", default="365"))
@@ -67,17 +73,16 @@ def _safe_load(filepath: Path, default: dict) -> dict:
         if not filepath.exists():
             return default.copy()
         try:
-            with open(filepath, "r") as f:
-                return json.load(f)
+            return _json.loads(filepath.read_bytes())
         except (json.JSONDecodeError, ValueError) as e:
             # Try backup
             backup = filepath.with_suffix(".json.bak")
             if backup.exists():
                 try:
-                    with open(backup, "r") as f:
-                        print(f"WARNING: Recovered {filepath.name} from backup",
-                              file=sys.stderr)
-                        return json.load(f)
+                    recovered = _json.loads(backup.read_bytes())
+                    print(f"WARNING: Recovered {filepath.name} from backup",
+                          file=sys.stderr)
+                    return recovered
                 except (json.JSONDecodeError, ValueError):
                     pass
             # Move corrupted file aside, start fresh
@@ -98,8 +103,7 @@ def _safe_save(filepath: Path, data: dict):
             shutil.copy2(str(filepath), str(backup))
         # Write to temp file, then atomic rename
         temp = filepath.with_suffix(".json.tmp")
-        with open(temp, "w") as f:
-            json.dump(data, f, indent=2)
+        temp.write_bytes(_json.dumps_document(data))
         temp.replace(filepath)
 
 
@@ -135,6 +139,20 @@ def save_identities(data: dict):
     _repo().save_document("identities", data)
 
 
+def append_identity(uait: dict) -> dict:
+    """Append one UAIT to the identity store (see :func:`append_credential`).
+
+    The load and save happen under the repository lock, so concurrent creators
+    cannot drop each other's records the way ``load -> append -> save`` would.
+    """
+    return _repo().append_to_document("identities", uait)
+
+
+def append_identities(uaits: list) -> list:
+    """Append several UAITs with one write (bulk counterpart of :func:`append_identity`)."""
+    return _repo().extend_document("identities", uaits)
+
+
 # --- Reputation storage ---
 
 def load_reputation() -> dict:
@@ -145,6 +163,21 @@ def save_reputation(data: dict):
     _repo().save_document("reputation", data)
 
 
+def read_reputation(read):
+    """Apply ``read`` to the live reputation document (no copy); see
+    ``FileRepository.read_document``."""
+    return _repo().read_document("reputation", read)
+
+
+def update_reputation(mutate):
+    """Mutate the reputation document in place and persist it once.
+
+    Write-path shim over ``FileRepository.update_document``: ``mutate`` receives
+    the live document (no O(N) copy), so an insert costs O(record) in memory.
+    """
+    return _repo().update_document("reputation", mutate)
+
+
 # --- Delegation storage ---
 
 def load_delegations() -> dict:
@@ -155,6 +188,11 @@ def save_delegations(data: dict):
     _repo().save_document("delegations", data)
 
 
+def append_delegation(record: dict) -> dict:
+    """Append one delegation record to the store (see :func:`append_identity`)."""
+    return _repo().append_to_document("delegations", record)
+
+
 # --- Compliance storage ---
 
 def load_compliance() -> dict:
@@ -171,6 +209,12 @@ def load_credentials() -> dict:
     return _repo().load_document("credentials")
 
 
+def read_credentials(read):
+    """Apply ``read`` to the live credentials document (no copy); see
+    ``FileRepository.read_document``."""
+    return _repo().read_document("credentials", read)
+
+
 def save_credentials(data: dict):
     _repo().save_document("credentials", data)
 
@@ -196,6 +240,21 @@ def save_provenance(data: dict):
     _repo().save_document("provenance", data)
 
 
+def read_provenance(read):
+    """Apply ``read`` to the live provenance document (no copy); see
+    ``FileRepository.read_document``."""
+    return _repo().read_document("provenance", read)
+
+
+def update_provenance(mutate):
+    """Mutate the provenance document in place and persist it once.
+
+    Write-path shim over ``FileRepository.update_document`` (see
+    :func:`update_reputation`).
+    """
+    return _repo().update_document("provenance", mutate)
+
+
 # --- Anchor storage ---
 
 def load_anchors() -> dict:
@@ -4,15 +4,15 @@ MCP server for cross-protocol agent identity bridging,
 delegation chains, reputation scoring, EU AI Act compliance,
 and blockchain anchoring.
 
-47 tools across 9 modules:
-  - Identity (8): create, resolve, verify, translate, list, get, revoke, purge (GDPR)
+56 tools across 9 modules:
+  - Identity (10): create, create_agent_identities, resolve, verify, translate, list, get, get_agent_snapshot, revoke, purge (GDPR)
   - Agent Cards (3): parse, generate, discover
   - DID (3): create_did_key, create_did_web, resolve_did
   - Delegation (4): create, verify, list, revoke
-  - Reputation (3): record_interaction, get_reputation, query_reputation
+  - Reputation (4): record_interaction, record_interactions, get_reputation, query_reputation
   - Compliance (7): create_profile, get_profile, update_profile, get_status, record_assessment, generate_declaration, list_profiles
-  - Credentials (8): issue, verify, verify_external, revoke, get, list, create_presentation, verify_presentation
-  - Provenance (5): record_training_data, record_model_lineage, log_action, get_provenance, get_audit_trail
+  - Credentials (11): issue, verify, verify_external, verify_batch, verify_stored_batch, revoke, get, list, list_many, create_presentation, verify_presentation
+  - Provenance (8): record_training_data, record_training_datasets, record_model_lineage, log_action, log_actions, get_provenance, get_audit_trail, get_audit_trail_count
   - Blockchain (6): anchor_identity, anchor_credential, anchor_audit_batch, verify_anchor, get_anchor_status, estimate_anchor_cost
 """
 
@@ -55,7 +55,7 @@ credential_tools.register(mcp)
 provenance_tools.register(mcp)
 blockchain_tools.register(mcp)
 
-print(f"Attestix MCP server loaded: 47 tools registered", file=sys.stderr)
+print(f"Attestix MCP server loaded: 56 tools registered", file=sys.stderr)
 
 
 def main():
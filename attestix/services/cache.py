@@ -4,11 +4,14 @@ Reuses the pattern from productivity-mcp: singleton service instances
 with a configurable time-to-live to avoid stale state.
 """
 
+import threading
 import time
 from typing import Any, Dict, Optional, Tuple, Type
 
 _cache: Dict[str, Tuple[Any, float]] = {}
 DEFAULT_TTL = 600  # 10 minutes
+# Serializes lookup-or-create so concurrent tool calls share one instance.
+_lock = threading.Lock()
 
 
 def get_service(
@@ -49,25 +52,26 @@ def get_service(
     cache_key = f"{service_class.__name__}:{instance_id}"
     now = time.time()
 
-    if cache_key in _cache:
-        instance, created_at = _cache[cache_key]
-        if now - created_at < ttl:
-            return instance
-        # Remove expired entry
-        del _cache[cache_key]
+    with _lock:
+        if cache_key in _cache:
+            instance, created_at = _cache[cache_key]
+            if now - created_at < ttl:
+                return instance
+            # Remove expired entry
+            del _cache[cache_key]
 
-    # Periodic cleanup: remove all expired entries when cache grows large
-    if len(_cache) > 50:
-        expired_keys = [
-            k for k, (_, created_at) in _cache.items()
-            if now - created_at >= DEFAULT_TTL
-        ]
-        for k in expired_keys:
-            del _cache[k]
+        # Periodic cleanup: remove all expired entries when cache grows large
+        if len(_cache) > 50:
+            expired_keys = [
+                k for k, (_, created_at) in _cache.items()
+                if now - created_at >= DEFAULT_TTL
+            ]
+            for k in expired_keys:
+                del _cache[k]
 
-    instance = service_class(**kwargs)
-    _cache[cache_key] = (instance, now)
-    return instance
+        instance = service_class(**kwargs)
+        _cache[cache_key] = (instance, now)
+        return instance
 
 
 def clear_cache(service_class: Optional[Type] = None):
@@ -8,18 +8,24 @@ import logging
 import uuid
 import warnings
 from datetime import datetime, timedelta, timezone
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional, Union
 
 logger = logging.getLogger(__name__)
 
 from attestix.auth.crypto import (
+    canonicalize_json,
     did_key_fragment,
-    verify_json_signature,
     did_key_to_public_key,
 )
 from attestix.audit import AuditEventEmitter, resolve_emitter, safe_emit
-from attestix.config import append_credential, load_credentials, save_credentials
+from attestix.config import (
+    append_credential,
+    load_credentials,
+    read_credentials,
+    save_credentials,
+)
 from attestix.errors import ErrorCategory, log_and_format_error
+from attestix.services.sig_cache import verify_canonical
 from attestix.signing import InProcessSigner, Signer
 from attestix.storage.repository import DEFAULT_TENANT
 
@@ -57,6 +63,9 @@ class CredentialService:
         # KMS) swaps the backend with no change to public method signatures.
         self._signer = signer or InProcessSigner()
         self._server_did = self._signer.did
+        # Proof verificationMethod for everything this service signs; fixed for
+        # the signer's lifetime, so derived once rather than per issuance.
+        self._verification_method = f"{self._server_did}{did_key_fragment(self._server_did)}"
         # v0.4.0 (T033/T034): per-service audit emitter + tenant context (side
         # channel; tenant defaults to "default" for v0.3.0 parity).
         self._emitter = resolve_emitter(emitter)
@@ -138,7 +147,7 @@ class CredentialService:
             credential["proof"] = {
                 "type": "Ed25519Signature2020",
                 "created": now.isoformat(),
-                "verificationMethod": f"{self._server_did}{did_key_fragment(self._server_did)}",
+                "verificationMethod": self._verification_method,
                 "proofPurpose": "assertionMethod",
                 "proofValue": signature,
             }
@@ -171,46 +180,7 @@ class CredentialService:
     def verify_credential(self, credential_id: str) -> dict:
         """Verify a credential: check signature, expiry, and revocation status."""
         try:
-            cred = self._find_credential(credential_id)
-            if not cred:
-                return {"valid": False, "credential_id": credential_id, "checks": {"exists": False}}
-
-            checks = {"exists": True}
-
-            # Check revocation
-            status = cred.get("credentialStatus", {})
-            checks["not_revoked"] = not status.get("revoked", False)
-
-            # Check expiry
-            exp_str = cred.get("expirationDate")
-            if exp_str:
-                exp_dt = datetime.fromisoformat(exp_str)
-                checks["not_expired"] = datetime.now(timezone.utc) < exp_dt
-            else:
-                checks["not_expired"] = True
-
-            # Check signature
-            proof = cred.get("proof", {})
-            proof_value = proof.get("proofValue")
-            if proof_value:
-                proof_payload = {k: v for k, v in cred.items() if k not in self.MUTABLE_FIELDS}
-                try:
-                    checks["signature_valid"] = self._verify_proof_bound(
-                        self._issuer_did(cred), proof, proof_payload
-                    )
-                except Exception:
-                    checks["signature_valid"] = False
-            else:
-                checks["signature_valid"] = False
-
-            valid = all(v for v in checks.values() if isinstance(v, bool))
-            return {
-                "valid": valid,
-                "credential_id": credential_id,
-                "type": cred.get("type", []),
-                "subject": cred.get("credentialSubject", {}).get("id"),
-                "checks": checks,
-            }
+            return self._verify_stored(credential_id, self._find_credential(credential_id))
         except Exception as e:
             msg = log_and_format_error(
                 "verify_credential", e, ErrorCategory.CREDENTIAL,
@@ -218,6 +188,81 @@ class CredentialService:
             )
             return {"error": msg}
 
+    def verify_credentials_by_id(self, credential_ids: List[str]) -> List[dict]:
+        """Verify many stored credentials; one result per ID, in order.
+
+        Same checks as :meth:`verify_credential`, but the credential store is
+        read once for the whole batch instead of once per ID. Each Ed25519
+        proof is still verified on its own (``cryptography`` exposes no batch
+        verifier), so a tampered credential only fails its own slot.
+        """
+        try:
+            # An unhashable ID (list/dict) must fail its own slot, not the set.
+            wanted = {c for c in credential_ids if isinstance(c, str)}
+            stored = {
+                cred["id"]: cred
+                for cred in load_credentials()["credentials"]
+                if cred.get("id") in wanted
+            }
+            results = []
+            for credential_id in credential_ids:
+                try:
+                    results.append(self._verify_stored(credential_id, stored.get(credential_id)))
+                except Exception as e:
+                    results.append({"error": log_and_format_error(
+                        "verify_credentials_by_id", e, ErrorCategory.CREDENTIAL,
+                        credential_id=credential_id,
+                    )})
+            return results
+        except Exception as e:
+            msg = log_and_format_error(
+                "verify_credentials_by_id", e, ErrorCategory.CREDENTIAL,
+                count=len(credential_ids),
+            )
+            return [{"error": msg} for _ in credential_ids]
+
+    def _verify_stored(self, credential_id: str, cred: Optional[dict]) -> dict:
+        """Body of :meth:`verify_credential` for an already looked-up record."""
+        if not cred:
+            return {"valid": False, "credential_id": credential_id, "checks": {"exists": False}}
+
+        checks = {"exists": True}
+
+        # Check revocation
+        status = cred.get("credentialStatus", {})
+        checks["not_revoked"] = not status.get("revoked", False)
+
+        # Check expiry
+        exp_str = cred.get("expirationDate")
+        if exp_str:
+            exp_dt = datetime.fromisoformat(exp_str)
+            checks["not_expired"] = datetime.now(timezone.utc) < exp_dt
+        else:
+            checks["not_expired"] = True
+
+        # Check signature
+        proof = cred.get("proof", {})
+        proof_value = proof.get("proofValue")
+        if proof_value:
+            proof_payload = {k: v for k, v in cred.items() if k not in self.MUTABLE_FIELDS}
+            try:
+                checks["signature_valid"] = self._verify_proof_bound(
+                    self._issuer_did(cred), proof, proof_payload
+                )
+            except Exception:
+                checks["signature_valid"] = False
+        else:
+            checks["signature_valid"] = False
+
+        valid = all(v for v in checks.values() if isinstance(v, bool))
+        return {
+            "valid": valid,
+            "credential_id": credential_id,
+            "type": cred.get("type", []),
+            "subject": cred.get("credentialSubject", {}).get("id"),
+            "checks": checks,
+        }
+
     def revoke_credential(self, credential_id: str, reason: str = "") -> dict:
         """Revoke a credential."""
         try:
@@ -258,6 +303,25 @@ class CredentialService:
         """Get a credential by ID."""
         return self._find_credential(credential_id)
 
+    @staticmethod
+    def _passes_filters(
+        cred: dict, credential_type: Optional[str], valid_only: bool,
+    ) -> bool:
+        """Apply the type and validity filters shared by the list methods."""
+        if credential_type:
+            if credential_type not in cred.get("type", []):
+                return False
+        if valid_only:
+            status = cred.get("credentialStatus", {})
+            if status.get("revoked"):
+                return False
+            exp_str = cred.get("expirationDate")
+            if exp_str:
+                exp_dt = datetime.fromisoformat(exp_str)
+                if datetime.now(timezone.utc) >= exp_dt:
+                    return False
+        return True
+
     def list_credentials(
         self,
         agent_id: Optional[str] = None,
@@ -275,18 +339,8 @@ class CredentialService:
                     subject = cred.get("credentialSubject", {}).get("id")
                     if subject != agent_id:
                         continue
-                if credential_type:
-                    if credential_type not in cred.get("type", []):
-                        continue
-                if valid_only:
-                    status = cred.get("credentialStatus", {})
-                    if status.get("revoked"):
-                        continue
-                    exp_str = cred.get("expirationDate")
-                    if exp_str:
-                        exp_dt = datetime.fromisoformat(exp_str)
-                        if datetime.now(timezone.utc) >= exp_dt:
-                            continue
+                if not self._passes_filters(cred, credential_type, valid_only):
+                    continue
 
                 results.append(cred)
                 if len(results) >= limit:
@@ -299,6 +353,56 @@ class CredentialService:
             )
             return [{"error": msg}]
 
+    def list_credentials_by_agent(
+        self,
+        agent_ids: List[str],
+        credential_type: Optional[str] = None,
+        valid_only: bool = False,
+        limit: int = 50,
+    ) -> dict:
+        """List credentials for several subjects with one pass over the store.
+
+        Returns ``{agent_id: [credentials]}`` with one key per requested ID,
+        in request order, each list built exactly as :meth:`list_credentials`
+        would build it for that agent (same filters, same per-agent ``limit``).
+        """
+        try:
+            results = {agent_id: [] for agent_id in agent_ids}
+            for cred in load_credentials()["credentials"]:
+                subject = cred.get("credentialSubject", {}).get("id")
+                bucket = results.get(subject)
+                if bucket is None or len(bucket) >= limit:
+                    continue
+                if self._passes_filters(cred, credential_type, valid_only):
+                    bucket.append(cred)
+            return results
+        except Exception as e:
+            msg = log_and_format_error(
+                "list_credentials_by_agent", e, ErrorCategory.CREDENTIAL,
+                count=len(agent_ids),
+            )
+            return {"error": msg}
+
+    def count_credentials(self, agent_id: str) -> Union[int, dict]:
+        """Number of stored credentials whose subject is ``agent_id``.
+
+        Counts inside :func:`read_credentials`, so no credential is copied.
+        """
+        try:
+            def _read(data: dict) -> int:
+                return sum(
+                    1 for cred in data["credentials"]
+                    if cred.get("credentialSubject", {}).get("id") == agent_id
+                )
+
+            return read_credentials(_read)
+        except Exception as e:
+            msg = log_and_format_error(
+                "count_credentials", e, ErrorCategory.CREDENTIAL,
+                agent_id=agent_id,
+            )
+            return {"error": msg}
+
     def create_verifiable_presentation(
         self,
         agent_id: str,
@@ -342,7 +446,7 @@ class CredentialService:
             vp["proof"] = {
                 "type": "Ed25519Signature2020",
                 "created": now.isoformat(),
-                "verificationMethod": f"{self._server_did}{did_key_fragment(self._server_did)}",
+                "verificationMethod": self._verification_method,
                 "proofPurpose": "authentication",
                 "proofValue": signature,
             }
@@ -377,6 +481,12 @@ class CredentialService:
         trusting it lets a self-signed object masquerade as a trusted issuer
         (key substitution). If ``verificationMethod`` is present it MUST
         reference the same DID as ``expected_did`` or verification fails.
+
+        The Ed25519 verdict is memoized on the exact (key, canonical payload,
+        signature) triple, so re-verifying the same credential (a VP's inner
+        credentials, then the same credentials one by one) pays one signature
+        check. Revocation and expiry are not part of the memoized verdict;
+        callers re-check them on every call.
         """
         if not expected_did:
             return False
@@ -387,7 +497,7 @@ class CredentialService:
         if vm and vm.split("#")[0] != expected_did:
             return False
         pub_key = did_key_to_public_key(expected_did)
-        return verify_json_signature(pub_key, payload, proof_value)
+        return verify_canonical(pub_key, canonicalize_json(payload), proof_value)
 
     def verify_presentation(self, presentation: dict) -> dict:
         """Verify a Verifiable Presentation: check holder signature, domain, challenge,
@@ -481,63 +591,109 @@ class CredentialService:
         Does not require the credential to be in local storage.
         """
         try:
-            checks = {}
-
-            # Check structure
-            vc_types = credential.get("type", [])
-            if "VerifiableCredential" not in vc_types:
-                return {"valid": False, "reason": "Not a VerifiableCredential"}
-            checks["structure_valid"] = True
-
-            # Check revocation (if we have it locally)
-            cred_id = credential.get("id")
-            local_cred = self._find_credential(cred_id) if cred_id else None
-            if local_cred:
-                status = local_cred.get("credentialStatus", {})
-                checks["not_revoked"] = not status.get("revoked", False)
-            else:
-                checks["not_revoked"] = True  # Cannot check, assume valid
-
-            # Check expiry
-            exp_str = credential.get("expirationDate")
-            if exp_str:
-                exp_dt = datetime.fromisoformat(exp_str)
-                checks["not_expired"] = datetime.now(timezone.utc) < exp_dt
-            else:
-                checks["not_expired"] = True
+            return self._verify_external(credential, self._find_credential)
+        except Exception as e:
+            msg = log_and_format_error(
+                "verify_credential_external", e, ErrorCategory.CREDENTIAL,
+            )
+            return {"error": msg}
 
-            # Verify signature
-            proof = credential.get("proof", {})
-            proof_value = proof.get("proofValue")
-            if proof_value:
-                proof_payload = {
-                    k: v for k, v in credential.items() if k not in self.MUTABLE_FIELDS
-                }
-                try:
-                    # Bind the verifying key to issuer.id (the trust anchor),
-                    # rejecting any proof.verificationMethod that names a
-                    # different DID (prevents issuer key-substitution).
-                    checks["signature_valid"] = self._verify_proof_bound(
-                        self._issuer_did(credential), proof, proof_payload
-                    )
-                except Exception:
-                    checks["signature_valid"] = False
-            else:
-                checks["signature_valid"] = False
+    def verify_credentials_external_batch(self, credentials: List[dict]) -> List[dict]:
+        """Verify many raw-JSON credentials; one result per item, in order.
 
-            valid = all(v for v in checks.values() if isinstance(v, bool))
-            return {
-                "valid": valid,
-                "credential_id": cred_id,
-                "type": vc_types,
-                "subject": credential.get("credentialSubject", {}).get("id"),
-                "checks": checks,
+        Same checks as :meth:`verify_credential_external`, but the local store
+        is read once for the whole batch (for revocation status) instead of
+        once per credential. A malformed item yields an ``{"error": ...}``
+        entry in its slot without failing the rest of the batch.
+        """
+        try:
+            # Only string ids can match a stored credential; an unhashable id
+            # (list/dict) must fail its own slot, not the set build.
+            wanted = {
+                c["id"] for c in credentials
+                if isinstance(c, dict) and isinstance(c.get("id"), str)
             }
+            local = {
+                cred["id"]: cred
+                for cred in load_credentials()["credentials"]
+                if cred.get("id") in wanted
+            }
+            results = []
+            for credential in credentials:
+                try:
+                    results.append(self._verify_external(credential, local.get))
+                except Exception as e:
+                    results.append({"error": log_and_format_error(
+                        "verify_credentials_external_batch", e, ErrorCategory.CREDENTIAL,
+                    )})
+            return results
         except Exception as e:
             msg = log_and_format_error(
-                "verify_credential_external", e, ErrorCategory.CREDENTIAL,
+                "verify_credentials_external_batch", e, ErrorCategory.CREDENTIAL,
+                count=len(credentials),
             )
-            return {"error": msg}
+            return [{"error": msg} for _ in credentials]
+
+    def _verify_external(
+        self, credential: dict, find_local: Callable[[str], Optional[dict]]
+    ) -> dict:
+        """Checks behind :meth:`verify_credential_external`.
+
+        ``find_local`` maps a credential id to the locally stored copy (or
+        ``None``) for the revocation check.
+        """
+        checks = {}
+
+        # Check structure
+        vc_types = credential.get("type", [])
+        if "VerifiableCredential" not in vc_types:
+            return {"valid": False, "reason": "Not a VerifiableCredential"}
+        checks["structure_valid"] = True
+
+        # Check revocation (if we have it locally)
+        cred_id = credential.get("id")
+        local_cred = find_local(cred_id) if cred_id else None
+        if local_cred:
+            status = local_cred.get("credentialStatus", {})
+            checks["not_revoked"] = not status.get("revoked", False)
+        else:
+            checks["not_revoked"] = True  # Cannot check, assume valid
+
+        # Check expiry
+        exp_str = credential.get("expirationDate")
+        if exp_str:
+            exp_dt = datetime.fromisoformat(exp_str)
+            checks["not_expired"] = datetime.now(timezone.utc) < exp_dt
+        else:
+            checks["not_expired"] = True
+
+        # Verify signature
+        proof = credential.get("proof", {})
+        proof_value = proof.get("proofValue")
+        if proof_value:
+            proof_payload = {
+                k: v for k, v in credential.items() if k not in self.MUTABLE_FIELDS
+            }
+            try:
+                # Bind the verifying key to issuer.id (the trust anchor),
+                # rejecting any proof.verificationMethod that names a
+                # different DID (prevents issuer key-substitution).
+                checks["signature_valid"] = self._verify_proof_bound(
+                    self._issuer_did(credential), proof, proof_payload
+                )
+            except Exception:
+                checks["signature_valid"] = False
+        else:
+            checks["signature_valid"] = False
+
+        valid = all(v for v in checks.values() if isinstance(v, bool))
+        return {
+            "valid": valid,
+            "credential_id": cred_id,
+            "type": vc_types,
+            "subject": credential.get("credentialSubject", {}).get("id"),
+            "checks": checks,
+        }
 
     def _find_credential(self, credential_id: str) -> Optional[dict]:
         """Look up a credential by ID."""
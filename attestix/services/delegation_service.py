@@ -5,20 +5,102 @@ following the UCAN (User Controlled Authorization Networks) pattern
 with capability attenuation.
 """
 
+import json
 import secrets
+import threading
 import time
+from collections import OrderedDict
+from copy import deepcopy
 from datetime import datetime, timezone
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 import jwt
 
 from attestix.audit import AuditEventEmitter, resolve_emitter, safe_emit
 from attestix.auth.crypto import load_or_create_signing_key, did_key_to_public_key
-from attestix.config import load_delegations, save_delegations
+from attestix.config import append_delegation, load_delegations, save_delegations
 from attestix.errors import ErrorCategory, log_and_format_error
 from attestix.storage.repository import DEFAULT_TENANT
 
 
+#: Distinct (server DID, token) pairs whose signature-checked claims are kept.
+TOKEN_CACHE_SIZE = 4096
+
+# (server DID, token) -> signature-verified claims, least recently used first.
+_token_cache: "OrderedDict[Tuple[str, str], dict]" = OrderedDict()
+_token_cache_stats = {"hits": 0, "misses": 0}
+_token_cache_lock = threading.Lock()
+
+
+def _remember_token(server_did: str, token: str, claims: dict) -> None:
+    with _token_cache_lock:
+        _token_cache[(server_did, token)] = claims
+        _token_cache.move_to_end((server_did, token))
+        while len(_token_cache) > TOKEN_CACHE_SIZE:
+            _token_cache.popitem(last=False)
+
+
+def _decode_signed(server_did: str, token: str) -> dict:
+    """Decode ``token`` and verify its EdDSA signature against ``server_did``.
+
+    Signature checking is deterministic for an exact (key, token) pair, so the
+    decoded claims are memoized: re-verifying a token (or a shared parent in a
+    proof chain) skips the Ed25519 verify, and tokens this process just signed
+    are seeded at issuance so they never need one. Time-based claims are NOT
+    checked here (see :func:`_check_times`) and invalid tokens raise, so
+    failures are never cached. Callers must not mutate the returned claims.
+    """
+    key = (server_did, token)
+    with _token_cache_lock:
+        claims = _token_cache.get(key)
+        if claims is not None:
+            _token_cache.move_to_end(key)
+            _token_cache_stats["hits"] += 1
+            return claims
+        _token_cache_stats["misses"] += 1
+
+    claims = jwt.decode(
+        token,
+        did_key_to_public_key(server_did),
+        algorithms=["EdDSA"],
+        options={
+            "verify_aud": False,
+            "verify_exp": False,
+            "verify_nbf": False,
+            "verify_iat": False,
+        },
+    )
+    _remember_token(server_did, token, claims)
+    return claims
+
+
+def _check_times(claims: dict) -> None:
+    """Apply PyJWT's ``exp`` / ``nbf`` / ``iat`` checks against the current time."""
+    now = time.time()
+    for name in ("exp", "nbf", "iat"):
+        if name in claims and not isinstance(claims[name], (int, float)):
+            raise jwt.DecodeError(f"{name} claim must be a number")
+    if "exp" in claims and claims["exp"] <= now:
+        raise jwt.ExpiredSignatureError("Signature has expired")
+    if "nbf" in claims and claims["nbf"] > now:
+        raise jwt.ImmatureSignatureError("The token is not yet valid (nbf)")
+    if "iat" in claims and claims["iat"] > now:
+        raise jwt.ImmatureSignatureError("The token is not yet valid (iat)")
+
+
+def token_cache_info() -> dict:
+    """Return token cache statistics (size, hits, misses)."""
+    with _token_cache_lock:
+        return {"size": len(_token_cache), **_token_cache_stats}
+
+
+def clear_token_cache() -> None:
+    """Drop all memoized token decodes (e.g. between tests or after key rotation)."""
+    with _token_cache_lock:
+        _token_cache.clear()
+        _token_cache_stats.update(hits=0, misses=0)
+
+
 class DelegationService:
     """Manages UCAN-style delegation tokens between agents."""
 
@@ -124,6 +206,10 @@ class DelegationService:
                 },
             )
 
+            # We just signed it: remember the claims exactly as a decode would
+            # return them, so verifying this token later skips the Ed25519 check.
+            _remember_token(self._server_did, token, json.loads(json.dumps(payload)))
+
             # Record delegation (token omitted from persistent storage for security)
             delegation_record = {
                 "jti": jti,
@@ -135,9 +221,7 @@ class DelegationService:
                 "revoked": False,
             }
 
-            data = load_delegations()
-            data["delegations"].append(delegation_record)
-            save_delegations(data)
+            append_delegation(deepcopy(delegation_record))
 
             safe_emit(
                 self._emitter,
@@ -180,25 +264,51 @@ class DelegationService:
         # Track jtis seen in this verification run to prevent cycles.
         if _seen is None:
             _seen = set()
+        return self._verify_token(token, _seen, None)
+
+    def verify_delegations(self, tokens: List[str]) -> List[dict]:
+        """Verify many delegation tokens; one result per token, in order.
 
+        Same checks as :meth:`verify_delegation`, but the delegation store is
+        read once for the whole batch (for revocation status) instead of once
+        per token and per parent in each proof chain. Ed25519 signatures are
+        still checked one at a time (``cryptography`` exposes no batch
+        verifier); repeats and shared parents hit the token cache.
+        """
         try:
-            # Get server public key for verification
-            public_key = did_key_to_public_key(self._server_did)
-
-            claims = jwt.decode(
-                token,
-                public_key,
-                algorithms=["EdDSA"],
-                options={"verify_aud": False},
+            revoked = self._revoked_jtis()
+        except Exception as e:
+            msg = log_and_format_error(
+                "verify_delegations", e, ErrorCategory.DELEGATION,
+                count=len(tokens),
             )
+            return [{"valid": False, "reason": msg} for _ in tokens]
+        return [self._verify_token(token, set(), revoked) for token in tokens]
+
+    @staticmethod
+    def _revoked_jtis() -> set:
+        return {
+            d["jti"] for d in load_delegations()["delegations"]
+            if d.get("revoked") and d.get("jti")
+        }
+
+    def _verify_token(
+        self, token: str, _seen: set, revoked: Optional[set]
+    ) -> dict:
+        """Body of :meth:`verify_delegation`; ``revoked`` is loaded on first use."""
+        try:
+            # Signature verdicts are memoized per token; expiry and revocation
+            # are always re-checked against the current time and store.
+            claims = deepcopy(_decode_signed(self._server_did, token))
+            _check_times(claims)
 
             # Check revocation by jti
             jti = claims.get("jti")
             if jti:
-                data = load_delegations()
-                for d in data["delegations"]:
-                    if d.get("jti") == jti and d.get("revoked"):
-                        return {"valid": False, "reason": "Token has been revoked"}
+                if revoked is None:
+                    revoked = self._revoked_jtis()
+                if jti in revoked:
+                    return {"valid": False, "reason": "Token has been revoked"}
 
             # Detect cycles in the proof chain. A well-formed chain is
             # acyclic, so seeing the same jti twice indicates tampering
@@ -224,7 +334,7 @@ class DelegationService:
                         "valid": False,
                         "reason": "Malformed parent token in proof chain",
                     }
-                parent_result = self.verify_delegation(parent_token, _seen=_seen)
+                parent_result = self._verify_token(parent_token, _seen, revoked)
                 if not parent_result.get("valid"):
                     return {
                         "valid": False,
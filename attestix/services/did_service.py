@@ -7,7 +7,11 @@ Supports:
 """
 
 import json
-from typing import Optional
+import os
+import threading
+import time
+from copy import deepcopy
+from typing import Callable, Dict, Optional, Tuple
 
 from attestix.auth.crypto import (
     generate_ed25519_keypair,
@@ -18,6 +22,7 @@ from attestix.auth.crypto import (
 )
 from attestix.audit import AuditEventEmitter, resolve_emitter, safe_emit
 from attestix.auth.ssrf import fetch_json_pinned, validate_url_host
+from attestix import config
 from attestix.config import UNIVERSAL_RESOLVER_URL
 from attestix.errors import ErrorCategory, log_and_format_error
 from attestix.storage.repository import DEFAULT_TENANT
@@ -31,6 +36,64 @@ import base64
 # serving a gzip-compressed DID Document that decompresses to gigabytes.
 DID_DOCUMENT_MAX_BYTES = 256 * 1024
 
+# W3C DID Document contexts. Kept as an immutable tuple so every document
+# builder shares one constant; each document gets its own list copy so a caller
+# mutating a returned document can never corrupt the shared value.
+DID_CONTEXT = (
+    "https://www.w3.org/ns/did/v1",
+    "https://w3id.org/security/suites/ed25519-2020/v1",
+)
+
+ED25519_VERIFICATION_KEY_TYPE = "Ed25519VerificationKey2020"
+
+# Suffix for the keypair store's atomic-write temp file (".keypairs.json.tmp").
+_TEMP_SUFFIX = ".tmp"
+
+# Process-wide cache of remotely resolved DID Documents (did:web and Universal
+# Resolver): did -> (fetched_at, document). Only successful resolutions are
+# kept, for config.DID_CACHE_TTL seconds (read per call); at DID_CACHE_MAX entries the oldest fetch
+# is dropped. did:key resolves locally and is not cached here.
+DID_CACHE_MAX = 1024
+_did_cache: Dict[str, Tuple[float, dict]] = {}
+_did_cache_stats = {"hits": 0, "misses": 0}
+_did_cache_lock = threading.Lock()
+
+
+def did_cache_info() -> dict:
+    """Return DID resolution cache statistics (size, hits, misses, ttl)."""
+    with _did_cache_lock:
+        return {"size": len(_did_cache), "ttl": config.DID_CACHE_TTL, **_did_cache_stats}
+
+
+def clear_did_cache(did: Optional[str] = None) -> None:
+    """Drop one cached DID Document, or all of them when ``did`` is None."""
+    with _did_cache_lock:
+        if did is None:
+            _did_cache.clear()
+            _did_cache_stats.update(hits=0, misses=0)
+        else:
+            _did_cache.pop(did, None)
+
+
+def _resolve_cached(did: str, resolve: Callable[[str], dict]) -> dict:
+    """Return ``resolve(did)``, reusing a fresh cached document when present."""
+    now = time.monotonic()
+    ttl = config.DID_CACHE_TTL
+    with _did_cache_lock:
+        hit = _did_cache.get(did)
+        if hit is not None and now - hit[0] < ttl:
+            _did_cache_stats["hits"] += 1
+            return deepcopy(hit[1])
+        _did_cache_stats["misses"] += 1
+
+    document = resolve(did)
+    if ttl > 0 and isinstance(document, dict) and "error" not in document:
+        with _did_cache_lock:
+            if did not in _did_cache and len(_did_cache) >= DID_CACHE_MAX:
+                del _did_cache[min(_did_cache, key=lambda k: _did_cache[k][0])]
+            _did_cache[did] = (now, deepcopy(document))
+    return document
+
 
 class DIDService:
     """Resolves and creates DID documents."""
@@ -72,11 +135,15 @@ class DIDService:
                 "private_key_b64": priv_b64,
                 "created_at": datetime.now(timezone.utc).isoformat(),
             }
-            # Atomic write: temp file then rename
-            temp = keypair_file.with_suffix(".json.tmp")
-            with open(temp, "w") as f:
+            # Atomic write: temp file then rename. The temp file is created
+            # with 0o600 up front (the file holds private keys) and the rename
+            # goes straight to os.replace, keeping the locked section short.
+            keypair_path = str(keypair_file)
+            temp_path = keypair_path + _TEMP_SUFFIX
+            fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "w") as f:
                 json.dump(data, f, indent=2)
-            temp.replace(keypair_file)
+            os.replace(temp_path, keypair_path)
 
     def resolve_did(self, did: str) -> dict:
         """Resolve a DID to its DID Document.
@@ -88,9 +155,9 @@ class DIDService:
             if did.startswith("did:key:"):
                 return self._resolve_did_key(did)
             elif did.startswith("did:web:"):
-                return self._resolve_did_web(did)
+                return _resolve_cached(did, self._resolve_did_web)
             else:
-                return self._resolve_universal(did)
+                return _resolve_cached(did, self._resolve_universal)
         except Exception as e:
             return {
                 "error": log_and_format_error(
@@ -159,16 +226,13 @@ class DIDService:
             ).decode("ascii")
 
             did_document = {
-                "@context": [
-                    "https://www.w3.org/ns/did/v1",
-                    "https://w3id.org/security/suites/ed25519-2020/v1",
-                ],
+                "@context": list(DID_CONTEXT),
                 "id": did,
                 "controller": did,
                 "verificationMethod": [
                     {
                         "id": f"{did}#key-1",
-                        "type": "Ed25519VerificationKey2020",
+                        "type": ED25519_VERIFICATION_KEY_TYPE,
                         "controller": did,
                         "publicKeyMultibase": pub_multibase,
                     }
@@ -186,6 +250,8 @@ class DIDService:
             # Store keypair locally instead of returning private key in tool response
             keypair_id = f"keypair:{domain}:{did.split(':')[-1][:8]}"
             self._store_keypair(keypair_id, priv_b64, pub_multibase, did)
+            # A freshly minted key replaces whatever document was hosted before.
+            clear_did_cache(did)
 
             safe_emit(
                 self._emitter,
@@ -235,17 +301,14 @@ class DIDService:
         """Build a DID Document for a did:key."""
         vm = {
             "id": f"{did}#key-1",
-            "type": "Ed25519VerificationKey2020",
+            "type": ED25519_VERIFICATION_KEY_TYPE,
             "controller": did,
         }
         if pub_multibase:
             vm["publicKeyMultibase"] = pub_multibase
 
         return {
-            "@context": [
-                "https://www.w3.org/ns/did/v1",
-                "https://w3id.org/security/suites/ed25519-2020/v1",
-            ],
+            "@context": list(DID_CONTEXT),
             "id": did,
             "controller": did,
             "verificationMethod": [vm],
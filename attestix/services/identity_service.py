@@ -6,6 +6,7 @@ revoke, verify, and sign operations.
 
 import hashlib
 import uuid
+from copy import deepcopy
 from datetime import datetime, timedelta, timezone
 from typing import List, Optional
 
@@ -18,11 +19,14 @@ from attestix.auth.token_parser import extract_identity_from_token
 from attestix.config import (
     DEFAULT_EXPIRY_DAYS,
     UAIT_VERSION,
+    append_identities,
+    append_identity,
     load_identities,
     save_identities,
 )
 from attestix.audit import AuditEventEmitter, resolve_emitter, safe_emit
 from attestix.errors import ErrorCategory, log_and_format_error
+from attestix.services.did_service import DID_CONTEXT, ED25519_VERIFICATION_KEY_TYPE
 from attestix.signing import InProcessSigner, Signer
 from attestix.storage.repository import DEFAULT_TENANT
 
@@ -39,6 +43,11 @@ class IdentityService:
     MUTABLE_FIELDS = {"signature", "revoked", "revocation_reason", "revoked_at",
                       "reputation_score", "eu_compliance"}
 
+    # Keyword arguments accepted per item by create_identities_batch
+    IDENTITY_FIELDS = {"display_name", "source_protocol", "identity_token", "capabilities",
+                       "description", "issuer_name", "expiry_days"}
+    REQUIRED_IDENTITY_FIELDS = ("display_name", "source_protocol")
+
     def __init__(
         self,
         signer: Optional[Signer] = None,
@@ -83,6 +92,56 @@ class IdentityService:
         expiry_days: Optional[int] = None,
     ) -> dict:
         """Create a new UAIT from any identity source."""
+        uait = self._build_identity(
+            display_name, source_protocol, identity_token, capabilities,
+            description, issuer_name, expiry_days,
+        )
+
+        # Persist (pure append: no O(N) copy, atomic under the repository lock).
+        # The store keeps its own copy so the returned UAIT is the caller's.
+        append_identity(deepcopy(uait))
+        self._emit_created(uait)
+        return uait
+
+    def create_identities_batch(self, specs: List[dict]) -> List[dict]:
+        """Create many UAITs with one write.
+
+        Each item takes the same keyword arguments as :meth:`create_identity`.
+        Every item is validated and signed before anything is written, so a
+        bad item (``ValueError``, message prefixed with its index) rejects the
+        whole batch.
+        """
+        uaits = []
+        for i, spec in enumerate(specs):
+            if not isinstance(spec, dict):
+                raise ValueError(f"item {i}: must be an object")
+            for field in spec:
+                if field not in self.IDENTITY_FIELDS:
+                    raise ValueError(f"item {i}: unknown field '{field}'")
+            for field in self.REQUIRED_IDENTITY_FIELDS:
+                if field not in spec:
+                    raise ValueError(f"item {i}: missing required field '{field}'")
+            try:
+                uaits.append(self._build_identity(**spec))
+            except (TypeError, ValueError) as e:
+                raise ValueError(f"item {i}: {e}") from e
+        if uaits:
+            append_identities([deepcopy(u) for u in uaits])
+            for uait in uaits:
+                self._emit_created(uait)
+        return uaits
+
+    def _build_identity(
+        self,
+        display_name: str,
+        source_protocol: str,
+        identity_token: str = "",
+        capabilities: Optional[List[str]] = None,
+        description: str = "",
+        issuer_name: str = "",
+        expiry_days: Optional[int] = None,
+    ) -> dict:
+        """Validate inputs and return a new signed (not yet stored) UAIT."""
         # Defense in depth: validate even when callers skip the API layer.
         # Issue #32 - reject empty/whitespace/overlong display_name.
         if display_name is None:
@@ -140,24 +199,20 @@ class IdentityService:
         # Sign only immutable fields (through the pluggable Signer seam)
         signable = self._signable_payload(uait)
         uait["signature"] = self._signer.sign(signable)
+        return uait
 
-        # Persist
-        data = load_identities()
-        data["agents"].append(uait)
-        save_identities(data)
-
+    def _emit_created(self, uait: dict) -> None:
         safe_emit(
             self._emitter,
             action="identity.create",
-            target_id=agent_id,
+            target_id=uait["agent_id"],
             target_collection="identities",
             actor=self._server_did,
             tenant_id=self._tenant_id,
-            after={"agent_id": agent_id, "source_protocol": source_protocol},
+            after={"agent_id": uait["agent_id"],
+                   "source_protocol": uait["source_protocol"]},
         )
 
-        return uait
-
     def get_identity(self, agent_id: str) -> Optional[dict]:
         """Get a single UAIT by agent_id."""
         data = load_identities()
@@ -587,17 +642,14 @@ class IdentityService:
         fragment = did_key_fragment(did) if did.startswith("did:key:z") else "#key-1"
         vm = {
             "id": f"{did}{fragment}",
-            "type": "Ed25519VerificationKey2020",
+            "type": ED25519_VERIFICATION_KEY_TYPE,
             "controller": did,
         }
         if pub_multibase:
             vm["publicKeyMultibase"] = pub_multibase
 
         return {
-            "@context": [
-                "https://www.w3.org/ns/did/v1",
-                "https://w3id.org/security/suites/ed25519-2020/v1",
-            ],
+            "@context": list(DID_CONTEXT),
             "id": did,
             "controller": did,
             "verificationMethod": [vm],
@@ -7,17 +7,44 @@ Article 12 EU AI Act automatic action logging (audit trail).
 import hashlib
 import json
 import uuid
+from copy import deepcopy
 from datetime import datetime, timezone
-from typing import Dict, List, Optional
+from functools import cached_property
+from typing import Callable, Dict, List, Optional, Union
 
 from attestix.audit import AuditEventEmitter, resolve_emitter, safe_emit
-from attestix.config import load_provenance, save_provenance
+from attestix.auth.crypto import (
+    canonicalize_json,
+    did_key_to_public_key,
+    verify_json_signature,
+)
+from attestix.blockchain.merkle import (
+    build_merkle_tree,
+    hash_leaf_bytes,
+    merkle_proof,
+    root_from_proof,
+)
+from attestix.config import read_provenance, update_provenance
 from attestix.errors import ErrorCategory, log_and_format_error
+from attestix.services.sig_cache import verify_canonical
 from attestix.signing import InProcessSigner, Signer
+from attestix.storage.agent_index import AgentIndex
 from attestix.storage.repository import DEFAULT_TENANT
 
 
-VALID_ACTION_TYPES = {"inference", "delegation", "data_access", "external_call"}
+VALID_ACTION_TYPES = frozenset({"inference", "delegation", "data_access", "external_call"})
+_VALID_ACTION_TYPES_STR = ", ".join(sorted(VALID_ACTION_TYPES))
+
+#: ``signature.type`` of an entry signed as part of a Merkle batch. Batched
+#: entries carry an object (root, root signature, inclusion proof) instead of
+#: the plain base64url signature string used by single-entry writes.
+BATCH_SIGNATURE_TYPE = "MerkleBatchSignature"
+
+
+# Per-agent indexes over the append-only provenance lists, shared by every
+# service instance (the document cache they index is process-wide too).
+_ENTRIES_INDEX = AgentIndex()
+_AUDIT_INDEX = AgentIndex(order_by="timestamp")
 
 
 class ProvenanceService:
@@ -33,9 +60,10 @@ class ProvenanceService:
         tenant_id: str = DEFAULT_TENANT,
     ):
         # v0.4.0: sign through the pluggable Signer seam (default = in-process
-        # Ed25519, byte-for-byte identical to v0.3.0).
-        self._signer = signer or InProcessSigner()
-        self._server_did = self._signer.did
+        # Ed25519, byte-for-byte identical to v0.3.0). An injected signer
+        # shadows the lazy ``_signer`` property below.
+        if signer is not None:
+            self._signer = signer
         # v0.4.0 (T033/T034): per-service audit emitter + tenant context. NOTE:
         # this service keeps its OWN hash-chained `audit_log` (Article 12) intact;
         # the shared AuditEvent emission here is the additive structured-audit
@@ -43,6 +71,21 @@ class ProvenanceService:
         self._emitter = resolve_emitter(emitter)
         self._tenant_id = tenant_id
 
+    @cached_property
+    def _signer(self) -> Signer:
+        """Default in-process signer, loaded on first use.
+
+        Key loading is file I/O (and key generation on a fresh install), so it
+        is deferred until something is actually signed or verified: read-only
+        callers (``get_provenance``, ``get_audit_trail``) never pay for it. A
+        key that exists but cannot be loaded still fails loud, at first use.
+        """
+        return InProcessSigner()
+
+    @cached_property
+    def _server_did(self) -> str:
+        return self._signer.did
+
     @staticmethod
     def _chain_hash(previous_hash: str, entry_data: dict) -> str:
         """Compute SHA-256 hash linking this entry to the previous one.
@@ -56,11 +99,231 @@ class ProvenanceService:
 
     def _get_last_chain_hash(self, audit_log: list, agent_id: str) -> str:
         """Get the chain_hash of the last audit entry for this agent."""
-        for entry in reversed(audit_log):
-            if entry["agent_id"] == agent_id and "chain_hash" in entry:
+        for entry in reversed(_AUDIT_INDEX.sync(audit_log).get(agent_id)):
+            if "chain_hash" in entry:
                 return entry["chain_hash"]
         return self.GENESIS_HASH
 
+    # --- Entry construction and persistence helpers ---
+
+    def _build_training_data_entry(
+        self,
+        agent_id: str,
+        dataset_name: str,
+        source_url: str = "",
+        license: str = "",
+        data_categories: Optional[List[str]] = None,
+        contains_personal_data: bool = False,
+        data_governance_measures: str = "",
+        dataset_version: str = "",
+    ) -> dict:
+        """Build an unsigned ``training_data`` provenance entry."""
+        return {
+            "entry_id": f"prov:{uuid.uuid4().hex[:12]}",
+            "entry_type": "training_data",
+            "agent_id": agent_id,
+            "dataset_name": dataset_name,
+            "dataset_version": dataset_version,
+            "source_url": source_url,
+            "license": license,
+            "data_categories": data_categories or [],
+            "contains_personal_data": contains_personal_data,
+            "data_governance_measures": data_governance_measures,
+            "recorded_at": datetime.now(timezone.utc).isoformat(),
+            "recorded_by": self._server_did,
+        }
+
+    def _build_model_lineage_entry(
+        self,
+        agent_id: str,
+        base_model: str,
+        base_model_provider: str = "",
+        fine_tuning_method: str = "",
+        evaluation_metrics: Optional[Dict] = None,
+        training_config: Optional[Dict] = None,
+    ) -> dict:
+        """Build an unsigned ``model_lineage`` provenance entry."""
+        return {
+            "entry_id": f"prov:{uuid.uuid4().hex[:12]}",
+            "entry_type": "model_lineage",
+            "agent_id": agent_id,
+            "base_model": base_model,
+            "base_model_provider": base_model_provider,
+            "fine_tuning_method": fine_tuning_method,
+            "evaluation_metrics": evaluation_metrics or {},
+            "training_config": training_config or {},
+            "recorded_at": datetime.now(timezone.utc).isoformat(),
+            "recorded_by": self._server_did,
+        }
+
+    def _build_log_entry(
+        self,
+        agent_id: str,
+        action_type: str,
+        input_summary: str = "",
+        output_summary: str = "",
+        decision_rationale: str = "",
+        human_override: bool = False,
+    ) -> dict:
+        """Build an unsigned, not-yet-chained Article 12 audit log entry."""
+        now = datetime.now(timezone.utc)
+        return {
+            "log_id": f"audit:{uuid.uuid4().hex[:12]}",
+            "agent_id": agent_id,
+            "action_type": action_type,
+            "input_summary": input_summary,
+            "output_summary": output_summary,
+            "decision_rationale": decision_rationale,
+            "human_override": human_override,
+            "timestamp": now.isoformat(),
+            "epoch": int(now.timestamp()),
+            "logged_by": self._server_did,
+        }
+
+    def _link_log_entry(self, log_entry: dict, prev_hash: str) -> None:
+        """Set ``prev_hash`` / ``chain_hash`` on ``log_entry`` (in place)."""
+        log_entry["prev_hash"] = prev_hash
+        log_entry["chain_hash"] = self._chain_hash(prev_hash, log_entry)
+
+    @staticmethod
+    def _append_entries(bucket: str, entries: List[dict]) -> None:
+        """Append signed ``entries`` to the ``bucket`` list and persist once.
+
+        Writes through ``config.update_provenance`` so an insert touches only the
+        new records in memory instead of deep-copying the whole (growing)
+        provenance document. Copies are stored so callers keep ownership of the
+        returned entries.
+        """
+        update_provenance(
+            lambda data: data.setdefault(bucket, []).extend(deepcopy(e) for e in entries)
+        )
+
+    def _append_chained(self, entries: List[dict], sign_batch: bool = False) -> None:
+        """Hash-chain ``entries`` onto the audit log, sign them, and persist once.
+
+        Chain heads are read from the live document inside the same write, and
+        each entry is linked per agent in list order. All fallible work (hashing,
+        signing) finishes before the log is extended.
+        """
+        def _apply(data: dict) -> None:
+            audit_log = data.setdefault("audit_log", [])
+            heads: Dict[str, str] = {}
+            for entry in entries:
+                agent_id = entry["agent_id"]
+                if agent_id not in heads:
+                    heads[agent_id] = self._get_last_chain_hash(audit_log, agent_id)
+                self._link_log_entry(entry, heads[agent_id])
+                heads[agent_id] = entry["chain_hash"]
+
+            if sign_batch:
+                for entry, signature in zip(entries, self._sign_batch(entries)):
+                    entry["signature"] = signature
+            else:
+                for entry in entries:
+                    entry["signature"] = self._sign_entry(entry)
+
+            audit_log.extend(deepcopy(e) for e in entries)
+
+        update_provenance(_apply)
+
+    def _emit_entry(self, action: str, entry: dict) -> None:
+        """Emit the structured audit event for one stored provenance entry."""
+        if "log_id" in entry:
+            target_id = entry["log_id"]
+            after = {"log_id": target_id, "agent_id": entry["agent_id"],
+                     "action_type": entry["action_type"]}
+        else:
+            target_id = entry["entry_id"]
+            after = {"entry_id": target_id, "agent_id": entry["agent_id"],
+                     "entry_type": entry["entry_type"]}
+        safe_emit(
+            self._emitter,
+            action=action,
+            target_id=target_id,
+            target_collection="provenance",
+            actor=self._server_did,
+            tenant_id=self._tenant_id,
+            after=after,
+        )
+
+    # --- Signing ---
+
+    def _sign_entry(self, entry: dict) -> str:
+        """Sign an unsigned ``entry`` over its canonical bytes.
+
+        Entries are built without a ``signature`` key, so they are serialized
+        directly (no filtered copy) and the bytes go straight to the signer.
+        """
+        return self._signer.sign_bytes(canonicalize_json(entry))
+
+    @staticmethod
+    def _batch_root_payload(root_hex: str, leaf_count: int) -> dict:
+        """The payload actually signed for a batch: the Merkle root and its size."""
+        return {"merkle_root": root_hex, "leaf_count": leaf_count}
+
+    def _sign_batch(self, signables: List[dict]) -> List[dict]:
+        """Sign ``signables`` with ONE signature over the Merkle root of their hashes.
+
+        Each leaf is the RFC 6962 leaf hash of the entry's JCS canonical bytes,
+        serialized once per entry.
+        Returns one ``signature`` object per input, carrying the shared root
+        signature plus the entry's inclusion proof so every entry stays
+        individually verifiable (see :meth:`verify_entry_signature`).
+        """
+        leaves = [hash_leaf_bytes(canonicalize_json(s)) for s in signables]
+        root, levels = build_merkle_tree(leaves)
+        root_hex = root.hex()
+        root_sig = self._signer.sign(self._batch_root_payload(root_hex, len(leaves)))
+        return [
+            {
+                "type": BATCH_SIGNATURE_TYPE,
+                "root": root_hex,
+                "sig": root_sig,
+                "leaf_count": len(leaves),
+                "index": i,
+                "path": [[side, h.hex()] for side, h in merkle_proof(levels, i)],
+            }
+            for i in range(len(leaves))
+        ]
+
+    def verify_entry_signature(self, entry: dict) -> bool:
+        """Verify the signature on a provenance or audit log entry.
+
+        Accepts both the single-entry form (base64url signature string) and the
+        Merkle batch form (:data:`BATCH_SIGNATURE_TYPE`), where the root is
+        rebuilt from the entry's leaf hash and inclusion proof before the one
+        shared Ed25519 signature is checked. The public key is taken from the
+        entry's ``recorded_by`` / ``logged_by`` DID.
+        """
+        try:
+            signature = entry.get("signature")
+            did = entry.get("recorded_by") or entry.get("logged_by") or ""
+            if did == self._server_did:
+                public_key = self._signer.public_key()
+            else:
+                public_key = did_key_to_public_key(did)
+            signable = {k: v for k, v in entry.items() if k != "signature"}
+
+            if isinstance(signature, str):
+                return verify_json_signature(public_key, signable, signature)
+
+            if isinstance(signature, dict) and signature.get("type") == BATCH_SIGNATURE_TYPE:
+                leaf = hash_leaf_bytes(canonicalize_json(signable))
+                proof = [(side, bytes.fromhex(h)) for side, h in signature["path"]]
+                if root_from_proof(leaf, proof).hex() != signature["root"]:
+                    return False
+                # Every entry of a batch repeats the same root signature, so
+                # the Ed25519 verify is memoized per (key, root, sig).
+                root_payload = self._batch_root_payload(
+                    signature["root"], signature["leaf_count"]
+                )
+                return verify_canonical(
+                    public_key, canonicalize_json(root_payload), signature["sig"]
+                )
+            return False
+        except Exception:
+            return False
+
     def record_training_data(
         self,
         agent_id: str,
@@ -91,41 +354,21 @@ class ProvenanceService:
             if not source_url and source:
                 source_url = source
 
-            entry_id = f"prov:{uuid.uuid4().hex[:12]}"
-            now = datetime.now(timezone.utc).isoformat()
+            entry = self._build_training_data_entry(
+                agent_id=agent_id,
+                dataset_name=dataset_name,
+                source_url=source_url,
+                license=license,
+                data_categories=data_categories,
+                contains_personal_data=contains_personal_data,
+                data_governance_measures=data_governance_measures,
+                dataset_version=dataset_version,
+            )
 
-            entry = {
-                "entry_id": entry_id,
-                "entry_type": "training_data",
-                "agent_id": agent_id,
-                "dataset_name": dataset_name,
-                "dataset_version": dataset_version,
-                "source_url": source_url,
-                "license": license,
-                "data_categories": data_categories or [],
-                "contains_personal_data": contains_personal_data,
-                "data_governance_measures": data_governance_measures,
-                "recorded_at": now,
-                "recorded_by": self._server_did,
-            }
+            entry["signature"] = self._sign_entry(entry)
 
-            signable = {k: v for k, v in entry.items() if k != "signature"}
-            entry["signature"] = self._signer.sign(signable)
-
-            data = load_provenance()
-            data["entries"].append(entry)
-            save_provenance(data)
-
-            safe_emit(
-                self._emitter,
-                action="provenance.record_training_data",
-                target_id=entry_id,
-                target_collection="provenance",
-                actor=self._server_did,
-                tenant_id=self._tenant_id,
-                after={"entry_id": entry_id, "agent_id": agent_id,
-                       "entry_type": "training_data"},
-            )
+            self._append_entries("entries", [entry])
+            self._emit_entry("provenance.record_training_data", entry)
 
             return entry
         except Exception as e:
@@ -155,39 +398,19 @@ class ProvenanceService:
                 an accepted first-class param rather than a TypeError.
         """
         try:
-            entry_id = f"prov:{uuid.uuid4().hex[:12]}"
-            now = datetime.now(timezone.utc).isoformat()
+            entry = self._build_model_lineage_entry(
+                agent_id=agent_id,
+                base_model=base_model,
+                base_model_provider=base_model_provider,
+                fine_tuning_method=fine_tuning_method,
+                evaluation_metrics=evaluation_metrics,
+                training_config=training_config,
+            )
 
-            entry = {
-                "entry_id": entry_id,
-                "entry_type": "model_lineage",
-                "agent_id": agent_id,
-                "base_model": base_model,
-                "base_model_provider": base_model_provider,
-                "fine_tuning_method": fine_tuning_method,
-                "evaluation_metrics": evaluation_metrics or {},
-                "training_config": training_config or {},
-                "recorded_at": now,
-                "recorded_by": self._server_did,
-            }
+            entry["signature"] = self._sign_entry(entry)
 
-            signable = {k: v for k, v in entry.items() if k != "signature"}
-            entry["signature"] = self._signer.sign(signable)
-
-            data = load_provenance()
-            data["entries"].append(entry)
-            save_provenance(data)
-
-            safe_emit(
-                self._emitter,
-                action="provenance.record_model_lineage",
-                target_id=entry_id,
-                target_collection="provenance",
-                actor=self._server_did,
-                tenant_id=self._tenant_id,
-                after={"entry_id": entry_id, "agent_id": agent_id,
-                       "entry_type": "model_lineage"},
-            )
+            self._append_entries("entries", [entry])
+            self._emit_entry("provenance.record_model_lineage", entry)
 
             return entry
         except Exception as e:
@@ -211,46 +434,21 @@ class ProvenanceService:
             if action_type not in VALID_ACTION_TYPES:
                 return {
                     "error": f"Invalid action_type '{action_type}'. "
-                    f"Must be one of: {', '.join(sorted(VALID_ACTION_TYPES))}"
+                    f"Must be one of: {_VALID_ACTION_TYPES_STR}"
                 }
 
-            log_id = f"audit:{uuid.uuid4().hex[:12]}"
-            now = datetime.now(timezone.utc).isoformat()
-
-            log_entry = {
-                "log_id": log_id,
-                "agent_id": agent_id,
-                "action_type": action_type,
-                "input_summary": input_summary,
-                "output_summary": output_summary,
-                "decision_rationale": decision_rationale,
-                "human_override": human_override,
-                "timestamp": now,
-                "logged_by": self._server_did,
-            }
+            log_entry = self._build_log_entry(
+                agent_id=agent_id,
+                action_type=action_type,
+                input_summary=input_summary,
+                output_summary=output_summary,
+                decision_rationale=decision_rationale,
+                human_override=human_override,
+            )
 
             # Hash-chain: link this entry to the previous one for tamper evidence
-            data = load_provenance()
-            prev_hash = self._get_last_chain_hash(data["audit_log"], agent_id)
-            log_entry["prev_hash"] = prev_hash
-            log_entry["chain_hash"] = self._chain_hash(prev_hash, log_entry)
-
-            signable = {k: v for k, v in log_entry.items() if k != "signature"}
-            log_entry["signature"] = self._signer.sign(signable)
-
-            data["audit_log"].append(log_entry)
-            save_provenance(data)
-
-            safe_emit(
-                self._emitter,
-                action="provenance.log_action",
-                target_id=log_id,
-                target_collection="provenance",
-                actor=self._server_did,
-                tenant_id=self._tenant_id,
-                after={"log_id": log_id, "agent_id": agent_id,
-                       "action_type": action_type},
-            )
+            self._append_chained([log_entry])
+            self._emit_entry("provenance.log_action", log_entry)
 
             return log_entry
         except Exception as e:
@@ -260,6 +458,75 @@ class ProvenanceService:
             )
             return {"error": msg}
 
+    def record_training_data_batch(self, records: List[dict]) -> List[dict]:
+        """Record many training data sources with one signature and one write.
+
+        Each item takes the same keyword arguments as
+        :meth:`record_training_data` (``source`` alias included). All entries
+        are signed together via :meth:`_sign_batch`, so bulk ingest pays one
+        Ed25519 signature and one provenance load/save round-trip per call
+        instead of one per dataset.
+        """
+        try:
+            entries = []
+            for rec in records:
+                rec = dict(rec)
+                source = rec.pop("source", "")
+                if not rec.get("source_url") and source:
+                    rec["source_url"] = source
+                entries.append(self._build_training_data_entry(**rec))
+            if not entries:
+                return []
+
+            for entry, signature in zip(entries, self._sign_batch(entries)):
+                entry["signature"] = signature
+
+            self._append_entries("entries", entries)
+            for entry in entries:
+                self._emit_entry("provenance.record_training_data", entry)
+
+            return entries
+        except Exception as e:
+            msg = log_and_format_error(
+                "record_training_data_batch", e, ErrorCategory.PROVENANCE,
+                count=len(records),
+            )
+            return [{"error": msg}]
+
+    def log_actions_batch(self, actions: List[dict]) -> List[dict]:
+        """Log many agent actions with one signature and one write.
+
+        Each item takes the same keyword arguments as :meth:`log_action`.
+        Every action type is validated before anything is written, so a bad
+        item rejects the whole batch. Entries are hash-chained per agent in
+        list order, exactly as the equivalent sequence of :meth:`log_action`
+        calls would chain them, then signed together via :meth:`_sign_batch`.
+        """
+        try:
+            for i, action in enumerate(actions):
+                action_type = action.get("action_type")
+                if action_type not in VALID_ACTION_TYPES:
+                    return [{
+                        "error": f"Invalid action_type '{action_type}' at index {i}. "
+                        f"Must be one of: {_VALID_ACTION_TYPES_STR}"
+                    }]
+
+            entries = [self._build_log_entry(**action) for action in actions]
+            if not entries:
+                return []
+
+            self._append_chained(entries, sign_batch=True)
+            for entry in entries:
+                self._emit_entry("provenance.log_action", entry)
+
+            return entries
+        except Exception as e:
+            msg = log_and_format_error(
+                "log_actions_batch", e, ErrorCategory.PROVENANCE,
+                count=len(actions),
+            )
+            return [{"error": msg}]
+
     def get_provenance(self, agent_id: str) -> dict:
         """Get full provenance record for an agent (training data + model lineage + audit summary).
 
@@ -285,19 +552,17 @@ class ProvenanceService:
         the legacy chain.
         """
         try:
-            data = load_provenance()
+            def _read(data: dict) -> tuple:
+                entries = _ENTRIES_INDEX.sync(data.get("entries", [])).get(agent_id)
+                audit = _AUDIT_INDEX.sync(data.get("audit_log", [])).get(agent_id)
+                return deepcopy(entries), deepcopy(audit)
 
+            agent_entries, audit_entries = read_provenance(_read)
             training_data = [
-                e for e in data["entries"]
-                if e["agent_id"] == agent_id and e["entry_type"] == "training_data"
+                e for e in agent_entries if e["entry_type"] == "training_data"
             ]
             model_lineage = [
-                e for e in data["entries"]
-                if e["agent_id"] == agent_id and e["entry_type"] == "model_lineage"
-            ]
-            audit_entries = [
-                e for e in data["audit_log"]
-                if e["agent_id"] == agent_id
+                e for e in agent_entries if e["entry_type"] == "model_lineage"
             ]
 
             # v0.4.0-rc.3 (P0 #5): also count rows in the new audit collection
@@ -337,12 +602,10 @@ class ProvenanceService:
                     subj = (cred.get("credentialSubject") or {}).get("id")
                     if subj == agent_id:
                         related_target_ids.add(cred.get("id", ""))
-                for entry in data.get("entries", []):
-                    if entry.get("agent_id") == agent_id:
-                        related_target_ids.add(entry.get("entry_id", ""))
-                for ent in data.get("audit_log", []):
-                    if ent.get("agent_id") == agent_id:
-                        related_target_ids.add(ent.get("log_id", ""))
+                for entry in agent_entries:
+                    related_target_ids.add(entry.get("entry_id", ""))
+                for ent in audit_entries:
+                    related_target_ids.add(ent.get("log_id", ""))
                 related_target_ids.discard("")
 
                 if AUDIT_FILE.exists():
@@ -372,34 +635,71 @@ class ProvenanceService:
             )
             return {"error": msg}
 
+    @staticmethod
+    def _timestamp_bound(
+        value: Union[str, int, float, None], upper: bool = False
+    ) -> Optional[str]:
+        """Normalize a date filter to the stored UTC ``isoformat()`` form.
+
+        Accepts epoch seconds or any ISO-8601 string (``Z``, other offsets,
+        naive = UTC, date-only), so bounds compare correctly against stored
+        timestamps instead of relying on the caller matching their exact
+        string format. Unparseable strings are compared verbatim, as before.
+        An integer ``upper`` bound covers its whole second, matching the
+        entry's truncated ``epoch`` field.
+        """
+        if value is None or value == "":
+            return None
+        if isinstance(value, (int, float)):
+            bound = datetime.fromtimestamp(value, tz=timezone.utc)
+            if upper and isinstance(value, int):
+                bound = bound.replace(microsecond=999999)
+            return bound.isoformat()
+        try:
+            parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return value
+        if parsed.tzinfo is None:
+            parsed = parsed.replace(tzinfo=timezone.utc)
+        return parsed.astimezone(timezone.utc).isoformat()
+
     def get_audit_trail(
         self,
         agent_id: str,
         action_type: Optional[str] = None,
-        start_date: Optional[str] = None,
-        end_date: Optional[str] = None,
+        start_date: Union[str, int, None] = None,
+        end_date: Union[str, int, None] = None,
         limit: int = 50,
     ) -> List[dict]:
-        """Query audit trail with filters."""
+        """Query audit trail with filters.
+
+        Returns the ``limit`` most recent matching entries, oldest first.
+        ``start_date`` / ``end_date`` are inclusive and may be ISO-8601 strings
+        or epoch seconds.
+        """
         try:
-            data = load_provenance()
-            results = []
-
-            for entry in data["audit_log"]:
-                if entry["agent_id"] != agent_id:
-                    continue
-                if action_type and entry.get("action_type") != action_type:
-                    continue
-                if start_date:
-                    if entry["timestamp"] < start_date:
-                        continue
-                if end_date:
-                    if entry["timestamp"] > end_date:
+            start = self._timestamp_bound(start_date)
+            end = self._timestamp_bound(end_date, upper=True)
+
+            def _read(data: dict) -> List[dict]:
+                # Date bounds are bisected on the per-agent timestamp keys, so
+                # only the rows inside the window are visited.
+                index = _AUDIT_INDEX.sync(data["audit_log"])
+                # Walk newest-first so the default limit stops after ``limit``
+                # recent matches instead of crossing the agent's whole history.
+                # Matches are copied here, while the repository lock is held.
+                selected = []
+                for entry in reversed(index.range(agent_id, start, end)):
+                    if action_type and entry.get("action_type") != action_type:
                         continue
-                results.append(entry)
-                if len(results) >= limit:
-                    break
-
+                    selected.append(deepcopy(entry))
+                    if len(selected) >= limit:
+                        break
+                return selected
+
+            # Flip back to chronological order for the caller.
+            results = read_provenance(_read)
+            results.reverse()
             return results
         except Exception as e:
             msg = log_and_format_error(
@@ -407,3 +707,136 @@ class ProvenanceService:
                 agent_id=agent_id,
             )
             return [{"error": msg}]
+
+    def count_audit_trail(
+        self,
+        agent_id: str,
+        action_type: Optional[str] = None,
+        start_date: Union[str, int, None] = None,
+        end_date: Union[str, int, None] = None,
+    ) -> Union[int, dict]:
+        """Number of audit entries matching the :meth:`get_audit_trail` filters.
+
+        Counts over the whole matching window (no ``limit``) without copying
+        any entry.
+        """
+        try:
+            start = self._timestamp_bound(start_date)
+            end = self._timestamp_bound(end_date, upper=True)
+
+            def _read(data: dict) -> int:
+                rows = _AUDIT_INDEX.sync(data["audit_log"]).range(agent_id, start, end)
+                if not action_type:
+                    return len(rows)
+                return sum(1 for entry in rows if entry.get("action_type") == action_type)
+
+            return read_provenance(_read)
+        except Exception as e:
+            msg = log_and_format_error(
+                "count_audit_trail", e, ErrorCategory.PROVENANCE,
+                agent_id=agent_id,
+            )
+            return {"error": msg}
+
+    # --- Subset export ---
+
+    @staticmethod
+    def _entry_leaf(entry: dict) -> bytes:
+        """RFC 6962 leaf hash of an entry's canonical form (signature excluded)."""
+        signable = {k: v for k, v in entry.items() if k != "signature"}
+        return hash_leaf_bytes(canonicalize_json(signable))
+
+    @staticmethod
+    def _shared_batch_signature(entries: List[dict], root_hex: str) -> Optional[str]:
+        """Return the ingest-time root signature if ``entries`` ARE one whole batch.
+
+        True when every entry carries the same Merkle batch signature over
+        ``root_hex`` and together they are exactly that batch, in order.
+        """
+        for i, entry in enumerate(entries):
+            signature = entry.get("signature")
+            if not (
+                isinstance(signature, dict)
+                and signature.get("type") == BATCH_SIGNATURE_TYPE
+                and signature.get("root") == root_hex
+                and signature.get("leaf_count") == len(entries)
+                and signature.get("index") == i
+            ):
+                return None
+        return entries[0]["signature"]["sig"]
+
+    def export_subset(
+        self,
+        agent_id: str,
+        predicate: Optional[Callable[[dict], bool]] = None,
+    ) -> dict:
+        """Export a signed Merkle commitment over a subset of an agent's audit log.
+
+        Selects the agent's audit entries for which ``predicate`` returns true
+        (all of them when ``None``), in chronological order, and commits to them
+        with one Merkle root over their leaf hashes. The hashes come from the
+        entries themselves, so an export never re-serializes more than it selects.
+        When the selection is exactly one ingest batch (see
+        :meth:`log_actions_batch`), its existing root signature is reused;
+        otherwise the new root is signed once. Verify with :meth:`verify_export`.
+        """
+        try:
+            def _read(data: dict) -> List[dict]:
+                # Select and copy while the repository lock is held.
+                return [
+                    deepcopy(e) for e in _AUDIT_INDEX.sync(data["audit_log"]).get(agent_id)
+                    if predicate is None or predicate(e)
+                ]
+
+            selected = read_provenance(_read)
+            if not selected:
+                return {"error": f"No audit entries selected for agent {agent_id}"}
+
+            leaves = [self._entry_leaf(e) for e in selected]
+            root, _ = build_merkle_tree(leaves)
+            root_hex = root.hex()
+            sig = self._shared_batch_signature(selected, root_hex)
+            reused = sig is not None
+            if not reused:
+                sig = self._signer.sign(self._batch_root_payload(root_hex, len(leaves)))
+
+            return {
+                "agent_id": agent_id,
+                "root": root_hex,
+                "leaf_count": len(leaves),
+                "sig": sig,
+                "signed_by": self._server_did,
+                "reused_batch_signature": reused,
+                "log_ids": [e["log_id"] for e in selected],
+                "leaves": [leaf.hex() for leaf in leaves],
+            }
+        except Exception as e:
+            msg = log_and_format_error(
+                "export_subset", e, ErrorCategory.PROVENANCE,
+                agent_id=agent_id,
+            )
+            return {"error": msg}
+
+    def verify_export(self, export: dict) -> bool:
+        """Check an :meth:`export_subset` result: leaves -> root -> signature.
+
+        The root signature check goes through the shared verification cache, so
+        several exports over the same root (or an export reusing an ingest batch
+        signature already verified) cost one Ed25519 verify in total.
+        """
+        try:
+            leaves = [bytes.fromhex(h) for h in export["leaves"]]
+            if len(leaves) != export["leaf_count"]:
+                return False
+            root, _ = build_merkle_tree(leaves)
+            if root.hex() != export["root"]:
+                return False
+            did = export["signed_by"]
+            if did == self._server_did:
+                public_key = self._signer.public_key()
+            else:
+                public_key = did_key_to_public_key(did)
+            payload = self._batch_root_payload(export["root"], export["leaf_count"])
+            return verify_canonical(public_key, canonicalize_json(payload), export["sig"])
+        except Exception:
+            return False
@@ -4,14 +4,17 @@ Records agent interactions and computes recency-weighted trust scores
 with exponential decay (30-day half-life).
 """
 
+import heapq
 import math
-import time
+from array import array
 from datetime import datetime, timezone
+from operator import itemgetter
 from typing import List, Optional
 
 from attestix.audit import AuditEventEmitter, resolve_emitter, safe_emit
-from attestix.config import load_reputation, save_reputation
+from attestix.config import read_reputation, update_reputation
 from attestix.errors import ErrorCategory, log_and_format_error
+from attestix.storage.agent_index import AgentIndex
 from attestix.storage.repository import DEFAULT_TENANT
 
 # Scoring constants
@@ -25,6 +28,51 @@ OUTCOME_WEIGHTS = {
     "timeout": 0.2,
 }
 
+# Outcomes interned to small ints at ingest (stored as ``outcome_code`` next to
+# the string) so scoring indexes a fixed table instead of hashing the string.
+OUTCOME_CODE = {"success": 0, "partial": 1, "failure": 2, "timeout": 3}
+OUTCOME_LUT = tuple(OUTCOME_WEIGHTS[o] for o in sorted(OUTCOME_CODE, key=OUTCOME_CODE.get))
+_VALID_OUTCOMES_STR = str(list(OUTCOME_WEIGHTS))
+
+
+def _outcome_value(interaction: dict) -> float:
+    """Outcome weight via the interned code; string lookup for legacy rows."""
+    code = interaction.get("outcome_code")
+    if code is not None:
+        return OUTCOME_LUT[code]
+    return OUTCOME_WEIGHTS.get(interaction.get("outcome", "failure"), 0.0)
+
+
+class _InteractionIndex(AgentIndex):
+    """Per-agent interaction index that also keeps packed scoring columns.
+
+    Scoring reads only each interaction's epoch and outcome weight, so those are
+    mirrored into per-agent ``array('d')`` columns as rows are indexed (struct
+    of arrays). A cold recompute walks two contiguous buffers instead of
+    hashing into every interaction dict.
+    """
+
+    def _reset(self) -> None:
+        super()._reset()
+        self._epochs: dict = {}
+        self._values: dict = {}
+
+    def _add(self, agent_id: str, rec: dict) -> None:
+        super()._add(agent_id, rec)
+        if agent_id not in self._epochs:
+            self._epochs[agent_id] = array("d")
+            self._values[agent_id] = array("d")
+        self._epochs[agent_id].append(rec.get("epoch", 0))
+        self._values[agent_id].append(_outcome_value(rec))
+
+    def columns(self, agent_id: str) -> tuple:
+        """Return ``(epochs, outcome_values)`` for ``agent_id`` (live arrays)."""
+        return self._epochs.get(agent_id, array("d")), self._values.get(agent_id, array("d"))
+
+
+# Per-agent index over the append-only ``interactions`` list.
+_INTERACTIONS_INDEX = _InteractionIndex()
+
 
 class ReputationService:
     """Manages agent reputation through interaction tracking."""
@@ -61,50 +109,23 @@ class ReputationService:
             details: Optional free-text details.
         """
         try:
-            if outcome not in OUTCOME_WEIGHTS:
-                return {"error": f"Invalid outcome '{outcome}'. Use: {list(OUTCOME_WEIGHTS.keys())}"}
+            outcome_code = OUTCOME_CODE.get(outcome, -1)
+            if outcome_code < 0:
+                return {"error": f"Invalid outcome '{outcome}'. Use: {_VALID_OUTCOMES_STR}"}
 
             now = datetime.now(timezone.utc)
-            interaction = {
-                "agent_id": agent_id,
-                "counterparty_id": counterparty_id,
-                "outcome": outcome,
-                "category": category,
-                "details": details,
-                "timestamp": now.isoformat(),
-                "epoch": int(now.timestamp()),
-            }
-
-            data = load_reputation()
-            data["interactions"].append(interaction)
-
-            # Recompute score for this agent
-            score = self._compute_score(data["interactions"], agent_id)
-            data["scores"][agent_id] = {
-                "trust_score": round(score, 4),
-                "last_updated": now.isoformat(),
-                "total_interactions": sum(
-                    1 for i in data["interactions"] if i["agent_id"] == agent_id
-                ),
-            }
-
-            save_reputation(data)
-
-            safe_emit(
-                self._emitter,
-                action="reputation.record",
-                target_id=agent_id,
-                target_collection="reputation",
-                actor=self.AUDIT_ACTOR,
-                tenant_id=self._tenant_id,
-                after={"agent_id": agent_id, "outcome": outcome,
-                       "category": category},
+            interaction = self._build_interaction(
+                now, agent_id, counterparty_id, outcome, outcome_code, category, details,
+            )
+            updated_score = update_reputation(
+                lambda data: self._fold_interaction(data, interaction, now)
             )
+            self._emit_interaction(interaction)
 
             return {
                 "recorded": True,
                 "interaction": interaction,
-                "updated_score": data["scores"][agent_id],
+                "updated_score": updated_score,
             }
         except Exception as e:
             return {
@@ -114,15 +135,130 @@ class ReputationService:
                 )
             }
 
+    def record_interactions_batch(self, interactions: List[dict]) -> List[dict]:
+        """Record many interactions with one write.
+
+        Each item takes the same keyword arguments as :meth:`record_interaction`.
+        Every outcome is validated before anything is written, so a bad item
+        rejects the whole batch. Interactions are folded into the score cache
+        in list order, exactly as the equivalent sequence of
+        :meth:`record_interaction` calls would fold them.
+        """
+        try:
+            built = []
+            now = datetime.now(timezone.utc)
+            for i, item in enumerate(interactions):
+                outcome = item.get("outcome")
+                outcome_code = OUTCOME_CODE.get(outcome, -1)
+                if outcome_code < 0:
+                    return [{
+                        "error": f"Invalid outcome '{outcome}' at index {i}. "
+                        f"Use: {_VALID_OUTCOMES_STR}"
+                    }]
+                built.append(self._build_interaction(
+                    now,
+                    item["agent_id"],
+                    item["counterparty_id"],
+                    outcome,
+                    outcome_code,
+                    item.get("category", "general"),
+                    item.get("details", ""),
+                ))
+            if not built:
+                return []
+
+            def _apply(data: dict) -> list:
+                return [self._fold_interaction(data, i, now) for i in built]
+
+            updated_scores = update_reputation(_apply)
+            for interaction in built:
+                self._emit_interaction(interaction)
+
+            return [
+                {"recorded": True, "interaction": i, "updated_score": u}
+                for i, u in zip(built, updated_scores)
+            ]
+        except Exception as e:
+            msg = log_and_format_error(
+                "record_interactions_batch", e, ErrorCategory.REPUTATION,
+                count=len(interactions),
+            )
+            return [{"error": msg}]
+
+    @staticmethod
+    def _build_interaction(
+        now: datetime,
+        agent_id: str,
+        counterparty_id: str,
+        outcome: str,
+        outcome_code: int,
+        category: str,
+        details: str,
+    ) -> dict:
+        return {
+            "agent_id": agent_id,
+            "counterparty_id": counterparty_id,
+            "outcome": outcome,
+            "outcome_code": outcome_code,
+            "category": category,
+            "details": details,
+            "timestamp": now.isoformat(),
+            "epoch": int(now.timestamp()),
+        }
+
+    def _fold_interaction(self, data: dict, interaction: dict, now: datetime) -> dict:
+        """Append ``interaction`` to the live document and update its agent's score."""
+        agent_id = interaction["agent_id"]
+        # Written through the live document (no O(N) deep copy per insert).
+        interactions = data.setdefault("interactions", [])
+        interactions.append(dict(interaction))
+
+        # Fold the new interaction into the cached decay state (O(1));
+        # rebuild it from the agent's history if missing or out of step.
+        index = _INTERACTIONS_INDEX.sync(interactions)
+        agent_interactions = index.get(agent_id)
+        scores = data.setdefault("scores", {})
+        state = self._cached_state(
+            scores.get(agent_id), len(agent_interactions) - 1
+        )
+        if state is None:
+            state = self._column_state(*index.columns(agent_id))
+        else:
+            state = self._advance_state(
+                state, OUTCOME_LUT[interaction["outcome_code"]], interaction["epoch"]
+            )
+        updated = {
+            "trust_score": round(self._state_score(state), 4),
+            "last_updated": now.isoformat(),
+            "total_interactions": len(agent_interactions),
+        }
+        scores[agent_id] = {**updated, **state}
+        return updated
+
+    def _emit_interaction(self, interaction: dict) -> None:
+        safe_emit(
+            self._emitter,
+            action="reputation.record",
+            target_id=interaction["agent_id"],
+            target_collection="reputation",
+            actor=self.AUDIT_ACTOR,
+            tenant_id=self._tenant_id,
+            after={"agent_id": interaction["agent_id"],
+                   "outcome": interaction["outcome"],
+                   "category": interaction["category"]},
+        )
+
     def get_reputation(self, agent_id: str) -> dict:
         """Get the current trust score for an agent."""
         try:
-            data = load_reputation()
+            def _read(data: dict) -> tuple:
+                index = _INTERACTIONS_INDEX.sync(data["interactions"])
+                agent_interactions = [dict(i) for i in index.get(agent_id)]
+                return agent_interactions, self._agent_score(
+                    index, data.get("scores", {}), agent_id
+                )
 
-            # Get cached score or compute fresh
-            agent_interactions = [
-                i for i in data["interactions"] if i["agent_id"] == agent_id
-            ]
+            agent_interactions, score = read_reputation(_read)
 
             if not agent_interactions:
                 return {
@@ -132,8 +268,6 @@ class ReputationService:
                     "message": "No interactions recorded for this agent.",
                 }
 
-            score = self._compute_score(data["interactions"], agent_id)
-
             # Category breakdown
             categories = {}
             for i in agent_interactions:
@@ -168,44 +302,42 @@ class ReputationService:
     ) -> List[dict]:
         """Search agents by reputation criteria."""
         try:
-            data = load_reputation()
-
-            # Get all unique agent IDs
-            agent_ids = set(i["agent_id"] for i in data["interactions"])
+            def _read(data: dict) -> dict:
+                # Only (count, score) pairs leave the callback, so no live
+                # record escapes the repository lock.
+                index = _INTERACTIONS_INDEX.sync(data["interactions"])
+                scores = data.get("scores", {})
+                by_agent = {}
+                for aid in index.agents():
+                    rows = index.get(aid)
+                    if not category:
+                        by_agent[aid] = (len(rows), self._agent_score(index, scores, aid))
+                        continue
+                    # Filtered queries rescore the matching rows only.
+                    rows = [i for i in rows if i.get("category") == category]
+                    if len(rows) >= min_interactions:
+                        by_agent[aid] = (len(rows), self._compute_score(rows))
+                    else:
+                        by_agent[aid] = (len(rows), None)
+                return by_agent
+
+            by_agent = read_reputation(_read)
 
             results = []
-            for aid in agent_ids:
-                agent_interactions = [
-                    i for i in data["interactions"] if i["agent_id"] == aid
-                ]
-
-                # Filter by category
-                if category:
-                    agent_interactions = [
-                        i for i in agent_interactions if i.get("category") == category
-                    ]
-
-                if len(agent_interactions) < min_interactions:
+            for aid, (count, score) in by_agent.items():
+                if count < min_interactions:
                     continue
 
-                score = self._compute_score(
-                    agent_interactions if category else data["interactions"],
-                    aid,
-                )
-
                 if min_score <= score <= max_score:
                     results.append({
                         "agent_id": aid,
                         "trust_score": round(score, 4),
-                        "interaction_count": len(agent_interactions),
+                        "interaction_count": count,
                     })
 
-                if len(results) >= limit:
-                    break
-
-            # Sort by score descending
-            results.sort(key=lambda x: x["trust_score"], reverse=True)
-            return results
+            # Top-K by score: every candidate is considered before truncating,
+            # in O(A log K) rather than a full sort.
+            return heapq.nlargest(limit, results, key=itemgetter("trust_score"))
         except Exception as e:
             return [{
                 "error": log_and_format_error(
@@ -213,36 +345,88 @@ class ReputationService:
                 )
             }]
 
-    def _compute_score(self, all_interactions: list, agent_id: str) -> float:
+    # --- Incremental score cache ---
+    #
+    # Every weight decays by the same exp(-lambda * dt) as time passes, so the
+    # score ws / wt does not change between interactions. ``scores[agent_id]``
+    # therefore caches the decayed sums referenced to the newest epoch
+    # (``ws``, ``wt``, ``t0_epoch``) and each insert folds in one term.
+
+    @staticmethod
+    def _cached_state(cached: Optional[dict], count: int) -> Optional[dict]:
+        """Return ``cached`` if it is a decay state covering ``count`` interactions."""
+        if not cached or "ws" not in cached or "wt" not in cached:
+            return None
+        if cached.get("total_interactions") != count:
+            return None
+        return cached
+
+    def _agent_score(self, index: "_InteractionIndex", scores: dict, agent_id: str) -> float:
+        """Score ``agent_id``'s full history: cached state, else its columns."""
+        state = self._cached_state(scores.get(agent_id), len(index.get(agent_id)))
+        if state is None:
+            state = self._column_state(*index.columns(agent_id))
+        return self._state_score(state)
+
+    def _score_state(self, agent_interactions: list) -> dict:
+        """Rebuild the decay state from a list of interaction rows."""
+        return self._column_state(
+            [i.get("epoch", 0) for i in agent_interactions],
+            [_outcome_value(i) for i in agent_interactions],
+        )
+
+    @staticmethod
+    def _column_state(epochs, values) -> dict:
+        """Decay state from parallel epoch / outcome-weight columns."""
+        if not epochs:
+            return {"ws": 0.0, "wt": 0.0, "t0_epoch": 0}
+        t0 = max(epochs)
+        # One tight pass per column with locals bound: the loop body is the
+        # cold-path hot spot for agents with long histories.
+        exp = math.exp
+        neg_lambda = -DECAY_LAMBDA
+        decays = [exp(neg_lambda * (t0 - e)) for e in epochs]
+        ws = sum(d * v for d, v in zip(decays, values))
+        return {"ws": ws, "wt": sum(decays), "t0_epoch": int(t0)}
+
+    @staticmethod
+    def _advance_state(state: dict, outcome_val: float, epoch: int) -> dict:
+        """Fold one interaction into ``state`` (closed-form decay update)."""
+        t0 = state["t0_epoch"]
+        if epoch >= t0:
+            decay = math.exp(-DECAY_LAMBDA * (epoch - t0))
+            return {
+                "ws": state["ws"] * decay + outcome_val,
+                "wt": state["wt"] * decay + 1.0,
+                "t0_epoch": epoch,
+            }
+        # Clock went backwards: weight the late-arriving term instead.
+        decay = math.exp(-DECAY_LAMBDA * (t0 - epoch))
+        return {
+            "ws": state["ws"] + outcome_val * decay,
+            "wt": state["wt"] + decay,
+            "t0_epoch": t0,
+        }
+
+    @staticmethod
+    def _state_score(state: dict) -> float:
+        return state["ws"] / state["wt"] if state["wt"] else 0.0
+
+    def _compute_score(self, agent_interactions: list) -> float:
         """Compute recency-weighted trust score (0.0 - 1.0).
 
         Uses exponential decay with 30-day half-life:
         weight = exp(-lambda * age_seconds)
         score = sum(outcome_weight * decay_weight) / sum(decay_weight)
-        """
-        now = time.time()
-        agent_interactions = [
-            i for i in all_interactions if i["agent_id"] == agent_id
-        ]
 
+        ``agent_interactions`` holds one agent's interactions (from the per-agent
+        index). Cold path: used when the cached decay state is missing or out
+        of step with the history, and for category-filtered queries.
+        """
         if not agent_interactions:
             return 0.0
-
-        weighted_sum = 0.0
-        weight_total = 0.0
-
-        for interaction in agent_interactions:
-            epoch = interaction.get("epoch", 0)
-            age = max(now - epoch, 0)
-            decay = math.exp(-DECAY_LAMBDA * age)
-
-            outcome = interaction.get("outcome", "failure")
-            outcome_val = OUTCOME_WEIGHTS.get(outcome, 0.0)
-
-            weighted_sum += outcome_val * decay
-            weight_total += decay
-
-        if weight_total == 0:
-            return 0.0
-
-        return weighted_sum / weight_total
+        # exp(-lambda * (now - e)) = exp(-lambda * (now - t0)) * exp(-lambda * (t0 - e)):
+        # the common factor cancels in the ratio, so weights are taken relative
+        # to the newest interaction (no time.time(), no underflow to 0/0 for
+        # long-idle agents) and share one code path with the cached state.
+        return self._state_score(self._score_state(agent_interactions))
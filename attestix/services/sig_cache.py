@@ -0,0 +1,52 @@
+"""Memoized Ed25519 verification for signatures shared by many entries.
+
+A Merkle-batched provenance write (``MerkleBatchSignature``) carries ONE root
+signature that every entry in the batch repeats. Replaying an audit trail
+therefore re-verifies the same ``(public key, root payload, signature)`` triple
+once per entry. Ed25519 verification is deterministic, so the verdict for an
+exact triple is memoized here: the first entry of a batch pays the verify, the
+rest pay a dictionary lookup. Credential and presentation proofs go through
+the same cache: an external verifier re-checking a credential it has already
+seen (inside a presentation, or in a verification loop) hits it too.
+
+The cache key is the full triple (raw public-key bytes, the canonical payload
+bytes and the signature string), so a different key, payload or signature can
+never be answered from another entry's result. Only the shared root is cached;
+each entry's own leaf hash and inclusion proof are still recomputed on every
+call.
+"""
+
+import base64
+from functools import lru_cache
+
+from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PublicKey
+
+from attestix.auth.crypto import (
+    public_key_from_bytes,
+    public_key_to_bytes,
+    verify_signature,
+)
+
+#: Distinct signatures remembered (one per batch root or credential proof seen).
+SIG_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=SIG_CACHE_SIZE)
+def _verify(public_key_raw: bytes, canonical: bytes, signature_b64: str) -> bool:
+    try:
+        sig_bytes = base64.urlsafe_b64decode(signature_b64)
+    except (ValueError, TypeError):
+        return False
+    return verify_signature(public_key_from_bytes(public_key_raw), sig_bytes, canonical)
+
+
+def verify_canonical(
+    public_key: Ed25519PublicKey, canonical: bytes, signature_b64: str
+) -> bool:
+    """Verify a base64url signature over canonical payload bytes, memoized."""
+    return _verify(public_key_to_bytes(public_key), canonical, signature_b64)
+
+
+def clear_sig_cache() -> None:
+    """Drop all memoized verdicts (e.g. between tests or after key rotation)."""
+    _verify.cache_clear()
@@ -20,6 +20,7 @@ from cryptography.hazmat.primitives.asymmetric.ed25519 import (
 
 from attestix.auth.crypto import (
     load_or_create_signing_key,
+    sign_bytes,
     sign_json_payload,
 )
 from attestix.signing.signer import Signer
@@ -62,6 +63,9 @@ class InProcessSigner(Signer):
         # Delegates to the exact v0.3.0 signing routine, so output is byte-identical.
         return sign_json_payload(self._private_key, payload)
 
+    def sign_bytes(self, canonical: bytes) -> str:
+        return sign_bytes(self._private_key, canonical)
+
     def public_key(self) -> Ed25519PublicKey:
         return self._private_key.public_key()
 
@@ -12,6 +12,7 @@ contract test suite (``tests/contract/test_signer_contract.py``), enforcing Lisk
 substitution at the boundary.
 """
 
+import json
 from abc import ABC, abstractmethod
 
 from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PublicKey
@@ -45,6 +46,17 @@ class Signer(ABC):
         """
         raise NotImplementedError
 
+    def sign_bytes(self, canonical: bytes) -> str:
+        """Sign payload bytes already in ``auth.crypto.canonicalize_json`` form.
+
+        Produces the same signature as ``sign(payload)`` for the payload those
+        bytes encode. The default re-parses and delegates to :meth:`sign`
+        (re-canonicalizing canonical JSON is the identity), so existing
+        implementations stay correct; backends that sign raw bytes override it
+        to skip the round-trip.
+        """
+        return self.sign(json.loads(canonical))
+
     @abstractmethod
     def public_key(self) -> Ed25519PublicKey:
         """Return the Ed25519 public key for verifying this signer's signatures."""
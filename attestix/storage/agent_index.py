@@ -0,0 +1,120 @@
+"""Per-agent secondary index over an append-only record list.
+
+The provenance ``entries`` / ``audit_log`` and reputation ``interactions`` lists
+are only ever appended to in place (deletes such as the GDPR purge rewrite the
+whole document, which the document cache surfaces as a new list object).
+:class:`AgentIndex` exploits that: it remembers which list it indexed and how
+far, so keeping it current costs O(new records) per call instead of the O(N)
+full scan every ``agent_id`` lookup used to pay.
+
+With ``order_by`` set, the index also keeps each agent's sort keys (e.g. the
+ISO-8601 ``timestamp``) so :meth:`AgentIndex.range` can bisect a date window
+instead of string-comparing every row.
+"""
+
+import threading
+from bisect import bisect_left, bisect_right
+from typing import Dict, Iterable, List, Optional, Set
+
+
+class AgentIndex:
+    """``agent_id -> [records]`` index kept in sync with one live record list.
+
+    :meth:`sync` must be called with the live list before each lookup. If it is
+    the same list object seen last time, only the newly appended tail is
+    indexed; a different object (document reloaded or rewritten) or a shorter
+    list triggers a full rebuild. Lookups return the live records, so callers
+    copy anything they hand outside the storage layer.
+    """
+
+    def __init__(self, key: str = "agent_id", order_by: Optional[str] = None) -> None:
+        self._key = key
+        self._order_by = order_by
+        self._source: Optional[list] = None
+        self._indexed = 0
+        self._by_agent: Dict[str, List[dict]] = {}
+        self._order_keys: Dict[str, list] = {}
+        self._unordered: Set[str] = set()
+        self._lock = threading.Lock()
+        self._reset()
+
+    def sync(self, records: list) -> "AgentIndex":
+        """Bring the index up to date with ``records`` and return ``self``."""
+        with self._lock:
+            if records is not self._source or len(records) < self._indexed:
+                self._source = records
+                self._indexed = 0
+                self._reset()
+            if self._indexed < len(records):
+                key = self._key
+                try:
+                    for rec in records[self._indexed:]:
+                        self._add(rec.get(key), rec)
+                except Exception:
+                    # A partial tail would be indexed again (duplicated) on the
+                    # next call; forget everything so that call rebuilds.
+                    self._source = None
+                    self._indexed = 0
+                    self._reset()
+                    raise
+                self._indexed = len(records)
+        return self
+
+    def _reset(self) -> None:
+        """Drop all indexed state (subclasses extend to reset their columns)."""
+        self._by_agent = {}
+        self._order_keys = {}
+        self._unordered = set()
+
+    def _add(self, agent_id: str, rec: dict) -> None:
+        """Index one record (subclasses extend to maintain derived columns)."""
+        self._by_agent.setdefault(agent_id, []).append(rec)
+        if self._order_by is not None:
+            self._add_order_key(agent_id, rec.get(self._order_by))
+
+    def _add_order_key(self, agent_id: str, value) -> None:
+        keys = self._order_keys.setdefault(agent_id, [])
+        # Missing, mixed-type or out-of-order key: range() falls back to a scan
+        # for this agent rather than returning a wrong window. Keys of different
+        # types (None included) are never compared, since that would raise.
+        if value is None or (
+            agent_id not in self._unordered
+            and keys
+            and (type(value) is not type(keys[-1]) or value < keys[-1])
+        ):
+            self._unordered.add(agent_id)
+        keys.append(value)
+
+    def get(self, agent_id: str) -> List[dict]:
+        """Return the live records for ``agent_id`` in list order (may be empty)."""
+        return self._by_agent.get(agent_id, [])
+
+    def agents(self) -> Iterable[str]:
+        """Return the agent ids that have at least one record."""
+        return self._by_agent.keys()
+
+    def range(
+        self,
+        agent_id: str,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+    ) -> List[dict]:
+        """Return ``agent_id``'s records with ``start <= order_by <= end``.
+
+        Either bound may be ``None``. Requires ``order_by``; agents whose keys
+        are not non-decreasing in list order are filtered linearly.
+        """
+        if self._order_by is None:
+            raise ValueError("AgentIndex.range requires order_by")
+        records = self._by_agent.get(agent_id, [])
+        if agent_id in self._unordered:
+            field = self._order_by
+            return [
+                r for r in records
+                if (start is None or (r.get(field) or "") >= start)
+                and (end is None or (r.get(field) or "") <= end)
+            ]
+        keys = self._order_keys.get(agent_id, [])
+        lo = bisect_left(keys, start) if start is not None else 0
+        hi = bisect_right(keys, end) if end is not None else len(keys)
+        return records[lo:hi]
@@ -19,9 +19,11 @@ that never sets a tenant uses ``"default"`` throughout (FR-014).
 
 import atexit
 import os
+import threading
+import time
 from copy import deepcopy
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
 from attestix import config
 from attestix.storage.repository import DEFAULT_TENANT, Repository
@@ -95,6 +97,21 @@ def _resolve_durability(durability: Optional[str]) -> str:
     return choice
 
 
+def _resolve_batch_limit(value, env_var: str, cast):
+    """Resolve a fast-mode flush bound (arg > env > unbounded ``None``)."""
+    if value is None:
+        raw = os.environ.get(env_var)
+        if raw is None or not raw.strip():
+            return None
+        try:
+            value = cast(raw)
+        except ValueError:
+            raise ValueError(f"{env_var} must be a number, got {raw!r}.") from None
+    if value <= 0:
+        raise ValueError(f"{env_var} must be positive, got {value!r}.")
+    return value
+
+
 class FileRepository(Repository):
     """JSON-file persistence reproducing v0.3.0 on-disk behavior.
 
@@ -132,10 +149,36 @@ class FileRepository(Repository):
 
     Select ``"fast"`` per instance (``FileRepository(durability="fast")``) or
     process-wide via ``ATTESTIX_DURABILITY=fast``.
+
+    The un-flushed tail in ``"fast"`` mode can be bounded, like a
+    max-batch-size / max-batch-delay writer: ``max_batch_writes``
+    (``ATTESTIX_FLUSH_MAX_WRITES``) flushes after that many deferred writes, and
+    ``max_batch_delay_ms`` (``ATTESTIX_FLUSH_MAX_DELAY_MS``) flushes on the first
+    write arriving that long after the oldest un-flushed one. Both are checked on
+    the write path (no background thread touches the live documents) and both
+    default to unbounded. Pending writes are also flushed before ``os.fork`` so a
+    child process never re-writes the parent's tail.
     """
 
-    def __init__(self, durability: Optional[str] = None) -> None:
+    def __init__(
+        self,
+        durability: Optional[str] = None,
+        max_batch_writes: Optional[int] = None,
+        max_batch_delay_ms: Optional[float] = None,
+    ) -> None:
         self._durability = _resolve_durability(durability)
+        self._max_batch_writes = _resolve_batch_limit(
+            max_batch_writes, "ATTESTIX_FLUSH_MAX_WRITES", int
+        )
+        self._max_batch_delay_ms = _resolve_batch_limit(
+            max_batch_delay_ms, "ATTESTIX_FLUSH_MAX_DELAY_MS", float
+        )
+        # Guards the live document cache: every public operation runs its
+        # read-modify-write under it, so worker threads share one repository.
+        self._lock = threading.RLock()
+        # Deferred-write bookkeeping for the fast-mode flush bounds.
+        self._pending_writes = 0
+        self._pending_since: Optional[float] = None
         # file_path(str) -> (document, stat_token). stat_token is
         # (st_mtime_ns, st_size) of the file the document was last read/written
         # from, or None when the file did not exist at read time.
@@ -145,6 +188,8 @@ class FileRepository(Repository):
         if self._durability == DURABILITY_FAST:
             # Best-effort: never lose a batched tail on a clean interpreter exit.
             atexit.register(self.flush)
+            if hasattr(os, "register_at_fork"):
+                os.register_at_fork(before=self.flush)
 
     # --- document cache -------------------------------------------------------
 
@@ -189,6 +234,11 @@ class FileRepository(Repository):
             # Defer the disk write; the in-memory doc is authoritative until flush.
             self._doc_cache[key] = (data, None)
             self._dirty.add(key)
+            self._pending_writes += 1
+            if self._pending_since is None:
+                self._pending_since = time.monotonic()
+            if self._batch_due():
+                self.flush()
             return
         config._safe_save(file_path, data)
         # Refresh the stat token to the just-written file so subsequent reads hit
@@ -196,20 +246,34 @@ class FileRepository(Repository):
         self._doc_cache[key] = (data, self._stat_token(file_path))
         self._dirty.discard(key)
 
+    def _batch_due(self) -> bool:
+        """True once the deferred tail exceeds a configured flush bound."""
+        if self._max_batch_writes is not None and (
+            self._pending_writes >= self._max_batch_writes
+        ):
+            return True
+        if self._max_batch_delay_ms is not None and self._pending_since is not None:
+            waited_ms = (time.monotonic() - self._pending_since) * 1000.0
+            return waited_ms >= self._max_batch_delay_ms
+        return False
+
     def flush(self) -> None:
         """Flush all pending in-memory writes to disk (no-op in ``safe`` mode).
 
         Idempotent. Call this to make a batch of ``fast``-mode writes durable
         without exiting the process (e.g. at the end of a bulk issuance run).
         """
-        if not self._dirty:
-            return
-        for key in list(self._dirty):
-            doc, _ = self._doc_cache[key]
-            file_path = Path(key)
-            config._safe_save(file_path, doc)
-            self._doc_cache[key] = (doc, self._stat_token(file_path))
-        self._dirty.clear()
+        with self._lock:
+            self._pending_writes = 0
+            self._pending_since = None
+            if not self._dirty:
+                return
+            for key in list(self._dirty):
+                doc, _ = self._doc_cache[key]
+                file_path = Path(key)
+                config._safe_save(file_path, doc)
+                self._doc_cache[key] = (doc, self._stat_token(file_path))
+            self._dirty.clear()
 
     # --- document API (public shims back FR-002 load_*/save_* helpers) --------
 
@@ -223,13 +287,15 @@ class FileRepository(Repository):
         copy is returned so a caller mutating the result cannot corrupt the cache
         (the historical contract: each ``load_*`` returned a fresh dict).
         """
-        file_path, _, default = _resolve(collection)
-        return deepcopy(self._cached_document(file_path, default))
+        with self._lock:
+            file_path, _, default = _resolve(collection)
+            return deepcopy(self._cached_document(file_path, default))
 
     def save_document(self, collection: str, data: dict) -> None:
         """Persist the entire JSON document for ``collection`` (whole-file save)."""
-        file_path, _, _ = _resolve(collection)
-        self._write_document(file_path, data)
+        with self._lock:
+            file_path, _, _ = _resolve(collection)
+            self._write_document(file_path, data)
 
     def append_to_document(self, collection: str, record: dict) -> dict:
         """Append ``record`` to ``collection``'s primary list and persist (O(1)).
@@ -246,10 +312,55 @@ class FileRepository(Repository):
         collections (``credentials``, ``identities``, ...). Returns the stored
         record (the same object that was appended).
         """
-        data, records, file_path, _ = self._load_list(collection)
-        records.append(record)
-        self._save(file_path, data)
-        return record
+        with self._lock:
+            data, records, file_path, _ = self._load_list(collection)
+            records.append(record)
+            self._save(file_path, data)
+            return record
+
+    def extend_document(self, collection: str, records: List[dict]) -> List[dict]:
+        """Append several records with one write (see :meth:`append_to_document`).
+
+        Records are written verbatim, in order. Returns ``records``.
+        """
+        with self._lock:
+            data, existing, file_path, _ = self._load_list(collection)
+            existing.extend(records)
+            self._save(file_path, data)
+            return records
+
+    def read_document(self, collection: str, read: Callable[[dict], Any]) -> Any:
+        """Apply ``read`` to the live cached document and return its result.
+
+        Read-path counterpart of :meth:`update_document`: no O(N) deep copy of
+        the whole document, so indexed lookups stay proportional to the rows
+        they return. ``read`` MUST NOT mutate the document and MUST copy any
+        record it returns.
+        """
+        with self._lock:
+            file_path, _, default = _resolve(collection)
+            return read(self._cached_document(file_path, default))
+
+    def update_document(self, collection: str, mutate: Callable[[dict], Any]) -> Any:
+        """Apply ``mutate`` to the live cached document and persist it once.
+
+        Generalizes :meth:`append_to_document` to documents with more than one
+        list (``provenance.audit_log``) or a derived section (``reputation.scores``):
+        the mutator receives the cache's own document, so the write path never
+        pays the O(N) deep copy of :meth:`load_document`. Returns whatever
+        ``mutate`` returns.
+
+        ``mutate`` MUST NOT leak references into the document to its caller and
+        SHOULD do all fallible work before its first in-place change: if it
+        raises, nothing is written, but changes it already made stay in the
+        cache until the file next changes on disk.
+        """
+        with self._lock:
+            file_path, _, default = _resolve(collection)
+            data = self._cached_document(file_path, default)
+            result = mutate(data)
+            self._save(file_path, data)
+            return result
 
     def last_record(
         self,
@@ -267,11 +378,12 @@ class FileRepository(Repository):
         ``None``). Single-tenant (the self-host default) hits the last element
         immediately.
         """
-        _, records, _, _ = self._load_list(collection)
-        for rec in reversed(records):
-            if _tenant_of(rec) == tenant_id:
-                return deepcopy(rec)
-        return None
+        with self._lock:
+            _, records, _, _ = self._load_list(collection)
+            for rec in reversed(records):
+                if _tenant_of(rec) == tenant_id:
+                    return deepcopy(rec)
+            return None
 
     def _load_list(self, collection: str):
         file_path, list_key, default = _resolve(collection)
@@ -293,15 +405,16 @@ class FileRepository(Repository):
             raise ValueError(
                 f"record must include the id field {id_field!r} on create"
             )
-        data, records, file_path, _ = self._load_list(collection)
-        stored = dict(record)
-        # Tag the record with its tenant. The field defaults to "default" so the
-        # on-disk shape is a strict superset of v0.3.0 (Complexity Tracking item).
-        stored["tenant_id"] = tenant_id
-        records.append(stored)
-        self._save(file_path, data)
-        # The stored dict is now owned by the cache; return a copy.
-        return deepcopy(stored)
+        with self._lock:
+            data, records, file_path, _ = self._load_list(collection)
+            stored = dict(record)
+            # Tag the record with its tenant. The field defaults to "default" so the
+            # on-disk shape is a strict superset of v0.3.0 (Complexity Tracking item).
+            stored["tenant_id"] = tenant_id
+            records.append(stored)
+            self._save(file_path, data)
+            # The stored dict is now owned by the cache; return a copy.
+            return deepcopy(stored)
 
     def get(
         self,
@@ -311,12 +424,13 @@ class FileRepository(Repository):
         tenant_id: str = DEFAULT_TENANT,
         id_field: str = "id",
     ) -> Optional[dict]:
-        _, records, _, _ = self._load_list(collection)
-        for rec in records:
-            if rec.get(id_field) == record_id and _tenant_of(rec) == tenant_id:
-                # Copy so a caller mutating the result cannot corrupt the cache.
-                return deepcopy(rec)
-        return None
+        with self._lock:
+            _, records, _, _ = self._load_list(collection)
+            for rec in records:
+                if rec.get(id_field) == record_id and _tenant_of(rec) == tenant_id:
+                    # Copy so a caller mutating the result cannot corrupt the cache.
+                    return deepcopy(rec)
+            return None
 
     def list(
         self,
@@ -327,18 +441,19 @@ class FileRepository(Repository):
         limit: Optional[int] = None,
         id_field: str = "id",
     ) -> List[dict]:
-        _, records, _, _ = self._load_list(collection)
-        results: List[dict] = []
-        for rec in records:
-            if _tenant_of(rec) != tenant_id:
-                continue
-            if filters and any(rec.get(k) != v for k, v in filters.items()):
-                continue
-            # Copy so a caller mutating a result cannot corrupt the cache.
-            results.append(deepcopy(rec))
-            if limit is not None and len(results) >= limit:
-                break
-        return results
+        with self._lock:
+            _, records, _, _ = self._load_list(collection)
+            results: List[dict] = []
+            for rec in records:
+                if _tenant_of(rec) != tenant_id:
+                    continue
+                if filters and any(rec.get(k) != v for k, v in filters.items()):
+                    continue
+                # Copy so a caller mutating a result cannot corrupt the cache.
+                results.append(deepcopy(rec))
+                if limit is not None and len(results) >= limit:
+                    break
+            return results
 
     def update(
         self,
@@ -354,19 +469,20 @@ class FileRepository(Repository):
                 f"{id_field!r} in record ({record[id_field]!r}) must match "
                 f"record_id {record_id!r}; update must not change identity"
             )
-        data, records, file_path, _ = self._load_list(collection)
-        for idx, rec in enumerate(records):
-            if rec.get(id_field) == record_id and _tenant_of(rec) == tenant_id:
-                # deepcopy so a caller mutating ``record`` after the call cannot
-                # reach into the cache through the shared reference.
-                stored = deepcopy(record)
-                # Persist the canonical id so an id-less payload stays queryable.
-                stored[id_field] = record_id
-                stored["tenant_id"] = tenant_id
-                records[idx] = stored
-                self._save(file_path, data)
-                return deepcopy(stored)
-        return None
+        with self._lock:
+            data, records, file_path, _ = self._load_list(collection)
+            for idx, rec in enumerate(records):
+                if rec.get(id_field) == record_id and _tenant_of(rec) == tenant_id:
+                    # deepcopy so a caller mutating ``record`` after the call cannot
+                    # reach into the cache through the shared reference.
+                    stored = deepcopy(record)
+                    # Persist the canonical id so an id-less payload stays queryable.
+                    stored[id_field] = record_id
+                    stored["tenant_id"] = tenant_id
+                    records[idx] = stored
+                    self._save(file_path, data)
+                    return deepcopy(stored)
+            return None
 
     def delete(
         self,
@@ -376,10 +492,11 @@ class FileRepository(Repository):
         tenant_id: str = DEFAULT_TENANT,
         id_field: str = "id",
     ) -> bool:
-        data, records, file_path, _ = self._load_list(collection)
-        for idx, rec in enumerate(records):
-            if rec.get(id_field) == record_id and _tenant_of(rec) == tenant_id:
-                del records[idx]
-                self._save(file_path, data)
-                return True
-        return False
+        with self._lock:
+            data, records, file_path, _ = self._load_list(collection)
+            for idx, rec in enumerate(records):
+                if rec.get(id_field) == record_id and _tenant_of(rec) == tenant_id:
+                    del records[idx]
+                    self._save(file_path, data)
+                    return True
+            return False
@@ -1,6 +1,6 @@
 """Attestix tools - re-exports from flat module for namespace compatibility.
 
-MCP tool registration modules (47 tools across 9 modules):
+MCP tool registration modules (56 tools across 9 modules):
     - identity_tools: 8 tools for UAIT management
     - agent_card_tools: 3 tools for A2A agent cards
     - did_tools: 3 tools for DID operations
@@ -1,9 +1,10 @@
-"""Credential MCP tools for Attestix (8 tools).
+"""Credential MCP tools for Attestix (11 tools).
 
 W3C Verifiable Credentials (VC Data Model 1.1) issuance and verification.
 """
 
 import json
+from typing import Union
 
 
 def _validate_required(params: dict) -> str:
@@ -130,45 +131,136 @@ def register(mcp):
         return json.dumps(results, indent=2, default=str)
 
     @mcp.tool()
-    async def verify_credential_external(credential_json: str) -> str:
+    async def list_credentials_many(
+        agent_ids: str,
+        credential_type: str = "",
+        valid_only: bool = False,
+        limit: int = 50,
+    ) -> str:
+        """List Verifiable Credentials for several agents in one call.
+
+        Applies the same filters as list_credentials to each agent and returns
+        an object keyed by agent ID, in the order given.
+
+        Args:
+            agent_ids: Comma-separated subject agent IDs.
+            credential_type: Filter by type (e.g., EUAIActComplianceCredential). Empty = all types.
+            valid_only: Only return non-revoked, non-expired credentials.
+            limit: Maximum number of results per agent.
+        """
+        from attestix.services.cache import get_service
+        from attestix.services.credential_service import CredentialService
+
+        svc = get_service(CredentialService)
+        ids = [a.strip() for a in agent_ids.split(",") if a.strip()]
+        if not ids:
+            return json.dumps({"error": "No agent_ids provided"})
+
+        results = svc.list_credentials_by_agent(
+            ids,
+            credential_type=credential_type or None,
+            valid_only=valid_only,
+            limit=limit,
+        )
+        return json.dumps(results, indent=2, default=str)
+
+    @mcp.tool()
+    async def verify_credential_external(credential_json: Union[str, dict]) -> str:
         """Verify a Verifiable Credential provided as raw JSON.
 
         Use this when you receive a VC from another party and need to validate it
         without it being in local storage. Checks signature, expiry, and structure.
 
         Args:
-            credential_json: The full W3C Verifiable Credential as a JSON string.
+            credential_json: The full W3C Verifiable Credential, as a JSON string
+                or an already-parsed object (which skips re-parsing).
         """
         from attestix.services.cache import get_service
         from attestix.services.credential_service import CredentialService
 
         svc = get_service(CredentialService)
-        try:
-            credential = json.loads(credential_json)
-        except json.JSONDecodeError:
-            return json.dumps({"error": "Invalid JSON in credential_json"})
+        if isinstance(credential_json, dict):
+            credential = credential_json
+        else:
+            try:
+                credential = json.loads(credential_json)
+            except json.JSONDecodeError:
+                return json.dumps({"error": "Invalid JSON in credential_json"})
 
         result = svc.verify_credential_external(credential)
         return json.dumps(result, indent=2, default=str)
 
     @mcp.tool()
-    async def verify_presentation(presentation_json: str) -> str:
+    async def verify_credentials(credentials_json: Union[str, list]) -> str:
+        """Verify many Verifiable Credentials provided as raw JSON in one call.
+
+        Runs the same checks as verify_credential_external on each item and
+        returns one result per credential, in order.
+
+        Args:
+            credentials_json: JSON array of full W3C Verifiable Credentials, as
+                a string or an already-parsed list (which skips re-parsing).
+        """
+        from attestix.services.cache import get_service
+        from attestix.services.credential_service import CredentialService
+
+        svc = get_service(CredentialService)
+        if isinstance(credentials_json, list):
+            credentials = credentials_json
+        else:
+            try:
+                credentials = json.loads(credentials_json)
+            except json.JSONDecodeError:
+                return json.dumps({"error": "Invalid JSON in credentials_json"})
+        if not isinstance(credentials, list):
+            return json.dumps({"error": "credentials_json must be a JSON array"})
+
+        results = svc.verify_credentials_external_batch(credentials)
+        return json.dumps(results, indent=2, default=str)
+
+    @mcp.tool()
+    async def verify_credentials_batch(credential_ids: str) -> str:
+        """Verify many stored Verifiable Credentials by ID in one call.
+
+        Runs the same checks as verify_credential on each ID (signature,
+        expiry, revocation) and returns one result per ID, in order.
+
+        Args:
+            credential_ids: Comma-separated credential URNs to verify.
+        """
+        from attestix.services.cache import get_service
+        from attestix.services.credential_service import CredentialService
+
+        svc = get_service(CredentialService)
+        ids = [c.strip() for c in credential_ids.split(",") if c.strip()]
+        if not ids:
+            return json.dumps({"error": "No credential_ids provided"})
+
+        results = svc.verify_credentials_by_id(ids)
+        return json.dumps(results, indent=2, default=str)
+
+    @mcp.tool()
+    async def verify_presentation(presentation_json: Union[str, dict]) -> str:
         """Verify a Verifiable Presentation provided as raw JSON.
 
         Validates the VP signature, checks domain/challenge for replay protection,
         and verifies each contained credential.
 
         Args:
-            presentation_json: The full W3C Verifiable Presentation as a JSON string.
+            presentation_json: The full W3C Verifiable Presentation, as a JSON
+                string or an already-parsed object (which skips re-parsing).
         """
         from attestix.services.cache import get_service
         from attestix.services.credential_service import CredentialService
 
         svc = get_service(CredentialService)
-        try:
-            presentation = json.loads(presentation_json)
-        except json.JSONDecodeError:
-            return json.dumps({"error": "Invalid JSON in presentation_json"})
+        if isinstance(presentation_json, dict):
+            presentation = presentation_json
+        else:
+            try:
+                presentation = json.loads(presentation_json)
+            except json.JSONDecodeError:
+                return json.dumps({"error": "Invalid JSON in presentation_json"})
 
         result = svc.verify_presentation(presentation)
         return json.dumps(result, indent=2, default=str)
@@ -1,4 +1,4 @@
-"""Identity management MCP tools for Attestix (7 tools)."""
+"""Identity management MCP tools for Attestix (10 tools)."""
 
 import json
 
@@ -60,6 +60,44 @@ def register(mcp):
             result = {"error": str(ve)}
         return json.dumps(result, indent=2, default=str)
 
+    @mcp.tool()
+    async def create_agent_identities(identities_json: str) -> str:
+        """Create many UAITs in one call, with one write.
+
+        Args:
+            identities_json: JSON array of objects with display_name and optional
+                source_protocol, identity_token, capabilities (list or
+                comma-separated string), description, issuer_name and
+                expiry_days (same fields as create_agent_identity). A bad item
+                rejects the whole batch.
+        """
+        from attestix.services.cache import get_service
+        from attestix.services.identity_service import IdentityService
+
+        try:
+            identities = json.loads(identities_json)
+        except json.JSONDecodeError:
+            return json.dumps({"error": "Invalid JSON in identities_json"})
+        if not isinstance(identities, list):
+            return json.dumps({"error": "identities_json must be a JSON array"})
+
+        specs = []
+        for item in identities:
+            if not isinstance(item, dict):
+                return json.dumps({"error": "identities_json items must be objects"})
+            spec = {"source_protocol": "manual", "expiry_days": 365, **item}
+            caps = spec.get("capabilities")
+            if isinstance(caps, str):
+                spec["capabilities"] = [c.strip() for c in caps.split(",") if c.strip()]
+            specs.append(spec)
+
+        svc = get_service(IdentityService)
+        try:
+            results = svc.create_identities_batch(specs)
+        except ValueError as ve:
+            return json.dumps({"error": str(ve)})
+        return json.dumps(results, indent=2, default=str)
+
     @mcp.tool()
     async def resolve_identity(identity_token: str) -> str:
         """Auto-detect token type (JWT/DID/URL/API key) and create a UAIT.
@@ -157,6 +195,39 @@ def register(mcp):
             return json.dumps({"error": f"Agent {agent_id} not found"})
         return json.dumps(result, indent=2, default=str)
 
+    @mcp.tool()
+    async def get_agent_snapshot(agent_id: str) -> str:
+        """Get everything stored about an agent in one call.
+
+        Returns the identity, provenance summary, reputation, compliance
+        profile and credential count, each as the matching get_* tool would
+        report it (missing sections are null), e.g. to check data before and
+        after a GDPR purge.
+
+        Args:
+            agent_id: The Attestix agent ID.
+        """
+        err = _validate_required({"agent_id": agent_id})
+        if err:
+            return err
+
+        from attestix.services.cache import get_service
+        from attestix.services.compliance_service import ComplianceService
+        from attestix.services.credential_service import CredentialService
+        from attestix.services.identity_service import IdentityService
+        from attestix.services.provenance_service import ProvenanceService
+        from attestix.services.reputation_service import ReputationService
+
+        result = {
+            "agent_id": agent_id,
+            "identity": get_service(IdentityService).get_identity(agent_id),
+            "provenance": get_service(ProvenanceService).get_provenance(agent_id),
+            "reputation": get_service(ReputationService).get_reputation(agent_id),
+            "compliance": get_service(ComplianceService).get_compliance_profile(agent_id),
+            "credentials_count": get_service(CredentialService).count_credentials(agent_id),
+        }
+        return json.dumps(result, indent=2, default=str)
+
     @mcp.tool()
     async def revoke_identity(agent_id: str, reason: str = "") -> str:
         """Revoke a UAIT, marking it as no longer valid.
@@ -1,4 +1,4 @@
-"""Provenance MCP tools for Attestix (5 tools).
+"""Provenance MCP tools for Attestix (8 tools).
 
 Training data provenance, model lineage, and Article 12 audit trail.
 """
@@ -57,6 +57,35 @@ def register(mcp):
         )
         return json.dumps(result, indent=2, default=str)
 
+    @mcp.tool()
+    async def record_training_datasets(datasets_json: str) -> str:
+        """Record many training data sources in one call, with one signature and one write.
+
+        Args:
+            datasets_json: JSON array of objects with agent_id, dataset_name and
+                optional source_url, license, data_categories (list or
+                comma-separated string), contains_personal_data and
+                data_governance_measures (same fields as record_training_data).
+        """
+        from attestix.services.cache import get_service
+        from attestix.services.provenance_service import ProvenanceService
+
+        try:
+            datasets = json.loads(datasets_json)
+        except json.JSONDecodeError:
+            return json.dumps({"error": "Invalid JSON in datasets_json"})
+        if not isinstance(datasets, list):
+            return json.dumps({"error": "datasets_json must be a JSON array"})
+
+        for item in datasets:
+            cats = item.get("data_categories") if isinstance(item, dict) else None
+            if isinstance(cats, str):
+                item["data_categories"] = [c.strip() for c in cats.split(",") if c.strip()]
+
+        svc = get_service(ProvenanceService)
+        results = svc.record_training_data_batch(datasets)
+        return json.dumps(results, indent=2, default=str)
+
     @mcp.tool()
     async def record_model_lineage(
         agent_id: str,
@@ -127,6 +156,30 @@ def register(mcp):
         )
         return json.dumps(result, indent=2, default=str)
 
+    @mcp.tool()
+    async def log_actions(actions_json: str) -> str:
+        """Log many agent actions in one call, with one signature and one write.
+
+        Args:
+            actions_json: JSON array of objects with agent_id, action_type, and
+                optional input_summary, output_summary, decision_rationale and
+                human_override (same fields as log_action). A bad action_type
+                rejects the whole batch.
+        """
+        from attestix.services.cache import get_service
+        from attestix.services.provenance_service import ProvenanceService
+
+        try:
+            actions = json.loads(actions_json)
+        except json.JSONDecodeError:
+            return json.dumps({"error": "Invalid JSON in actions_json"})
+        if not isinstance(actions, list):
+            return json.dumps({"error": "actions_json must be a JSON array"})
+
+        svc = get_service(ProvenanceService)
+        results = svc.log_actions_batch(actions)
+        return json.dumps(results, indent=2, default=str)
+
     @mcp.tool()
     async def get_provenance(agent_id: str) -> str:
         """Get full provenance record for an agent (training data, model lineage, audit summary).
@@ -156,7 +209,7 @@ def register(mcp):
             action_type: Filter by type (inference, delegation, data_access, external_call). Empty = all.
             start_date: ISO date string for start of range (e.g., 2026-01-01T00:00:00).
             end_date: ISO date string for end of range.
-            limit: Maximum number of results.
+            limit: Maximum number of results (the most recent matches, oldest first).
         """
         from attestix.services.cache import get_service
         from attestix.services.provenance_service import ProvenanceService
@@ -170,3 +223,36 @@ def register(mcp):
             limit=limit,
         )
         return json.dumps(results, indent=2, default=str)
+
+    @mcp.tool()
+    async def get_audit_trail_count(
+        agent_id: str,
+        action_type: str = "",
+        start_date: str = "",
+        end_date: str = "",
+    ) -> str:
+        """Count Article 12 audit trail entries without returning them.
+
+        Args:
+            agent_id: The Attestix agent ID.
+            action_type: Filter by type (inference, delegation, data_access, external_call). Empty = all.
+            start_date: ISO date string for start of range (e.g., 2026-01-01T00:00:00).
+            end_date: ISO date string for end of range.
+        """
+        err = _validate_required({"agent_id": agent_id})
+        if err:
+            return err
+
+        from attestix.services.cache import get_service
+        from attestix.services.provenance_service import ProvenanceService
+
+        svc = get_service(ProvenanceService)
+        count = svc.count_audit_trail(
+            agent_id=agent_id,
+            action_type=action_type or None,
+            start_date=start_date or None,
+            end_date=end_date or None,
+        )
+        if isinstance(count, dict):
+            return json.dumps(count)
+        return json.dumps({"agent_id": agent_id, "count": count})
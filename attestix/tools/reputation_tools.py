@@ -1,4 +1,4 @@
-"""Reputation MCP tools for Attestix (3 tools)."""
+"""Reputation MCP tools for Attestix (4 tools)."""
 
 import json
 
@@ -36,6 +36,29 @@ def register(mcp):
         )
         return json.dumps(result, indent=2, default=str)
 
+    @mcp.tool()
+    async def record_interactions(interactions_json: str) -> str:
+        """Record many interaction outcomes in one call and one write.
+
+        Args:
+            interactions_json: JSON array of objects with agent_id, counterparty_id,
+                outcome, and optional category and details (same fields as
+                record_interaction). A bad outcome rejects the whole batch.
+        """
+        from attestix.services.cache import get_service
+        from attestix.services.reputation_service import ReputationService
+
+        try:
+            interactions = json.loads(interactions_json)
+        except json.JSONDecodeError:
+            return json.dumps({"error": "Invalid JSON in interactions_json"})
+        if not isinstance(interactions, list):
+            return json.dumps({"error": "interactions_json must be a JSON array"})
+
+        svc = get_service(ReputationService)
+        results = svc.record_interactions_batch(interactions)
+        return json.dumps(results, indent=2, default=str)
+
     @mcp.tool()
     async def get_reputation(agent_id: str) -> str:
         """Get the trust score and interaction history for an agent.
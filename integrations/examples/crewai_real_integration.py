@@ -4,7 +4,7 @@ This is NOT a simulation. It uses the actual CrewAI classes
 (`Agent`, `Task`, `Crew`, `Process`) and connects to the running
 Attestix MCP server via `crewai_tools.MCPServerAdapter`, which
 launches `python -m main` as a stdio MCP subprocess and exposes
-all 47 Attestix tools as native CrewAI tools.
+all 56 Attestix tools as native CrewAI tools.
 
 What "real" means here:
 
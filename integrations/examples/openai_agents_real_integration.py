@@ -2,7 +2,7 @@
 
 This is NOT a simulation. It uses the actual openai-agents SDK
 (https://github.com/openai/openai-agents-python) to spawn the Attestix
-MCP server over stdio and register its 47 tools with an Agent.
+MCP server over stdio and register its 56 tools with an Agent.
 
 Key design patterns demonstrated:
   1. MCPServerStdio spawns the Attestix MCP server as a subprocess
@@ -245,7 +245,7 @@ async def amain(live: bool) -> int:
     banner("OpenAI Agents SDK REAL Integration with Attestix")
     print("  SDK:           openai-agents (real import: from agents import Agent)")
     print("  MCP transport: MCPServerStdio (real: from agents.mcp import MCPServerStdio)")
-    print("  Attestix:      47 MCP tools via stdio subprocess")
+    print("  Attestix:      56 MCP tools via stdio subprocess")
 
     server = build_attestix_mcp_server()
     try:
@@ -60,26 +60,34 @@ RFC8032_VECTORS = [
 ]
 
 
+@pytest.fixture(scope="module")
+def ed25519_keys():
+    """Map each vector's seed hex to its (private_key, public_key), derived once."""
+    keys = {}
+    for param in RFC8032_VECTORS:
+        seed_hex = param.values[0]
+        private_key = private_key_from_bytes(bytes.fromhex(seed_hex))
+        keys[seed_hex] = (private_key, private_key.public_key())
+    return keys
+
+
 class TestRFC8032Ed25519Vectors:
     """Validate Ed25519 against RFC 8032 Section 7.1 canonical test vectors."""
 
     @pytest.mark.parametrize("seed_hex,pubkey_hex,msg_hex,sig_hex", RFC8032_VECTORS)
-    def test_public_key_derivation(self, seed_hex, pubkey_hex, msg_hex, sig_hex):
+    def test_public_key_derivation(self, ed25519_keys, seed_hex, pubkey_hex, msg_hex, sig_hex):
         """Verify that the public key derived from the seed matches the RFC vector."""
-        seed = bytes.fromhex(seed_hex)
-        private_key = private_key_from_bytes(seed)
-        public_key = private_key.public_key()
+        _, public_key = ed25519_keys[seed_hex]
         derived_hex = public_key_to_bytes(public_key).hex()
         assert derived_hex == pubkey_hex, (
             f"Public key mismatch: got {derived_hex}, expected {pubkey_hex}"
         )
 
     @pytest.mark.parametrize("seed_hex,pubkey_hex,msg_hex,sig_hex", RFC8032_VECTORS)
-    def test_signature_generation(self, seed_hex, pubkey_hex, msg_hex, sig_hex):
+    def test_signature_generation(self, ed25519_keys, seed_hex, pubkey_hex, msg_hex, sig_hex):
         """Verify that signing produces the exact RFC 8032 expected signature."""
-        seed = bytes.fromhex(seed_hex)
         message = bytes.fromhex(msg_hex) if msg_hex else b""
-        private_key = private_key_from_bytes(seed)
+        private_key, _ = ed25519_keys[seed_hex]
         signature = sign_message(private_key, message)
         sig_hex_actual = signature.hex()
         assert sig_hex_actual == sig_hex, (
@@ -87,21 +95,19 @@ class TestRFC8032Ed25519Vectors:
         )
 
     @pytest.mark.parametrize("seed_hex,pubkey_hex,msg_hex,sig_hex", RFC8032_VECTORS)
-    def test_signature_verification(self, seed_hex, pubkey_hex, msg_hex, sig_hex):
+    def test_signature_verification(self, ed25519_keys, seed_hex, pubkey_hex, msg_hex, sig_hex):
         """Verify that the RFC 8032 signature passes verification."""
-        seed = bytes.fromhex(seed_hex)
         message = bytes.fromhex(msg_hex) if msg_hex else b""
-        private_key = private_key_from_bytes(seed)
-        public_key = private_key.public_key()
+        _, public_key = ed25519_keys[seed_hex]
         signature = bytes.fromhex(sig_hex)
         assert verify_signature(public_key, signature, message) is True
 
     @pytest.mark.parametrize("seed_hex,pubkey_hex,msg_hex,sig_hex", RFC8032_VECTORS)
-    def test_wrong_message_fails_verification(self, seed_hex, pubkey_hex, msg_hex, sig_hex):
+    def test_wrong_message_fails_verification(
+        self, ed25519_keys, seed_hex, pubkey_hex, msg_hex, sig_hex
+    ):
         """Verify that a tampered message fails verification."""
-        seed = bytes.fromhex(seed_hex)
-        private_key = private_key_from_bytes(seed)
-        public_key = private_key.public_key()
+        _, public_key = ed25519_keys[seed_hex]
         signature = bytes.fromhex(sig_hex)
         tampered = b"tampered message content"
         assert verify_signature(public_key, signature, tampered) is False
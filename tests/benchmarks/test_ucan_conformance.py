@@ -13,53 +13,74 @@ import pytest
 
 from attestix.auth.crypto import did_key_to_public_key
 
+pytestmark = pytest.mark.usefixtures("fast_storage")
+
+
+def _unverified_segment(token: str, index: int) -> dict:
+    """Decode one JSON segment of a JWT without checking its signature."""
+    segment = token.split(".")[index]
+    return json.loads(base64.urlsafe_b64decode(segment + "=" * (-len(segment) % 4)))
+
+
+def _unverified_header(token: str) -> dict:
+    return _unverified_segment(token, 0)
+
+
+def _unverified_payload(token: str) -> dict:
+    return _unverified_segment(token, 1)
+
 
 class TestUCANJWTHeader:
     """UCAN tokens must use EdDSA with JWT type and declare UCAN version."""
 
-    def test_header_algorithm_is_eddsa(self, delegation_service):
-        result = delegation_service.create_delegation(
+    @pytest.fixture(scope="class")
+    def header(self, class_delegation_service):
+        result = class_delegation_service.create_delegation(
             issuer_agent_id="agent-issuer",
             audience_agent_id="agent-audience",
             capabilities=["read"],
         )
-        token = result["token"]
-        header = jwt.get_unverified_header(token)
+        return _unverified_header(result["token"])
+
+    def test_header_algorithm_is_eddsa(self, header):
         assert header["alg"] == "EdDSA"
 
-    def test_header_type_is_jwt(self, delegation_service):
-        result = delegation_service.create_delegation(
-            issuer_agent_id="agent-issuer",
-            audience_agent_id="agent-audience",
-            capabilities=["read"],
-        )
-        header = jwt.get_unverified_header(result["token"])
+    def test_header_type_is_jwt(self, header):
         assert header["typ"] == "JWT"
 
-    def test_header_ucan_version(self, delegation_service):
-        result = delegation_service.create_delegation(
-            issuer_agent_id="agent-issuer",
-            audience_agent_id="agent-audience",
-            capabilities=["read"],
-        )
-        header = jwt.get_unverified_header(result["token"])
+    def test_header_ucan_version(self, header):
         assert header["ucv"] == "0.9.0"
 
 
 class TestUCANPayloadFields:
     """UCAN payload must contain all required fields per spec."""
 
-    @pytest.fixture()
-    def ucan_claims(self, delegation_service):
-        result = delegation_service.create_delegation(
-            issuer_agent_id="agent-issuer",
-            audience_agent_id="agent-audience",
-            capabilities=["read", "write"],
-            expiry_hours=1,
+    @pytest.fixture(scope="class")
+    def issued_at(self):
+        """The frozen clock reading the token is minted at."""
+        return int(time.time())
+
+    @pytest.fixture(scope="class")
+    def ucan_token(self, class_delegation_service, issued_at):
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr("attestix.services.delegation_service.time.time", lambda: issued_at)
+            return class_delegation_service.create_delegation(
+                issuer_agent_id="agent-issuer",
+                audience_agent_id="agent-audience",
+                capabilities=["read", "write"],
+                expiry_hours=1,
+            )["token"]
+
+    @pytest.fixture(scope="class")
+    def ucan_claims(self, ucan_token):
+        return _unverified_payload(ucan_token)
+
+    def test_signature_valid(self, ucan_token, ucan_claims, class_delegation_service):
+        public_key = did_key_to_public_key(class_delegation_service._server_did)
+        verified = jwt.decode(
+            ucan_token, public_key, algorithms=["EdDSA"], options={"verify_aud": False}
         )
-        token = result["token"]
-        public_key = did_key_to_public_key(delegation_service._server_did)
-        return jwt.decode(token, public_key, algorithms=["EdDSA"], options={"verify_aud": False})
+        assert verified == ucan_claims
 
     def test_issuer_is_did(self, ucan_claims):
         assert ucan_claims["iss"].startswith("did:key:z")
@@ -73,13 +94,13 @@ class TestUCANPayloadFields:
     def test_proof_chain_field(self, ucan_claims):
         assert isinstance(ucan_claims["prf"], list)
 
-    def test_expiry_field(self, ucan_claims):
+    def test_expiry_field(self, ucan_claims, issued_at):
         assert isinstance(ucan_claims["exp"], int)
-        assert ucan_claims["exp"] > int(time.time())
+        assert ucan_claims["exp"] == issued_at + 3600
 
-    def test_not_before_field(self, ucan_claims):
+    def test_not_before_field(self, ucan_claims, issued_at):
         assert isinstance(ucan_claims["nbf"], int)
-        assert ucan_claims["nbf"] <= int(time.time())
+        assert ucan_claims["nbf"] == issued_at
 
     def test_jti_field(self, ucan_claims):
         assert isinstance(ucan_claims["jti"], str)
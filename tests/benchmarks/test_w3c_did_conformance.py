@@ -13,6 +13,8 @@ from attestix.auth.crypto import (
     public_key_to_bytes,
 )
 
+pytestmark = pytest.mark.usefixtures("fast_storage")
+
 DID_CORE_CONTEXT = "https://www.w3.org/ns/did/v1"
 ED25519_SUITE_CONTEXT = "https://w3id.org/security/suites/ed25519-2020/v1"
 
@@ -20,9 +22,9 @@ ED25519_SUITE_CONTEXT = "https://w3id.org/security/suites/ed25519-2020/v1"
 class TestDIDKeyDocumentStructure:
     """did:key documents must have all W3C DID Core required fields."""
 
-    @pytest.fixture()
-    def did_key_result(self, did_service):
-        return did_service.create_did_key()
+    @pytest.fixture(scope="class")
+    def did_key_result(self, class_did_service):
+        return class_did_service.create_did_key()
 
     def test_context_includes_did_core(self, did_key_result):
         doc = did_key_result["did_document"]
@@ -95,9 +97,9 @@ class TestDIDKeyRoundtrip:
 class TestDIDWebDocumentStructure:
     """did:web documents must follow W3C DID Core structure."""
 
-    @pytest.fixture()
-    def did_web_result(self, did_service):
-        return did_service.create_did_web("example.com")
+    @pytest.fixture(scope="class")
+    def did_web_result(self, class_did_service):
+        return class_did_service.create_did_web("example.com")
 
     def test_did_web_id_format(self, did_web_result):
         assert did_web_result["did"] == "did:web:example.com"
@@ -6,6 +6,8 @@ verifiable presentations, and replay protection.
 
 import pytest
 
+pytestmark = pytest.mark.usefixtures("fast_storage")
+
 VC_CONTEXT_V1 = "https://www.w3.org/2018/credentials/v1"
 ED25519_SUITE_CONTEXT = "https://w3id.org/security/suites/ed25519-2020/v1"
 
@@ -13,10 +15,10 @@ ED25519_SUITE_CONTEXT = "https://w3id.org/security/suites/ed25519-2020/v1"
 class TestCredentialStructure:
     """W3C VC 1.1 requires specific fields in the credential object."""
 
-    @pytest.fixture()
-    def issued_vc(self, credential_service, sample_agent_id):
-        return credential_service.issue_credential(
-            subject_id=sample_agent_id,
+    @pytest.fixture(scope="class")
+    def issued_vc(self, class_credential_service, class_agent_id):
+        return class_credential_service.issue_credential(
+            subject_id=class_agent_id,
             credential_type="AgentIdentityCredential",
             issuer_name="Attestix Conformance",
             claims={"role": "tester", "level": "gold"},
@@ -42,9 +44,9 @@ class TestCredentialStructure:
         assert "issuanceDate" in issued_vc
         assert len(issued_vc["issuanceDate"]) > 0
 
-    def test_credential_subject(self, issued_vc, sample_agent_id):
+    def test_credential_subject(self, issued_vc, class_agent_id):
         subject = issued_vc["credentialSubject"]
-        assert subject["id"] == sample_agent_id
+        assert subject["id"] == class_agent_id
         assert subject["role"] == "tester"
 
     def test_credential_id_is_urn_uuid(self, issued_vc):
@@ -57,10 +59,10 @@ class TestCredentialStructure:
 class TestProofStructure:
     """Ed25519Signature2020 proof must have all required fields."""
 
-    @pytest.fixture()
-    def proof(self, credential_service, sample_agent_id):
-        vc = credential_service.issue_credential(
-            subject_id=sample_agent_id,
+    @pytest.fixture(scope="class")
+    def proof(self, class_credential_service, class_agent_id):
+        vc = class_credential_service.issue_credential(
+            subject_id=class_agent_id,
             credential_type="AgentIdentityCredential",
             issuer_name="Proof Test",
             claims={"test": True},
@@ -127,21 +129,21 @@ class TestMutableFieldsExcludedFromSigning:
 class TestVerifiablePresentation:
     """VP structure, proof purpose, and replay protection."""
 
-    @pytest.fixture()
-    def vp_setup(self, credential_service, sample_agent_id):
-        vc = credential_service.issue_credential(
-            subject_id=sample_agent_id,
+    @pytest.fixture(scope="class")
+    def vp_setup(self, class_credential_service, class_agent_id):
+        vc = class_credential_service.issue_credential(
+            subject_id=class_agent_id,
             credential_type="AgentIdentityCredential",
             issuer_name="VP Test",
             claims={"test": True},
         )
-        vp = credential_service.create_verifiable_presentation(
-            agent_id=sample_agent_id,
+        vp = class_credential_service.create_verifiable_presentation(
+            agent_id=class_agent_id,
             credential_ids=[vc["id"]],
             audience_did="did:key:zAudienceExample",
             challenge="challenge-nonce-12345",
         )
-        return {"vc": vc, "vp": vp, "agent_id": sample_agent_id}
+        return {"vc": vc, "vp": vp, "agent_id": class_agent_id}
 
     def test_vp_type(self, vp_setup):
         vp = vp_setup["vp"]
@@ -5,6 +5,8 @@ and clearing the service cache between tests.
 """
 
 import json
+import os
+import shutil
 import sys
 from pathlib import Path
 from unittest.mock import MagicMock, patch
@@ -16,55 +18,161 @@ PROJECT_ROOT = Path(__file__).parent.parent
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
+from attestix import config  # noqa: E402
 
-@pytest.fixture(autouse=True)
-def tmp_attestix(tmp_path, monkeypatch):
-    """Redirect all Attestix storage to a temp directory.
 
-    This patches every *_FILE path in config.py so that no test
-    reads or writes production JSON files.
-    """
-    from attestix import config
-
-    file_attrs = [
-        "IDENTITIES_FILE",
-        "REPUTATION_FILE",
-        "DELEGATIONS_FILE",
-        "COMPLIANCE_FILE",
-        "CREDENTIALS_FILE",
-        "PROVENANCE_FILE",
-        "ANCHORS_FILE",
-        "AUDIT_FILE",
-        "IDEMPOTENCY_FILE",
-        "BLOCKCHAIN_CONFIG_FILE",
-        "SIGNING_KEY_FILE",
-        "LOG_FILE",
-    ]
+@pytest.fixture(scope="session")
+def session_signing_key_file(tmp_path_factory):
+    """One server signing key file, generated once per test session.
 
-    for attr in file_attrs:
-        original = getattr(config, attr)
-        monkeypatch.setattr(config, attr, tmp_path / original.name)
+    The signing key is not state under test for almost every test, so
+    ``tmp_attestix`` copies this file into each test's storage directory
+    instead of having the first service in every test mint a new keypair.
+    """
+    from attestix.auth.crypto import load_or_create_signing_key
+
+    key_file = tmp_path_factory.mktemp("signing_key") / ".signing_key.json"
+    with patch.dict("os.environ"):
+        os.environ.pop("ATTESTIX_KEY_PASSWORD", None)
+        load_or_create_signing_key(key_file=key_file)
+    return key_file
+
+
+# (config attribute, file name) for every storage path tmp_attestix redirects,
+# resolved once at import since the fixture runs before every test.
+_STORAGE_FILES = tuple((attr, getattr(config, attr).name) for attr in (
+    "IDENTITIES_FILE",
+    "REPUTATION_FILE",
+    "DELEGATIONS_FILE",
+    "COMPLIANCE_FILE",
+    "CREDENTIALS_FILE",
+    "PROVENANCE_FILE",
+    "ANCHORS_FILE",
+    "AUDIT_FILE",
+    "IDEMPOTENCY_FILE",
+    "BLOCKCHAIN_CONFIG_FILE",
+    "SIGNING_KEY_FILE",
+    "LOG_FILE",
+))
+
+
+def _redirect_storage(mp, path, signing_key_file=None):
+    """Point every config storage path at ``path`` using MonkeyPatch ``mp``."""
+    for attr, name in _STORAGE_FILES:
+        mp.setattr(config, attr, path / name)
+
+    if signing_key_file is not None:
+        shutil.copy2(signing_key_file, config.SIGNING_KEY_FILE)
 
     # The HTTP API fails closed when no ATTESTIX_API_KEY is set. Tests exercise
     # the app without a key, so opt into no-auth mode explicitly. A dedicated
     # auth test can monkeypatch.delenv("ATTESTIX_ALLOW_NO_AUTH") to assert the
     # fail-closed behaviour.
-    monkeypatch.setenv("ATTESTIX_ALLOW_NO_AUTH", "1")
+    mp.setenv("ATTESTIX_ALLOW_NO_AUTH", "1")
 
     # Also patch PROJECT_DIR and DATA_DIR so any code using them resolves to tmp
-    monkeypatch.setattr(config, "PROJECT_DIR", tmp_path)
-    monkeypatch.setattr(config, "DATA_DIR", tmp_path)
+    mp.setattr(config, "PROJECT_DIR", path)
+    mp.setattr(config, "DATA_DIR", path)
 
     # Clear the service cache so services re-initialize with patched paths
     from attestix.services.cache import clear_cache
+    from attestix.services.did_service import clear_did_cache
     clear_cache()
+    clear_did_cache()
+
+
+@pytest.fixture(autouse=True)
+def tmp_attestix(tmp_path, monkeypatch, request, session_signing_key_file):
+    """Redirect all Attestix storage to a temp directory.
+
+    This patches every *_FILE path in config.py so that no test
+    reads or writes production JSON files. The session signing key is
+    pre-seeded unless the test is marked ``fresh_signing_key``.
+    """
+    fresh = request.node.get_closest_marker("fresh_signing_key") is not None
+    _redirect_storage(
+        monkeypatch, tmp_path, None if fresh else session_signing_key_file
+    )
 
     yield tmp_path
 
     # Cleanup: clear cache again after test
+    from attestix.services.cache import clear_cache
     clear_cache()
 
 
+@pytest.fixture(scope="session")
+def _fast_repository():
+    from attestix.storage.file_repository import FileRepository
+    return FileRepository(durability="fast")
+
+
+@pytest.fixture
+def fast_storage(monkeypatch, _fast_repository):
+    """Serve the default repositories from memory for the duration of a test.
+
+    Swaps a ``durability="fast"`` FileRepository in for both process-wide
+    defaults, so service reads and writes hit its document cache instead of
+    re-serializing the JSON files on every call. Pending writes are flushed
+    once at teardown. Opt in with ``pytest.mark.usefixtures("fast_storage")``
+    for tests that never inspect the files on disk.
+    """
+    import attestix.storage as storage
+
+    monkeypatch.setattr(config, "_file_repository", _fast_repository)
+    monkeypatch.setattr(storage, "_DEFAULT", _fast_repository)
+    yield _fast_repository
+    _fast_repository.flush()
+
+
+@pytest.fixture(scope="class")
+def class_attestix(tmp_path_factory, session_signing_key_file):
+    """Class-wide storage directory for artifacts shared by a test class.
+
+    Class-scoped fixtures that mint a token or credential once for several
+    read-only assertions build it here; each test still gets its own
+    ``tmp_attestix`` store, which shadows this one while the test runs.
+    """
+    path = tmp_path_factory.mktemp("attestix_class")
+    with pytest.MonkeyPatch.context() as mp:
+        _redirect_storage(mp, path, session_signing_key_file)
+        yield path
+
+
+@pytest.fixture(scope="class")
+def class_delegation_service(class_attestix):
+    """DelegationService over the class-wide store, for read-only tests."""
+    from attestix.services.delegation_service import DelegationService
+    return DelegationService()
+
+
+@pytest.fixture(scope="class")
+def class_credential_service(class_attestix):
+    """CredentialService over the class-wide store, for read-only tests."""
+    from attestix.services.credential_service import CredentialService
+    return CredentialService()
+
+
+@pytest.fixture(scope="class")
+def class_did_service(class_attestix):
+    """DIDService over the class-wide store, for read-only tests."""
+    from attestix.services.did_service import DIDService
+    return DIDService()
+
+
+@pytest.fixture(scope="class")
+def class_agent_id(class_attestix):
+    """A sample agent in the class-wide store."""
+    from attestix.services.identity_service import IdentityService
+    result = IdentityService().create_identity(
+        display_name="Test Agent",
+        source_protocol="mcp",
+        capabilities=["read", "write"],
+        description="A test agent",
+    )
+    return result["agent_id"]
+
+
 @pytest.fixture
 def identity_service():
     """Fresh IdentityService instance using tmp storage."""
@@ -128,8 +236,77 @@ def report_service():
     return ReportService()
 
 
+@pytest.fixture(scope="session")
+def _blockchain_mocks():
+    """The web3 / account / EAS contract mock trees, built once per session.
+
+    No test configures or asserts on these mocks; they only feed canned
+    chain responses to BlockchainService, so one set can back every
+    ``blockchain_service_mock`` instance.
+    """
+    # Mock web3 objects
+    mock_w3 = MagicMock()
+    mock_w3.eth.gas_price = 1000000000  # 1 gwei
+    mock_w3.eth.max_priority_fee = 100000000  # 0.1 gwei
+    mock_w3.eth.get_balance.return_value = 10**18  # 1 ETH
+    mock_w3.eth.get_transaction_count.return_value = 0
+
+    # Build a realistic Attested event log so _extract_attestation_uid
+    # can decode it. Topic[0] must be keccak("Attested(address,address,bytes32,bytes32)").
+    # The single non-indexed uid bytes32 sits at the first 32 bytes of data.
+    from web3 import Web3 as _Web3
+    _attested_sig = bytes(
+        _Web3.keccak(text="Attested(address,address,bytes32,bytes32)")
+    )
+    _fake_uid = b"\x01" * 32  # deterministic non-zero UID
+    mock_w3.eth.wait_for_transaction_receipt.return_value = {
+        "status": 1,
+        "blockNumber": 12345,
+        "gasUsed": 187000,
+        "logs": [{
+            "data": _fake_uid,
+            "topics": [
+                _attested_sig,
+                b"\x00" * 12 + bytes.fromhex("11" * 20),  # recipient
+                b"\x00" * 12 + bytes.fromhex("11" * 20),  # attester
+            ],
+        }],
+    }
+    mock_w3.from_wei = lambda val, unit: val / 10**18 if unit == "ether" else val / 10**9
+    mock_w3.is_connected.return_value = True
+    mock_w3.eth.send_raw_transaction.return_value = b"\xab" * 32
+
+    # Mock account
+    mock_account = MagicMock()
+    mock_account.address = "0x" + "11" * 20
+    mock_account.sign_transaction.return_value = MagicMock(
+        raw_transaction=b"\x00" * 100
+    )
+
+    # Mock contracts
+    mock_eas = MagicMock()
+    mock_eas.functions.attest.return_value.build_transaction.return_value = {
+        "to": "0x" + "42" * 20,
+    }
+    mock_eas.functions.isAttestationValid.return_value.call.return_value = True
+    mock_eas.functions.getAttestation.return_value.call.return_value = [
+        b"\x00" * 32,  # uid
+        b"\x00" * 32,  # schema
+        1700000000,    # time
+        0,             # expirationTime
+        0,             # revocationTime
+        b"\x00" * 32,  # refUID
+        "0x" + "11" * 20,  # recipient
+        "0x" + "11" * 20,  # attester
+        True,          # revocable
+        b"\x00" * 100, # data
+    ]
+
+    return mock_w3, mock_account, mock_eas
+
+
 @pytest.fixture
-def blockchain_service_mock():
+def blockchain_service_mock(_blockchain_mocks):
     """BlockchainService with web3 fully mocked.
 
     Returns a configured service that thinks it's connected to Base Sepolia.
@@ -143,68 +320,7 @@ def blockchain_service_mock():
             svc._network = "sepolia"
             svc._schema_uid = "0x" + "ff" * 32
             svc._init_error = None
-
-            # Mock web3 objects
-            mock_w3 = MagicMock()
-            mock_w3.eth.gas_price = 1000000000  # 1 gwei
-            mock_w3.eth.max_priority_fee = 100000000  # 0.1 gwei
-            mock_w3.eth.get_balance.return_value = 10**18  # 1 ETH
-            mock_w3.eth.get_transaction_count.return_value = 0
-
-            # Build a realistic Attested event log so _extract_attestation_uid
-            # can decode it. Topic[0] must be keccak("Attested(address,address,bytes32,bytes32)").
-            # The single non-indexed uid bytes32 sits at the first 32 bytes of data.
-            from web3 import Web3 as _Web3
-            _attested_sig = bytes(
-                _Web3.keccak(text="Attested(address,address,bytes32,bytes32)")
-            )
-            _fake_uid = b"\x01" * 32  # deterministic non-zero UID
-            mock_w3.eth.wait_for_transaction_receipt.return_value = {
-                "status": 1,
-                "blockNumber": 12345,
-                "gasUsed": 187000,
-                "logs": [{
-                    "data": _fake_uid,
-                    "topics": [
-                        _attested_sig,
-                        b"\x00" * 12 + bytes.fromhex("11" * 20),  # recipient
-                        b"\x00" * 12 + bytes.fromhex("11" * 20),  # attester
-                    ],
-                }],
-            }
-            mock_w3.from_wei = lambda val, unit: val / 10**18 if unit == "ether" else val / 10**9
-            mock_w3.is_connected.return_value = True
-            svc._w3 = mock_w3
-
-            # Mock account
-            mock_account = MagicMock()
-            mock_account.address = "0x" + "11" * 20
-            mock_account.sign_transaction.return_value = MagicMock(
-                raw_transaction=b"\x00" * 100
-            )
-            svc._account = mock_account
-
-            # Mock contracts
-            mock_eas = MagicMock()
-            mock_eas.functions.attest.return_value.build_transaction.return_value = {
-                "to": "0x" + "42" * 20,
-            }
-            mock_eas.functions.isAttestationValid.return_value.call.return_value = True
-            mock_eas.functions.getAttestation.return_value.call.return_value = [
-                b"\x00" * 32,  # uid
-                b"\x00" * 32,  # schema
-                1700000000,    # time
-                0,             # expirationTime
-                0,             # revocationTime
-                b"\x00" * 32,  # refUID
-                "0x" + "11" * 20,  # recipient
-                "0x" + "11" * 20,  # attester
-                True,          # revocable
-                b"\x00" * 100, # data
-            ]
-            svc._eas_contract = mock_eas
-
-            mock_w3.eth.send_raw_transaction.return_value = b"\xab" * 32
+            svc._w3, svc._account, svc._eas_contract = _blockchain_mocks
 
             yield svc
 
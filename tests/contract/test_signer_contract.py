@@ -78,6 +78,13 @@ def test_signature_verifies_via_standard_path(signer):
     assert verify_json_signature(signer.public_key(), payload, sig) is True
 
 
+def test_sign_bytes_verifies_via_standard_path(signer):
+    # sign_bytes over pre-canonicalized bytes must be interchangeable with sign().
+    payload = {"hello": "world", "n": 1.5, "nested": {"a": [1, 2, 3]}}
+    sig = signer.sign_bytes(canonicalize_json(payload))
+    assert verify_json_signature(signer.public_key(), payload, sig) is True
+
+
 def test_signature_is_base64url_string(signer):
     sig = signer.sign({"x": 1})
     assert isinstance(sig, str)
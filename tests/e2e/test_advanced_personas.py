@@ -8,25 +8,37 @@ Each persona test is fully independent and exercises the MCP tool layer
 as a real user would.
 """
 
+import asyncio
+import atexit
 import hashlib
-import json
 import time
+from copy import deepcopy
 
 import pytest
 
+from attestix import _json
+
 
 # ---------------------------------------------------------------------------
 # Helper: call an MCP tool function and parse the JSON response
 # ---------------------------------------------------------------------------
+_LOOP = asyncio.new_event_loop()
+atexit.register(_LOOP.close)
+_TOOLS = None
+
+
 def call_tool(tool_name: str, **kwargs) -> dict | list:
-    """Invoke an MCP tool by name and return parsed JSON."""
-    from attestix.main import mcp
-    import asyncio
+    """Invoke an MCP tool by name and return parsed JSON.
 
-    tools = mcp._tool_manager._tools
-    fn = tools[tool_name].fn
-    result_str = asyncio.get_event_loop().run_until_complete(fn(**kwargs))
-    return json.loads(result_str)
+    All calls share one event loop for the module instead of fetching (and
+    on Python 3.12+, implicitly creating) one per call.
+    """
+    global _TOOLS
+    if _TOOLS is None:
+        from attestix.main import mcp
+        _TOOLS = mcp._tool_manager._tools
+    result_str = _LOOP.run_until_complete(_TOOLS[tool_name].fn(**kwargs))
+    return _json.loads(result_str)
 
 
 # ===========================================================================
@@ -69,11 +81,13 @@ class TestPersona7_CybersecurityAnalyst:
         print(f"  [Persona 7] Credential issued and signature verified")
 
         # 3. Tamper with the credential and verify external detection
-        tampered_cred = json.loads(json.dumps(cred, default=str))
-        tampered_cred["credentialSubject"]["clearance"] = "public"
+        tampered_cred = {
+            **cred,
+            "credentialSubject": {**cred["credentialSubject"], "clearance": "public"},
+        }
         tampered_check = call_tool(
             "verify_credential_external",
-            credential_json=json.dumps(tampered_cred, default=str),
+            credential_json=tampered_cred,
         )
         assert tampered_check["valid"] is False, (
             "Tampered credential should fail verification"
@@ -84,7 +98,7 @@ class TestPersona7_CybersecurityAnalyst:
         # 4. Test that the original still verifies
         original_check = call_tool(
             "verify_credential_external",
-            credential_json=json.dumps(cred, default=str),
+            credential_json=cred,
         )
         assert original_check["valid"] is True
         print(f"  [Persona 7] Original credential still verifies correctly")
@@ -137,12 +151,12 @@ class TestPersona7_CybersecurityAnalyst:
         print(f"  [Persona 7] Delegation token signature verified")
 
         # Tamper with the JWT token (flip a character in the signature)
-        token_parts = delegation["token"].split(".")
-        assert len(token_parts) == 3, "JWT should have 3 parts"
-        sig = list(token_parts[2])
-        # Flip one character
-        sig[0] = "A" if sig[0] != "A" else "B"
-        tampered_token = f"{token_parts[0]}.{token_parts[1]}.{''.join(sig)}"
+        token = delegation["token"]
+        assert token.count(".") == 2, "JWT should have 3 parts"
+        signed, _, sig = token.rpartition(".")
+        # Flip the first signature character: the last one carries unused
+        # padding bits, so changing it may not change the decoded signature
+        tampered_token = f"{signed}.{'A' if sig[0] != 'A' else 'B'}{sig[1:]}"
         tampered_del = call_tool("verify_delegation", token=tampered_token)
         assert tampered_del["valid"] is False
         print(f"  [Persona 7] Tampered JWT correctly rejected")
@@ -150,7 +164,7 @@ class TestPersona7_CybersecurityAnalyst:
         # 9. Test DID key cryptographic properties
         did_result = call_tool("create_did_key")
         assert did_result["did"].startswith("did:key:z6Mk")
-        assert "publicKeyMultibase" in json.dumps(did_result.get("did_document", {}))
+        assert "publicKeyMultibase" in _json.dumps(did_result.get("did_document", {}))
         print(f"  [Persona 7] DID key uses correct Ed25519 multicodec prefix")
 
         print("  [Persona 7] PASS: All cryptographic integrity checks passed")
@@ -298,7 +312,7 @@ class TestPersona8_EUGovernmentRegulator:
         )
         vp_check = call_tool(
             "verify_presentation",
-            presentation_json=json.dumps(vp_a, default=str),
+            presentation_json=vp_a,
         )
         assert vp_check["valid"] is True
         assert vp_check["checks"]["challenge_present"] is True
@@ -347,14 +361,16 @@ class TestPersona9_LegalCounsel:
             ("Synthetic Fairness Test Set", False, "Bias testing data",
              "Generated to test demographic parity across protected groups"),
         ]
-        for name, personal, gov, measures in datasets:
-            call_tool(
-                "record_training_data",
-                agent_id=agent_id,
-                dataset_name=name,
-                contains_personal_data=personal,
-                data_governance_measures=measures,
-            )
+        recorded = call_tool("record_training_datasets", datasets_json=_json.dumps([
+            {
+                "agent_id": agent_id,
+                "dataset_name": name,
+                "contains_personal_data": personal,
+                "data_governance_measures": measures,
+            }
+            for name, personal, gov, measures in datasets
+        ]))
+        assert len(recorded) == len(datasets)
         print(f"  [Persona 9] Documented {len(datasets)} training datasets for legal record")
 
         # 3. Document model evaluation metrics (fairness evidence)
@@ -364,7 +380,7 @@ class TestPersona9_LegalCounsel:
             base_model="GradientBoost-InsureV3",
             base_model_provider="InsureCo ML Team",
             fine_tuning_method="Fairness-constrained optimization with equalized odds",
-            evaluation_metrics_json=json.dumps({
+            evaluation_metrics_json=_json.dumps({
                 "accuracy": 0.91,
                 "demographic_parity_ratio": 0.97,
                 "equalized_odds_diff": 0.02,
@@ -395,16 +411,18 @@ class TestPersona9_LegalCounsel:
             ("inference", "Customer C - reviewed", "Quote adjusted: 6200 EUR", "Underwriter reduced after appeal review", True),
             ("data_access", "Customer C appeal documents", "3 supporting documents loaded", "Customer exercised right to explanation", False),
         ]
-        for atype, inp, out, rationale, human in actions:
-            call_tool(
-                "log_action",
-                agent_id=agent_id,
-                action_type=atype,
-                input_summary=inp,
-                output_summary=out,
-                decision_rationale=rationale,
-                human_override=human,
-            )
+        logged = call_tool("log_actions", actions_json=_json.dumps([
+            {
+                "agent_id": agent_id,
+                "action_type": atype,
+                "input_summary": inp,
+                "output_summary": out,
+                "decision_rationale": rationale,
+                "human_override": human,
+            }
+            for atype, inp, out, rationale, human in actions
+        ]))
+        assert len(logged) == len(actions)
         print(f"  [Persona 9] Logged {len(actions)} actions demonstrating human oversight")
 
         # 6. Retrieve full audit trail for legal evidence
@@ -437,7 +455,7 @@ class TestPersona9_LegalCounsel:
             agent_id=agent_id,
             credential_type="ConformityAssessmentCredential",
             issuer_name="InsureCo Fairness Board",
-            claims_json=json.dumps({
+            claims_json=_json.dumps({
                 "assessment_type": "fairness_audit",
                 "result": "pass",
                 "demographic_parity_ratio": 0.97,
@@ -505,17 +523,19 @@ class TestPersona10_HealthcareAIProvider:
              "ecg,synthetic", False,
              "GAN-generated ECG signals for data augmentation, no real patient data"),
         ]
-        for name, lic, cats, personal, governance in training_sets:
-            td = call_tool(
-                "record_training_data",
-                agent_id=agent_id,
-                dataset_name=name,
-                license=lic,
-                data_categories=cats,
-                contains_personal_data=personal,
-                data_governance_measures=governance,
-            )
-            assert "entry_id" in td
+        recorded = call_tool("record_training_datasets", datasets_json=_json.dumps([
+            {
+                "agent_id": agent_id,
+                "dataset_name": name,
+                "license": lic,
+                "data_categories": cats,
+                "contains_personal_data": personal,
+                "data_governance_measures": governance,
+            }
+            for name, lic, cats, personal, governance in training_sets
+        ]))
+        assert len(recorded) == len(training_sets)
+        assert all("entry_id" in td for td in recorded)
         print(f"  [Persona 10] Documented {len(training_sets)} training datasets")
 
         # 3. Record model lineage with clinical evaluation metrics
@@ -525,7 +545,7 @@ class TestPersona10_HealthcareAIProvider:
             base_model="ResNet-ECG-v4",
             base_model_provider="MedTech Innovations GmbH",
             fine_tuning_method="Transfer learning from ImageNet, fine-tuned on ECG spectrograms with class-weighted loss",
-            evaluation_metrics_json=json.dumps({
+            evaluation_metrics_json=_json.dumps({
                 "sensitivity": 0.96,
                 "specificity": 0.94,
                 "ppv": 0.91,
@@ -569,16 +589,18 @@ class TestPersona10_HealthcareAIProvider:
             ("inference", "ECG #4523 - cardiologist override", "VT ruled out, artifact identified",
              "Physician overrode AI: motion artifact misclassified as VT", True),
         ]
-        for atype, inp, out, rationale, human in clinical_events:
-            call_tool(
-                "log_action",
-                agent_id=agent_id,
-                action_type=atype,
-                input_summary=inp,
-                output_summary=out,
-                decision_rationale=rationale,
-                human_override=human,
-            )
+        logged = call_tool("log_actions", actions_json=_json.dumps([
+            {
+                "agent_id": agent_id,
+                "action_type": atype,
+                "input_summary": inp,
+                "output_summary": out,
+                "decision_rationale": rationale,
+                "human_override": human,
+            }
+            for atype, inp, out, rationale, human in clinical_events
+        ]))
+        assert len(logged) == len(clinical_events)
         print(f"  [Persona 10] Logged {len(clinical_events)} clinical decision events")
 
         # 6. Third-party conformity assessment (required for medical devices)
@@ -619,7 +641,7 @@ class TestPersona10_HealthcareAIProvider:
         # Verify the VP
         vp_check = call_tool(
             "verify_presentation",
-            presentation_json=json.dumps(vp, default=str),
+            presentation_json=vp,
         )
         assert vp_check["valid"] is True
         print(f"  [Persona 10] VP with {len(vp['verifiableCredential'])} credentials verified")
@@ -862,7 +884,7 @@ class TestPersona12_EnterpriseArchitect:
             name="EnterprisePipeline-Agent",
             url="https://enterprise.example.com/agents/pipeline",
             description="Central data pipeline orchestration agent",
-            skills_json=json.dumps([
+            skills_json=_json.dumps([
                 {"id": "etl", "name": "ETL Processing", "description": "Extract, transform, load data"},
                 {"id": "sync", "name": "Data Sync", "description": "Cross-system data synchronization"},
                 {"id": "report", "name": "Reporting", "description": "Generate compliance reports"},
@@ -919,7 +941,7 @@ class TestPersona12_EnterpriseArchitect:
                 agent_id=agent_id,
                 credential_type=cred_type,
                 issuer_name="EnterpriseCorp Central Authority",
-                claims_json=json.dumps({"system": "enterprise", "verified": True}),
+                claims_json=_json.dumps({"system": "enterprise", "verified": True}),
             )
             assert "id" in cred
         print(f"  [Persona 12] Cross-system credentials issued")
@@ -1244,7 +1266,7 @@ class TestPersona15_PenetrationTester:
         }
         fake_check = call_tool(
             "verify_credential_external",
-            credential_json=json.dumps(fake_cred),
+            credential_json=_json.dumps(fake_cred),
         )
         assert fake_check["valid"] is False, "Forged credential should fail"
         assert fake_check["checks"]["signature_valid"] is False
@@ -1257,7 +1279,7 @@ class TestPersona15_PenetrationTester:
             agent_id=agent_id,
             credential_type="AgentIdentityCredential",
             issuer_name="PenTestLab",
-            claims_json=json.dumps(long_claims),
+            claims_json=_json.dumps(long_claims),
         )
         # Should either succeed (no size limit) or return a structured error
         assert isinstance(long_result, dict)
@@ -1295,12 +1317,12 @@ class TestPersona15_PenetrationTester:
         )
 
         # Tamper with the credential inside the VP
-        tampered_vp = json.loads(json.dumps(vp, default=str))
+        tampered_vp = deepcopy(vp)
         if tampered_vp.get("verifiableCredential"):
             tampered_vp["verifiableCredential"][0]["credentialSubject"]["test"] = False
         tampered_vp_check = call_tool(
             "verify_presentation",
-            presentation_json=json.dumps(tampered_vp, default=str),
+            presentation_json=tampered_vp,
         )
         assert tampered_vp_check["valid"] is False, "VP with tampered credential should fail"
         print(f"  [Persona 15] Tampered VP: correctly rejected")
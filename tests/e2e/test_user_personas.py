@@ -7,22 +7,33 @@ Each persona test is independent and creates its own agents,
 credentials, compliance profiles, etc.
 """
 
-import json
+import asyncio
+import atexit
 import pytest
 
+from attestix import _json
+
 
 # ---------------------------------------------------------------------------
 # Helper: call an MCP tool function and parse the JSON response
 # ---------------------------------------------------------------------------
+_LOOP = asyncio.new_event_loop()
+atexit.register(_LOOP.close)
+_TOOLS = None
+
+
 def call_tool(tool_name: str, **kwargs) -> dict | list:
-    """Invoke an MCP tool by name and return parsed JSON."""
-    from attestix.main import mcp
-    import asyncio
+    """Invoke an MCP tool by name and return parsed JSON.
 
-    tools = mcp._tool_manager._tools
-    fn = tools[tool_name].fn
-    result_str = asyncio.get_event_loop().run_until_complete(fn(**kwargs))
-    return json.loads(result_str)
+    All calls share one event loop for the module instead of fetching (and
+    on Python 3.12+, implicitly creating) one per call.
+    """
+    global _TOOLS
+    if _TOOLS is None:
+        from attestix.main import mcp
+        _TOOLS = mcp._tool_manager._tools
+    result_str = _LOOP.run_until_complete(_TOOLS[tool_name].fn(**kwargs))
+    return _json.loads(result_str)
 
 
 # ===========================================================================
@@ -66,7 +77,7 @@ class TestPersona1_StartupDeveloper:
             agent_id=agent_id,
             credential_type="AgentIdentityCredential",
             issuer_name="IndieAI Labs",
-            claims_json=json.dumps({
+            claims_json=_json.dumps({
                 "role": "customer_support",
                 "version": "1.0",
                 "deployment": "production",
@@ -173,7 +184,7 @@ class TestPersona2_ComplianceOfficer:
             base_model="XGBoost 2.1",
             base_model_provider="Open Source (Apache 2.0)",
             fine_tuning_method="Gradient boosting with Optuna hyperparameter search",
-            evaluation_metrics_json=json.dumps({
+            evaluation_metrics_json=_json.dumps({
                 "auc_roc": 0.892,
                 "precision": 0.87,
                 "recall": 0.91,
@@ -554,7 +565,7 @@ class TestPersona5_ExternalAuditor:
             agent_id=agent_id,
             credential_type="TransparencyObligationCredential",
             issuer_name="AuditedCorp",
-            claims_json=json.dumps({
+            claims_json=_json.dumps({
                 "transparency_measure": "AI disclosure banner on all outputs",
                 "implementation_date": "2026-01-15",
             }),
@@ -580,7 +591,7 @@ class TestPersona5_ExternalAuditor:
         # --- Auditor side: verify the VP externally ---
         vp_check = call_tool(
             "verify_presentation",
-            presentation_json=json.dumps(vp, default=str),
+            presentation_json=vp,
         )
         assert vp_check["valid"] is True
         assert vp_check["checks"]["vp_signature_valid"] is True
@@ -592,7 +603,7 @@ class TestPersona5_ExternalAuditor:
         for cred in all_creds:
             cred_check = call_tool(
                 "verify_credential_external",
-                credential_json=json.dumps(cred, default=str),
+                credential_json=cred,
             )
             assert cred_check["valid"] is True, (
                 f"Credential {cred['id']} failed: {cred_check}"
@@ -0,0 +1,100 @@
+"""Performance guards for the provenance / reputation write and read paths.
+
+``record_*`` / ``log_action`` / ``record_interaction`` used to
+``load_* -> mutate -> save_*`` the whole document on every insert, paying an
+O(N) deep copy of the (growing) collection per call. They now write through
+``config.update_provenance`` / ``config.update_reputation``, which mutate the
+live cached document. These deterministic guards assert the hot paths never
+fall back to the whole-document load. Per-agent reads go through the
+``AgentIndex`` over the live document for the same reason.
+"""
+
+import pytest
+
+pytestmark = pytest.mark.perf
+
+
+def _forbid(monkeypatch, module, name):
+    def _fail(*args, **kwargs):
+        raise AssertionError(f"{name} called on a hot path")
+
+    # raising=False: the services no longer import the loaders at all; the
+    # patched global still trips if a call to one is ever reintroduced.
+    monkeypatch.setattr(module, name, _fail, raising=False)
+
+
+def test_provenance_writes_do_not_reload_document(monkeypatch, provenance_service):
+    import attestix.services.provenance_service as ps
+
+    _forbid(monkeypatch, ps, "load_provenance")
+
+    assert "error" not in provenance_service.record_training_data("a:1", "DS")
+    assert "error" not in provenance_service.record_model_lineage("a:1", "m")
+    first = provenance_service.log_action("a:1", "inference")
+    second = provenance_service.log_action("a:1", "inference")
+    assert second["prev_hash"] == first["chain_hash"]
+
+
+def test_record_interaction_does_not_reload_document(monkeypatch, reputation_service):
+    import attestix.services.reputation_service as rs
+
+    _forbid(monkeypatch, rs, "load_reputation")
+
+    result = reputation_service.record_interaction("a:1", "a:2", "success")
+    assert result["recorded"] is True
+    assert result["updated_score"]["total_interactions"] == 1
+
+
+def test_returned_entry_is_not_the_cached_record(provenance_service):
+    entry = provenance_service.log_action("a:1", "inference")
+    entry["action_type"] = "mutated"
+    assert provenance_service.get_audit_trail("a:1")[0]["action_type"] == "inference"
+
+
+def test_per_agent_reads_do_not_reload_document(
+    monkeypatch, provenance_service, reputation_service
+):
+    import attestix.services.provenance_service as ps
+    import attestix.services.reputation_service as rs
+
+    _forbid(monkeypatch, ps, "load_provenance")
+    _forbid(monkeypatch, rs, "load_reputation")
+
+    provenance_service.record_training_data("a:1", "DS")
+    provenance_service.log_action("a:1", "inference")
+    provenance_service.log_action("a:2", "inference")
+    reputation_service.record_interaction("a:1", "a:2", "success")
+    reputation_service.record_interaction("a:2", "a:1", "failure")
+
+    assert len(provenance_service.get_audit_trail("a:1")) == 1
+    assert provenance_service.get_provenance("a:1")["audit_chain_count_legacy"] == 1
+    assert reputation_service.get_reputation("a:2")["total_interactions"] == 1
+    assert {r["agent_id"] for r in reputation_service.query_reputation()} == {"a:1", "a:2"}
+
+
+def test_batch_ingest_pays_one_signature_regardless_of_size():
+    from attestix.services.provenance_service import ProvenanceService
+    from attestix.signing import InProcessSigner
+
+    class CountingSigner(InProcessSigner):
+        calls = 0
+
+        def sign(self, payload):
+            CountingSigner.calls += 1
+            return super().sign(payload)
+
+        def sign_bytes(self, canonical):
+            CountingSigner.calls += 1
+            return super().sign_bytes(canonical)
+
+    svc = ProvenanceService(signer=CountingSigner())
+    entries = svc.record_training_data_batch(
+        [{"agent_id": "a:1", "dataset_name": f"DS{i}"} for i in range(200)]
+    )
+    assert len(entries) == 200
+    assert CountingSigner.calls == 1
+
+    svc.log_actions_batch(
+        [{"agent_id": f"a:{i % 7}", "action_type": "inference"} for i in range(200)]
+    )
+    assert CountingSigner.calls == 2
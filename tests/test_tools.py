@@ -20,8 +20,8 @@ class TestToolRegistration:
 
     def test_tools_registered(self):
         tools = mcp._tool_manager._tools
-        assert len(tools) >= 47, (
-            f"Expected at least 47 tools, got {len(tools)}"
+        assert len(tools) >= 56, (
+            f"Expected at least 56 tools, got {len(tools)}"
         )
 
     def test_all_tools_are_async(self):
@@ -131,6 +131,25 @@ class TestNotFoundPattern:
         assert "error" in data
 
 
+class TestMalformedStore:
+    """Tools return an error object, not an exception, for a malformed store."""
+
+    @pytest.mark.asyncio
+    async def test_get_audit_trail_count(self, tmp_attestix):
+        (tmp_attestix / "provenance.json").write_text('{"entries": []}')
+        data = json.loads(await get_tool_func("get_audit_trail_count")(agent_id="a:1"))
+        assert "error" in data
+        assert "count" not in data
+
+    @pytest.mark.asyncio
+    async def test_get_agent_snapshot(self, tmp_attestix):
+        (tmp_attestix / "credentials.json").write_text(
+            '{"credentials": [{"credentialSubject": "a:1"}]}'
+        )
+        data = json.loads(await get_tool_func("get_agent_snapshot")(agent_id="a:1"))
+        assert "error" in data["credentials_count"]
+
+
 class TestCsvSplitting:
     """Tools that accept CSV strings split them correctly."""
 
@@ -143,3 +162,103 @@ class TestCsvSplitting:
         )
         data = json.loads(result)
         assert data["capabilities"] == ["read", "write", "admin"]
+
+
+class TestBulkTools:
+    """JSON-array bulk tools reject payloads that are not arrays."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("name,param", [
+        ("record_interactions", "interactions_json"),
+        ("log_actions", "actions_json"),
+        ("verify_credentials", "credentials_json"),
+        ("create_agent_identities", "identities_json"),
+        ("record_training_datasets", "datasets_json"),
+    ])
+    async def test_rejects_non_array(self, name, param):
+        fn = get_tool_func(name)
+        for payload in ("not json", '{"agent_id": "a:1"}'):
+            data = json.loads(await fn(**{param: payload}))
+            assert "error" in data
+
+
+class TestVerifyCredentialExternal:
+    """verify_credential_external accepts a JSON string or a parsed object."""
+
+    @pytest.mark.asyncio
+    async def test_dict_and_string_agree(self):
+        agent = json.loads(await get_tool_func("create_agent_identity")(display_name="Bot"))
+        cred = json.loads(await get_tool_func("issue_credential")(
+            agent_id=agent["agent_id"], credential_type="AgentCertification",
+            issuer_name="Test", claims_json='{"level": 1}',
+        ))
+        verify = get_tool_func("verify_credential_external")
+        from_dict = json.loads(await verify(credential_json=cred))
+        from_str = json.loads(await verify(credential_json=json.dumps(cred)))
+        assert from_dict == from_str
+        assert from_dict["valid"] is True
+
+        batch = json.loads(await get_tool_func("verify_credentials")(credentials_json=[cred]))
+        assert batch == [from_dict]
+
+    @pytest.mark.asyncio
+    async def test_verify_credentials_batch_by_id(self):
+        agent = json.loads(await get_tool_func("create_agent_identity")(display_name="Bot"))
+        cred = json.loads(await get_tool_func("issue_credential")(
+            agent_id=agent["agent_id"], credential_type="AgentCertification",
+            issuer_name="Test", claims_json='{"level": 1}',
+        ))
+        single = json.loads(await get_tool_func("verify_credential")(credential_id=cred["id"]))
+        batch = json.loads(await get_tool_func("verify_credentials_batch")(
+            credential_ids=f"{cred['id']}, urn:uuid:missing",
+        ))
+        assert batch[0] == single
+        assert batch[1]["checks"] == {"exists": False}
+
+        empty = json.loads(await get_tool_func("verify_credentials_batch")(credential_ids=" , "))
+        assert "error" in empty
+
+    @pytest.mark.asyncio
+    async def test_list_credentials_many_groups_by_agent(self):
+        agents = [
+            json.loads(await get_tool_func("create_agent_identity")(display_name=name))["agent_id"]
+            for name in ("Bot A", "Bot B")
+        ]
+        for agent_id in agents:
+            await get_tool_func("issue_credential")(
+                agent_id=agent_id, credential_type="AgentCertification",
+                issuer_name="Test", claims_json='{"level": 1}',
+            )
+        many = json.loads(await get_tool_func("list_credentials_many")(agent_ids=",".join(agents)))
+        assert list(many) == agents
+        for agent_id in agents:
+            single = json.loads(await get_tool_func("list_credentials")(agent_id=agent_id))
+            assert many[agent_id] == single
+
+        empty = json.loads(await get_tool_func("list_credentials_many")(agent_ids=" , "))
+        assert "error" in empty
+
+
+class TestAgentSnapshot:
+    """get_agent_snapshot returns every section for an agent in one call."""
+
+    @pytest.mark.asyncio
+    async def test_snapshot_before_and_after_purge(self):
+        created = json.loads(await get_tool_func("create_agent_identity")(display_name="Bot"))
+        agent_id = created["agent_id"]
+        snapshot = get_tool_func("get_agent_snapshot")
+
+        before = json.loads(await snapshot(agent_id=agent_id))
+        assert before["identity"]["agent_id"] == agent_id
+        assert before["compliance"] is None
+        assert before["credentials_count"] == 0
+
+        await get_tool_func("purge_agent_data")(agent_id=agent_id)
+        after = json.loads(await snapshot(agent_id=agent_id))
+        assert after["identity"] is None
+        assert after["provenance"]["audit_log_count"] == 0
+
+    @pytest.mark.asyncio
+    async def test_empty_agent_id(self):
+        data = json.loads(await get_tool_func("get_agent_snapshot")(agent_id=""))
+        assert "error" in data
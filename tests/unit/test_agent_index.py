@@ -0,0 +1,95 @@
+"""Tests for the per-agent secondary index in storage/agent_index.py."""
+
+import pytest
+
+from attestix.storage.agent_index import AgentIndex
+
+
+class TestAgentIndex:
+    """Tests for incremental sync and rebuild of AgentIndex."""
+
+    def test_groups_records_by_agent_in_order(self):
+        records = [
+            {"agent_id": "a", "n": 1},
+            {"agent_id": "b", "n": 2},
+            {"agent_id": "a", "n": 3},
+        ]
+        index = AgentIndex().sync(records)
+        assert [r["n"] for r in index.get("a")] == [1, 3]
+        assert [r["n"] for r in index.get("b")] == [2]
+        assert index.get("missing") == []
+        assert set(index.agents()) == {"a", "b"}
+
+    def test_indexes_only_appended_tail(self):
+        records = [{"agent_id": "a", "n": 1}]
+        index = AgentIndex().sync(records)
+        first = index.get("a")
+        records.append({"agent_id": "a", "n": 2})
+        index.sync(records)
+        assert index.get("a") is first
+        assert [r["n"] for r in index.get("a")] == [1, 2]
+
+    def test_rebuilds_for_new_list_object(self):
+        index = AgentIndex().sync([{"agent_id": "a"}])
+        index.sync([{"agent_id": "b"}])
+        assert index.get("a") == []
+        assert len(index.get("b")) == 1
+
+    def test_rebuilds_when_list_shrinks(self):
+        records = [{"agent_id": "a"}, {"agent_id": "b"}]
+        index = AgentIndex().sync(records)
+        del records[0]
+        index.sync(records)
+        assert index.get("a") == []
+        assert len(index.get("b")) == 1
+
+
+class TestAgentIndexRange:
+    """Tests for bisected order_by windows in AgentIndex.range."""
+
+    def _records(self, *stamps):
+        return [{"agent_id": "a", "timestamp": ts} for ts in stamps]
+
+    def test_inclusive_window(self):
+        index = AgentIndex(order_by="timestamp").sync(
+            self._records("2026-01-01", "2026-02-01", "2026-03-01")
+        )
+        window = index.range("a", "2026-02-01", "2026-03-01")
+        assert [r["timestamp"] for r in window] == ["2026-02-01", "2026-03-01"]
+        assert len(index.range("a")) == 3
+        assert index.range("a", start="2027") == []
+
+    def test_out_of_order_agent_falls_back_to_scan(self):
+        index = AgentIndex(order_by="timestamp").sync(
+            self._records("2026-03-01", "2026-01-01", "2026-02-01")
+        )
+        window = index.range("a", "2026-01-15", "2026-02-15")
+        assert [r["timestamp"] for r in window] == ["2026-02-01"]
+
+    def test_missing_then_present_timestamp_does_not_break_sync(self):
+        records = [{"agent_id": "x"}, {"agent_id": "x", "timestamp": "2026-01-01"}]
+        index = AgentIndex(order_by="timestamp").sync(records)
+        records.append({"agent_id": "other", "timestamp": "2026-01-02"})
+        index.sync(records)
+        assert len(index.range("x")) == 2
+        assert [r["timestamp"] for r in index.range("x", start="2026-01-01")] == ["2026-01-01"]
+        assert len(index.range("other", "2026-01-01", "2026-12-31")) == 1
+
+    def test_none_timestamp_value_is_scanned(self):
+        index = AgentIndex(order_by="timestamp").sync(
+            self._records("2026-01-01", None, "2026-02-01")
+        )
+        window = index.range("a", start="2026-01-15")
+        assert [r["timestamp"] for r in window] == ["2026-02-01"]
+
+    def test_failed_sync_rebuilds_without_duplicates(self):
+        records = [{"agent_id": "a"}, "not-a-record"]
+        index = AgentIndex()
+        with pytest.raises(AttributeError):
+            index.sync(records)
+        records[1] = {"agent_id": "a"}
+        assert len(index.sync(records).get("a")) == 2
+
+    def test_range_requires_order_by(self):
+        with pytest.raises(ValueError):
+            AgentIndex().range("a")
@@ -1,5 +1,7 @@
 """Tests for Ed25519 key operations, signing, and verification in auth/crypto.py."""
 
+import pytest
+
 from attestix.auth.crypto import (
     generate_ed25519_keypair,
     private_key_to_bytes,
@@ -10,8 +12,10 @@ from attestix.auth.crypto import (
     verify_signature,
     public_key_to_did_key,
     did_key_to_public_key,
+    sign_bytes,
     sign_json_payload,
     verify_json_signature,
+    canonicalize_json,
     load_or_create_signing_key,
     _normalize_for_signing,
 )
@@ -39,6 +43,14 @@ class TestKeypairGeneration:
         restored = public_key_from_bytes(raw)
         assert public_key_to_bytes(restored) == raw
 
+    def test_public_key_from_bytes_is_memoized(self):
+        _, pub = generate_ed25519_keypair()
+        raw = public_key_to_bytes(pub)
+        first = public_key_from_bytes(raw)
+        assert public_key_from_bytes(bytearray(raw)) is first
+        with pytest.raises(ValueError):
+            public_key_from_bytes(raw[:31])
+
 
 class TestSignVerify:
     """Tests for Ed25519 message signing and signature verification."""
@@ -112,6 +124,13 @@ class TestJsonSigning:
         sig = sign_json_payload(priv, payload_a)
         assert verify_json_signature(pub, payload_b, sig)
 
+    def test_sign_bytes_matches_sign_json_payload(self):
+        priv, pub = generate_ed25519_keypair()
+        payload = {"name": "caf\u00e9", "score": 0.5}
+        sig = sign_bytes(priv, canonicalize_json(payload))
+        assert sig == sign_json_payload(priv, payload)
+        assert verify_json_signature(pub, payload, sig)
+
 
 class TestNormalize:
     """Tests for Unicode NFC normalization of signing inputs."""
@@ -145,3 +164,19 @@ class TestLoadOrCreateSigningKey:
         priv2, did2 = load_or_create_signing_key(key_file)
         assert did1 == did2
         assert private_key_to_bytes(priv1) == private_key_to_bytes(priv2)
+
+    def test_default_path_follows_config(self, tmp_attestix, session_signing_key_file):
+        from attestix import config
+
+        _, did = load_or_create_signing_key()
+        assert config.SIGNING_KEY_FILE.parent == tmp_attestix
+        _, session_did = load_or_create_signing_key(session_signing_key_file)
+        assert did == session_did
+
+    @pytest.mark.fresh_signing_key
+    def test_fresh_signing_key_marker_starts_without_key(self, tmp_attestix):
+        from attestix import config
+
+        assert not config.SIGNING_KEY_FILE.exists()
+        load_or_create_signing_key()
+        assert config.SIGNING_KEY_FILE.exists()
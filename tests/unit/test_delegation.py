@@ -63,6 +63,92 @@ class TestVerifyDelegation:
         result = delegation_service.verify_delegation(tampered)
         assert result["valid"] is False
 
+    def test_repeat_verify_hits_token_cache(self, delegation_service):
+        from attestix.services import delegation_service as module
+
+        created = delegation_service.create_delegation(
+            issuer_agent_id="attestix:issuer",
+            audience_agent_id="attestix:audience",
+            capabilities=["read"],
+        )
+        module.clear_token_cache()
+        first = delegation_service.verify_delegation(created["token"])
+        second = delegation_service.verify_delegation(created["token"])
+        assert first == second
+        info = module.token_cache_info()
+        assert (info["misses"], info["hits"]) == (1, 1)
+
+    def test_freshly_issued_token_verifies_without_decode(self, delegation_service):
+        from attestix.services import delegation_service as module
+
+        module.clear_token_cache()
+        created = delegation_service.create_delegation(
+            issuer_agent_id="attestix:issuer",
+            audience_agent_id="attestix:audience",
+            capabilities=("read",),
+        )
+        result = delegation_service.verify_delegation(created["token"])
+        assert result["valid"] is True
+        assert result["capabilities"] == ["read"]
+        assert module.token_cache_info()["misses"] == 0
+
+        # Same claims as a cold decode of the token.
+        module.clear_token_cache()
+        assert delegation_service.verify_delegation(created["token"]) == result
+
+    def test_cached_token_still_checks_revocation_and_expiry(self, delegation_service):
+        import time as time_mod
+        from unittest.mock import patch
+
+        created = delegation_service.create_delegation(
+            issuer_agent_id="attestix:issuer",
+            audience_agent_id="attestix:audience",
+            capabilities=["read"],
+            expiry_hours=1,
+        )
+        token = created["token"]
+        assert delegation_service.verify_delegation(token)["valid"] is True
+
+        later = time_mod.time() + 2 * 3600
+        with patch("attestix.services.delegation_service.time.time", return_value=later):
+            expired = delegation_service.verify_delegation(token)
+        assert expired == {"valid": False, "reason": "Token has expired"}
+
+        delegation_service.revoke_delegation(created["delegation"]["jti"])
+        assert delegation_service.verify_delegation(token)["valid"] is False
+
+    def test_verify_delegations_matches_single_verify(self, delegation_service):
+        from unittest.mock import patch
+
+        from attestix.config import load_delegations
+
+        kept = delegation_service.create_delegation("a:1", "a:2", ["read"])
+        revoked = delegation_service.create_delegation("a:1", "a:3", ["read"])
+        delegation_service.revoke_delegation(revoked["delegation"]["jti"])
+        tokens = [kept["token"], revoked["token"], "not.a.token"]
+
+        expected = [delegation_service.verify_delegation(t) for t in tokens]
+        with patch(
+            "attestix.services.delegation_service.load_delegations",
+            wraps=load_delegations,
+        ) as loader:
+            results = delegation_service.verify_delegations(tokens)
+        assert results == expected
+        assert [r["valid"] for r in results] == [True, False, False]
+        assert loader.call_count == 1
+
+    def test_verify_delegations_store_failure_fills_every_slot(self, delegation_service):
+        from unittest.mock import patch
+
+        with patch(
+            "attestix.services.delegation_service.load_delegations",
+            side_effect=OSError("disk"),
+        ):
+            results = delegation_service.verify_delegations(["a", "b", "c"])
+        assert len(results) == 3
+        assert all(r["valid"] is False for r in results)
+        assert results[0] is not results[1]
+
 
 class TestListDelegations:
     """Tests for listing and filtering delegations by issuer or audience."""
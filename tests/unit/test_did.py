@@ -1,5 +1,7 @@
 """Tests for DID resolution and creation in services/did_service.py."""
 
+import stat
+import sys
 from unittest.mock import patch, MagicMock
 
 import pytest
@@ -23,6 +25,22 @@ class TestCreateDidKey:
         assert vm["type"] == "Ed25519VerificationKey2020"
         assert "publicKeyMultibase" in vm
 
+    def test_context_is_not_shared_between_documents(self, did_service):
+        from attestix.services.did_service import DID_CONTEXT
+
+        first = did_service.create_did_key()["did_document"]
+        first["@context"].append("https://example.com/mutated")
+        second = did_service.create_did_key()["did_document"]
+        assert second["@context"] == list(DID_CONTEXT)
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="POSIX permissions only")
+    def test_keypair_store_written_atomically_owner_only(self, did_service, tmp_attestix):
+        did_service.create_did_key()
+        keypair_file = tmp_attestix / ".keypairs.json"
+        assert keypair_file.exists()
+        assert not (tmp_attestix / ".keypairs.json.tmp").exists()
+        assert stat.S_IMODE(keypair_file.stat().st_mode) == 0o600
+
 
 class TestResolveDidKey:
     """Tests for resolving did:key identifiers to DID documents."""
@@ -74,6 +92,59 @@ class TestResolveDidWeb:
         assert "error" in result
 
 
+class TestDidResolutionCache:
+    """Tests for the process-wide cache of remotely resolved DID Documents."""
+
+    def _fake_fetch(self, monkeypatch, calls):
+        from attestix.services import did_service as mod
+
+        def fake_fetch_json_pinned(url, max_bytes=None, timeout=10.0, headers=None):
+            calls.append(url)
+            return None, {"id": "did:web:example.com", "n": len(calls)}
+
+        monkeypatch.setattr(mod, "validate_url_host", lambda host: None)
+        monkeypatch.setattr(mod, "fetch_json_pinned", fake_fetch_json_pinned)
+        mod.clear_did_cache()
+        return mod
+
+    def test_repeat_resolution_is_served_from_cache(self, did_service, monkeypatch):
+        calls = []
+        mod = self._fake_fetch(monkeypatch, calls)
+        first = did_service.resolve_did("did:web:example.com")
+        first["n"] = "mutated"
+        second = did_service.resolve_did("did:web:example.com")
+        assert len(calls) == 1
+        assert second["n"] == 1
+        assert mod.did_cache_info()["hits"] == 1
+
+    def test_create_did_web_invalidates_entry(self, did_service, monkeypatch):
+        calls = []
+        self._fake_fetch(monkeypatch, calls)
+        did_service.resolve_did("did:web:example.com")
+        did_service.create_did_web("example.com")
+        did_service.resolve_did("did:web:example.com")
+        assert len(calls) == 2
+
+    def test_ttl_is_read_from_config_per_call(self, did_service, monkeypatch):
+        from attestix import config
+
+        calls = []
+        mod = self._fake_fetch(monkeypatch, calls)
+        monkeypatch.setattr(config, "DID_CACHE_TTL", 0.0)
+        did_service.resolve_did("did:web:example.com")
+        did_service.resolve_did("did:web:example.com")
+        assert len(calls) == 2
+        assert mod.did_cache_info()["ttl"] == 0.0
+
+    def test_errors_are_not_cached(self, did_service):
+        from attestix.services.did_service import clear_did_cache, did_cache_info
+
+        clear_did_cache()
+        did_service.resolve_did("did:web:localhost")
+        did_service.resolve_did("did:web:localhost")
+        assert did_cache_info()["size"] == 0
+
+
 class TestResolveUniversal:
     """Tests for universal DID resolution with format validation."""
 
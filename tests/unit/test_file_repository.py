@@ -0,0 +1,79 @@
+"""Tests for fast-mode flush bounds and thread safety in storage/file_repository.py."""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from attestix import config
+from attestix.storage.file_repository import FileRepository
+
+
+def _write(repo, n):
+    repo.save_document("anchors", {"anchors": [{"anchor_id": f"a{n}"}]})
+
+
+class TestFastModeFlushBounds:
+    """Tests for max_batch_writes / max_batch_delay_ms in fast durability."""
+
+    def test_unbounded_fast_mode_defers_until_flush(self, tmp_attestix):
+        repo = FileRepository(durability="fast")
+        for n in range(5):
+            _write(repo, n)
+        assert not config.ANCHORS_FILE.exists()
+        repo.flush()
+        assert config.ANCHORS_FILE.exists()
+
+    def test_flushes_after_max_batch_writes(self, tmp_attestix):
+        repo = FileRepository(durability="fast", max_batch_writes=3)
+        _write(repo, 0)
+        _write(repo, 1)
+        assert not config.ANCHORS_FILE.exists()
+        _write(repo, 2)
+        assert config.ANCHORS_FILE.exists()
+
+    def test_flushes_once_max_batch_delay_elapsed(self, tmp_attestix):
+        repo = FileRepository(durability="fast", max_batch_delay_ms=20)
+        _write(repo, 0)
+        assert not config.ANCHORS_FILE.exists()
+        time.sleep(0.05)
+        _write(repo, 1)
+        assert config.ANCHORS_FILE.exists()
+
+    def test_bounds_read_from_environment(self, tmp_attestix, monkeypatch):
+        monkeypatch.setenv("ATTESTIX_FLUSH_MAX_WRITES", "1")
+        repo = FileRepository(durability="fast")
+        _write(repo, 0)
+        assert config.ANCHORS_FILE.exists()
+
+    @pytest.mark.parametrize("kwargs", [{"max_batch_writes": 0}, {"max_batch_delay_ms": -5}])
+    def test_rejects_non_positive_bounds(self, kwargs):
+        with pytest.raises(ValueError):
+            FileRepository(durability="fast", **kwargs)
+
+
+class TestThreadSafety:
+    """Concurrent writers sharing one repository must not drop records."""
+
+    def test_concurrent_appends_are_all_kept(self, tmp_attestix):
+        repo = FileRepository()
+        with ThreadPoolExecutor(max_workers=8) as ex:
+            list(ex.map(
+                lambda n: repo.append_to_document("anchors", {"anchor_id": f"a{n}"}),
+                range(64),
+            ))
+        stored = repo.load_document("anchors")["anchors"]
+        assert sorted(r["anchor_id"] for r in stored) == sorted(f"a{n}" for n in range(64))
+
+    def test_concurrent_updates_are_serialized(self, tmp_attestix):
+        repo = FileRepository()
+
+        def _bump(_):
+            repo.update_document(
+                "reputation",
+                lambda data: data.__setitem__("count", data.get("count", 0) + 1),
+            )
+
+        with ThreadPoolExecutor(max_workers=8) as ex:
+            list(ex.map(_bump, range(50)))
+        assert repo.load_document("reputation")["count"] == 50
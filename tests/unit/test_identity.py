@@ -2,6 +2,8 @@
 
 from datetime import datetime, timedelta, timezone
 
+import pytest
+
 
 class TestCreateIdentity:
     """Tests for creating agent identities with required and optional fields."""
@@ -43,6 +45,41 @@ class TestCreateIdentity:
         assert token.endswith("7890")
 
 
+class TestCreateIdentitiesBatch:
+    """Tests for creating several identities with one write."""
+
+    def test_creates_all_in_order(self, identity_service):
+        created = identity_service.create_identities_batch([
+            {"display_name": "A", "source_protocol": "mcp"},
+            {"display_name": "B", "source_protocol": "a2a", "capabilities": ["read"]},
+        ])
+        assert [u["display_name"] for u in created] == ["A", "B"]
+        assert created[1]["capabilities"] == ["read"]
+        for uait in created:
+            assert identity_service.verify_identity(uait["agent_id"])["valid"] is True
+
+    def test_bad_item_rejects_whole_batch(self, identity_service):
+        with pytest.raises(ValueError, match="item 1"):
+            identity_service.create_identities_batch([
+                {"display_name": "A", "source_protocol": "mcp"},
+                {"display_name": "   ", "source_protocol": "mcp"},
+            ])
+        assert identity_service.list_identities() == []
+
+    def test_unknown_field_is_named(self, identity_service):
+        with pytest.raises(ValueError) as exc:
+            identity_service.create_identities_batch([
+                {"display_name": "A", "source_protocol": "mcp"},
+                {"display_name": "B", "source_protocol": "mcp", "bogus": 1},
+            ])
+        assert str(exc.value) == "item 1: unknown field 'bogus'"
+        assert identity_service.list_identities() == []
+
+    def test_missing_required_field_is_named(self, identity_service):
+        with pytest.raises(ValueError, match="item 0: missing required field 'source_protocol'"):
+            identity_service.create_identities_batch([{"display_name": "A"}])
+
+
 class TestGetIdentity:
     """Tests for retrieving agent identities by ID."""
 
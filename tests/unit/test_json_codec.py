@@ -0,0 +1,38 @@
+"""Tests for the optional-orjson document codec in attestix/_json.py."""
+
+import json
+
+from attestix import _json, config
+
+
+class TestDocumentCodec:
+    """Stored documents round-trip identically under either JSON backend."""
+
+    def test_dumps_document_is_indented_valid_json(self):
+        doc = {"agents": [{"name": "café", "n": 2**70, "score": 1e-05}]}
+        raw = _json.dumps_document(doc)
+        assert isinstance(raw, bytes)
+        assert raw.startswith(b'{\n  "agents"')
+        assert json.loads(raw) == doc
+
+    def test_dumps_is_compact_text_with_default(self):
+        from decimal import Decimal
+
+        doc = {"n": 2**70, "d": Decimal("1.5"), "s": "café"}
+        text = _json.dumps(doc, default=str)
+        assert isinstance(text, str)
+        assert "\n" not in text
+        assert json.loads(text) == {"n": 2**70, "d": "1.5", "s": "café"}
+
+    def test_safe_save_then_load_round_trips(self, tmp_path):
+        path = tmp_path / "doc.json"
+        doc = {"interactions": [{"agent_id": "a:1", "epoch": 1}], "scores": {}}
+        config._safe_save(path, doc)
+        assert config._safe_load(path, {"interactions": []}) == doc
+
+    def test_corrupted_document_recovers_from_backup(self, tmp_path):
+        path = tmp_path / "doc.json"
+        config._safe_save(path, {"entries": [1]})
+        config._safe_save(path, {"entries": [1, 2]})
+        path.write_bytes(b"{not json")
+        assert config._safe_load(path, {"entries": []}) == {"entries": [1]}
@@ -95,3 +95,30 @@ class TestComputeMerkleRoot:
         r1, _ = compute_merkle_root(entries)
         r2, _ = compute_merkle_root(entries)
         assert r1 == r2
+
+
+class TestMerkleProof:
+    """Tests for inclusion proofs over trees with paired and promoted nodes."""
+
+    @pytest.mark.parametrize("n", [1, 2, 3, 5, 8, 13])
+    def test_every_leaf_reconstructs_root(self, n):
+        from attestix.blockchain.merkle import merkle_proof, root_from_proof
+
+        leaves = [hash_leaf({"i": i}) for i in range(n)]
+        root, levels = build_merkle_tree(leaves)
+        for i, leaf in enumerate(leaves):
+            assert root_from_proof(leaf, merkle_proof(levels, i)) == root
+
+    def test_wrong_leaf_does_not_reconstruct_root(self):
+        from attestix.blockchain.merkle import merkle_proof, root_from_proof
+
+        leaves = [hash_leaf({"i": i}) for i in range(4)]
+        root, levels = build_merkle_tree(leaves)
+        assert root_from_proof(hash_leaf({"i": 99}), merkle_proof(levels, 1)) != root
+
+    def test_out_of_range_index(self):
+        from attestix.blockchain.merkle import merkle_proof
+
+        _, levels = build_merkle_tree([hash_leaf({"i": 0})])
+        with pytest.raises(IndexError):
+            merkle_proof(levels, 1)
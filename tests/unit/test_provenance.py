@@ -174,3 +174,195 @@ class TestAuditTrail:
             provenance_service.log_action("a:1", "inference")
         results = provenance_service.get_audit_trail("a:1", limit=3)
         assert len(results) == 3
+
+    def test_limit_keeps_most_recent_in_chronological_order(self, provenance_service):
+        logged = [provenance_service.log_action("a:1", "inference") for _ in range(5)]
+        results = provenance_service.get_audit_trail("a:1", limit=2)
+        assert [r["log_id"] for r in results] == [e["log_id"] for e in logged[-2:]]
+
+    def test_filters_by_date_window(self, provenance_service):
+        entries = [provenance_service.log_action("a:1", "inference") for _ in range(3)]
+        start, end = entries[1]["timestamp"], entries[1]["timestamp"]
+        results = provenance_service.get_audit_trail("a:1", start_date=start, end_date=end)
+        assert [r["log_id"] for r in results] == [entries[1]["log_id"]]
+        assert provenance_service.get_audit_trail("a:1", start_date="2999") == []
+        assert len(provenance_service.get_audit_trail("a:1", end_date="2999")) == 3
+
+    def test_entries_carry_epoch_and_accept_epoch_bounds(self, provenance_service):
+        entry = provenance_service.log_action("a:1", "inference")
+        epoch = entry["epoch"]
+        assert isinstance(epoch, int)
+        assert len(provenance_service.get_audit_trail("a:1", start_date=epoch, end_date=epoch)) == 1
+        assert provenance_service.get_audit_trail("a:1", end_date=epoch - 1) == []
+
+    def test_offset_bounds_are_normalized_to_utc(self, provenance_service):
+        provenance_service.log_action("a:1", "inference")
+        # Same instant as 2000-01-01T00:00:00Z, written with a +05:00 offset.
+        results = provenance_service.get_audit_trail(
+            "a:1", start_date="2000-01-01T05:00:00+05:00"
+        )
+        assert len(results) == 1
+        assert provenance_service.get_audit_trail("a:1", end_date="2000-01-01T00:00:00Z") == []
+
+    def test_count_matches_filters_without_limit(self, provenance_service):
+        for _ in range(60):
+            provenance_service.log_action("a:1", "inference")
+        provenance_service.log_action("a:1", "delegation")
+        provenance_service.log_action("a:2", "inference")
+        assert provenance_service.count_audit_trail("a:1") == 61
+        assert provenance_service.count_audit_trail("a:1", action_type="delegation") == 1
+        assert provenance_service.count_audit_trail("a:1", start_date="2999") == 0
+        assert provenance_service.count_audit_trail("a:3") == 0
+
+    def test_count_returns_error_for_malformed_store(self, provenance_service, tmp_attestix):
+        (tmp_attestix / "provenance.json").write_text('{"entries": []}')
+        result = provenance_service.count_audit_trail("a:1")
+        assert "error" in result
+
+
+class TestBatchSigning:
+    """Tests for Merkle-batched provenance writes and entry verification."""
+
+    def test_single_entry_signature_verifies(self, provenance_service):
+        entry = provenance_service.record_training_data("a:1", "Dataset1")
+        assert provenance_service.verify_entry_signature(entry) is True
+
+    def test_training_data_batch_shares_one_root(self, provenance_service):
+        from attestix.services.provenance_service import BATCH_SIGNATURE_TYPE
+
+        entries = provenance_service.record_training_data_batch([
+            {"agent_id": "a:1", "dataset_name": f"Dataset{i}"} for i in range(5)
+        ])
+        assert len(entries) == 5
+        roots = {e["signature"]["root"] for e in entries}
+        assert len(roots) == 1
+        for e in entries:
+            assert e["signature"]["type"] == BATCH_SIGNATURE_TYPE
+            assert provenance_service.verify_entry_signature(e) is True
+
+        result = provenance_service.get_provenance("a:1")
+        assert len(result["training_data"]) == 5
+
+    def test_batch_source_alias(self, provenance_service):
+        entries = provenance_service.record_training_data_batch([
+            {"agent_id": "a:1", "dataset_name": "DS", "source": "https://x.example/ds"},
+        ])
+        assert entries[0]["source_url"] == "https://x.example/ds"
+
+    def test_tampered_batch_entry_fails(self, provenance_service):
+        entries = provenance_service.record_training_data_batch([
+            {"agent_id": "a:1", "dataset_name": "A"},
+            {"agent_id": "a:1", "dataset_name": "B"},
+            {"agent_id": "a:1", "dataset_name": "C"},
+        ])
+        tampered = dict(entries[1], dataset_name="Z")
+        assert provenance_service.verify_entry_signature(tampered) is False
+        assert provenance_service.verify_entry_signature(entries[2]) is True
+
+    def test_batch_root_verified_once_per_batch(self, provenance_service):
+        from attestix.services import sig_cache
+
+        sig_cache.clear_sig_cache()
+        entries = provenance_service.record_training_data_batch([
+            {"agent_id": "a:1", "dataset_name": f"DS{i}"} for i in range(4)
+        ])
+        assert all(provenance_service.verify_entry_signature(e) for e in entries)
+        info = sig_cache._verify.cache_info()
+        assert (info.misses, info.hits) == (1, 3)
+
+    def test_cached_root_does_not_mask_forged_signature(self, provenance_service):
+        entries = provenance_service.record_training_data_batch([
+            {"agent_id": "a:1", "dataset_name": "A"},
+            {"agent_id": "a:1", "dataset_name": "B"},
+        ])
+        assert provenance_service.verify_entry_signature(entries[0]) is True
+        forged = dict(entries[1], signature=dict(entries[1]["signature"], sig="A" * 86 + "=="))
+        assert provenance_service.verify_entry_signature(forged) is False
+
+    def test_log_actions_batch_chains_like_sequential_calls(self, provenance_service):
+        first = provenance_service.log_action("a:1", "inference")
+        entries = provenance_service.log_actions_batch([
+            {"agent_id": "a:1", "action_type": "inference"},
+            {"agent_id": "a:2", "action_type": "data_access"},
+            {"agent_id": "a:1", "action_type": "delegation"},
+        ])
+        assert entries[0]["prev_hash"] == first["chain_hash"]
+        assert entries[1]["prev_hash"] == provenance_service.GENESIS_HASH
+        assert entries[2]["prev_hash"] == entries[0]["chain_hash"]
+        assert all(provenance_service.verify_entry_signature(e) for e in entries)
+        assert len(provenance_service.get_audit_trail("a:1")) == 3
+
+    def test_log_actions_batch_rejects_invalid_type(self, provenance_service):
+        result = provenance_service.log_actions_batch([
+            {"agent_id": "a:1", "action_type": "inference"},
+            {"agent_id": "a:1", "action_type": "bogus"},
+        ])
+        assert "error" in result[0]
+        assert provenance_service.get_audit_trail("a:1") == []
+
+
+class TestLazySigner:
+    """The default signing key is loaded on first sign, not at construction."""
+
+    def test_reads_do_not_load_signing_key(self, monkeypatch):
+        import attestix.services.provenance_service as ps
+
+        def _no_key(*args, **kwargs):
+            raise AssertionError("signing key loaded on a read path")
+
+        monkeypatch.setattr(ps, "InProcessSigner", _no_key)
+        svc = ps.ProvenanceService()
+        assert svc.get_audit_trail("a:1") == []
+        assert svc.get_provenance("a:1")["audit_chain_count_legacy"] == 0
+        assert "error" in svc.log_action("a:1", "inference")
+
+    def test_key_loaded_once_per_instance(self, monkeypatch):
+        import attestix.services.provenance_service as ps
+
+        calls = []
+        real = ps.InProcessSigner
+
+        def _counting():
+            calls.append(1)
+            return real()
+
+        monkeypatch.setattr(ps, "InProcessSigner", _counting)
+        svc = ps.ProvenanceService()
+        svc.log_action("a:1", "inference")
+        svc.log_action("a:1", "inference")
+        assert len(calls) == 1
+
+
+class TestExportSubset:
+    """Tests for signed Merkle exports over subsets of an agent's audit log."""
+
+    def test_whole_batch_reuses_ingest_signature(self, provenance_service):
+        entries = provenance_service.log_actions_batch([
+            {"agent_id": "a:1", "action_type": "inference"} for _ in range(3)
+        ])
+        export = provenance_service.export_subset("a:1")
+        assert export["reused_batch_signature"] is True
+        assert export["root"] == entries[0]["signature"]["root"]
+        assert export["sig"] == entries[0]["signature"]["sig"]
+        assert provenance_service.verify_export(export) is True
+
+    def test_subset_is_signed_once_and_verifies(self, provenance_service):
+        provenance_service.log_action("a:1", "inference")
+        provenance_service.log_action("a:1", "data_access")
+        provenance_service.log_action("a:1", "inference")
+        export = provenance_service.export_subset(
+            "a:1", lambda e: e["action_type"] == "inference"
+        )
+        assert export["reused_batch_signature"] is False
+        assert export["leaf_count"] == 2
+        assert provenance_service.verify_export(export) is True
+
+    def test_tampered_export_fails(self, provenance_service):
+        provenance_service.log_action("a:1", "inference")
+        provenance_service.log_action("a:1", "inference")
+        export = provenance_service.export_subset("a:1")
+        export["leaves"][0] = "00" * 32
+        assert provenance_service.verify_export(export) is False
+
+    def test_empty_selection_is_an_error(self, provenance_service):
+        assert "error" in provenance_service.export_subset("a:none")
@@ -21,6 +21,26 @@ class TestRecordInteraction:
         )
         assert "error" in result
 
+    def test_total_interactions_counts_per_agent(self, reputation_service):
+        for _ in range(3):
+            reputation_service.record_interaction("a:1", "a:2", "success")
+            last_other = reputation_service.record_interaction("a:2", "a:1", "success")
+        last = reputation_service.record_interaction("a:1", "a:2", "failure")
+        assert last["updated_score"]["total_interactions"] == 4
+        assert last_other["updated_score"]["total_interactions"] == 3
+
+    def test_outcome_interned_to_code(self, reputation_service):
+        from attestix.services.reputation_service import OUTCOME_LUT, OUTCOME_WEIGHTS
+
+        result = reputation_service.record_interaction("a:1", "a:2", "timeout")
+        code = result["interaction"]["outcome_code"]
+        assert OUTCOME_LUT[code] == OUTCOME_WEIGHTS["timeout"]
+
+    def test_legacy_rows_without_code_score_the_same(self, reputation_service):
+        coded = [{"outcome": "partial", "outcome_code": 1, "epoch": 5}]
+        legacy = [{"outcome": "partial", "epoch": 5}]
+        assert reputation_service._compute_score(coded) == reputation_service._compute_score(legacy)
+
     def test_success_higher_than_failure(self, reputation_service):
         reputation_service.record_interaction("a:1", "a:2", "success")
         score_success = reputation_service.get_reputation("a:1")["trust_score"]
@@ -30,6 +50,27 @@ class TestRecordInteraction:
 
         assert score_success > score_failure
 
+    def test_batch_matches_sequential_calls(self, reputation_service):
+        results = reputation_service.record_interactions_batch([
+            {"agent_id": "a:1", "counterparty_id": "a:2", "outcome": "success"},
+            {"agent_id": "a:2", "counterparty_id": "a:1", "outcome": "failure"},
+            {"agent_id": "a:1", "counterparty_id": "a:2", "outcome": "partial",
+             "category": "task"},
+        ])
+        assert [r["updated_score"]["total_interactions"] for r in results] == [1, 1, 2]
+        assert results[2]["interaction"]["category"] == "task"
+        rep = reputation_service.get_reputation("a:1")
+        assert rep["total_interactions"] == 2
+        assert rep["trust_score"] == results[2]["updated_score"]["trust_score"]
+
+    def test_batch_rejects_invalid_outcome(self, reputation_service):
+        result = reputation_service.record_interactions_batch([
+            {"agent_id": "a:1", "counterparty_id": "a:2", "outcome": "success"},
+            {"agent_id": "a:1", "counterparty_id": "a:2", "outcome": "bogus"},
+        ])
+        assert "error" in result[0]
+        assert reputation_service.get_reputation("a:1")["total_interactions"] == 0
+
 
 class TestGetReputation:
     """Tests for retrieving reputation scores with category breakdowns."""
@@ -67,3 +108,81 @@ class TestQueryReputation:
         results = reputation_service.query_reputation(min_interactions=2)
         assert len(results) == 1
         assert results[0]["agent_id"] == "a:1"
+
+    def test_limit_returns_top_scores(self, reputation_service):
+        # Record low scorers first so insertion order cannot produce the top-K.
+        for i in range(5):
+            reputation_service.record_interaction(f"a:low{i}", "a:x", "failure")
+        reputation_service.record_interaction("a:top", "a:x", "success")
+        reputation_service.record_interaction("a:mid", "a:x", "partial")
+        results = reputation_service.query_reputation(limit=2)
+        assert [r["agent_id"] for r in results] == ["a:top", "a:mid"]
+
+
+class TestIncrementalScore:
+    """Tests for the cached (ws, wt, t0_epoch) score state."""
+
+    def test_cached_state_matches_full_recompute(self, reputation_service):
+        for outcome in ("success", "failure", "partial", "timeout", "success"):
+            reputation_service.record_interaction("a:1", "a:2", outcome)
+        from attestix.config import load_reputation
+
+        data = load_reputation()
+        cached = data["scores"]["a:1"]
+        assert cached["total_interactions"] == 5
+        fresh = reputation_service._compute_score(data["interactions"])
+        assert abs(cached["ws"] / cached["wt"] - fresh) < 1e-9
+        assert reputation_service.get_reputation("a:1")["trust_score"] == round(fresh, 4)
+
+    def test_advance_matches_rebuild_with_spread_epochs(self, reputation_service):
+        history = [
+            {"outcome": "success", "epoch": 1_000},
+            {"outcome": "failure", "epoch": 90_000},
+            {"outcome": "partial", "epoch": 50_000},
+        ]
+        state = reputation_service._score_state(history[:1])
+        for row in history[1:]:
+            state = reputation_service._advance_state(
+                state, {"success": 1.0, "failure": 0.0, "partial": 0.5}[row["outcome"]],
+                row["epoch"],
+            )
+        rebuilt = reputation_service._score_state(history)
+        assert state["t0_epoch"] == rebuilt["t0_epoch"] == 90_000
+        assert abs(state["ws"] - rebuilt["ws"]) < 1e-9
+        assert abs(state["wt"] - rebuilt["wt"]) < 1e-9
+
+    def test_legacy_score_record_is_rebuilt(self, reputation_service):
+        from attestix.config import update_reputation
+
+        reputation_service.record_interaction("a:1", "a:2", "failure")
+        update_reputation(
+            lambda data: data["scores"].update(
+                {"a:1": {"trust_score": 0.0, "total_interactions": 1}}
+            )
+        )
+        result = reputation_service.record_interaction("a:1", "a:2", "success")
+        assert result["updated_score"]["total_interactions"] == 2
+        assert 0.0 < result["updated_score"]["trust_score"] < 1.0
+
+    def test_long_idle_history_does_not_underflow(self, reputation_service):
+        # Decay is taken relative to the newest interaction, so an all-ancient
+        # history still yields its outcome ratio rather than 0/0 -> 0.0.
+        history = [{"outcome": "success", "epoch": 0}, {"outcome": "partial", "epoch": 0}]
+        assert reputation_service._compute_score(history) == 0.75
+
+    def test_scoring_columns_mirror_indexed_rows(self, reputation_service):
+        from attestix.config import read_reputation
+        from attestix.services.reputation_service import _INTERACTIONS_INDEX
+
+        for outcome in ("success", "timeout", "failure"):
+            reputation_service.record_interaction("a:1", "a:2", outcome)
+        reputation_service.record_interaction("a:2", "a:1", "partial")
+
+        def _columns(data):
+            index = _INTERACTIONS_INDEX.sync(data["interactions"])
+            epochs, values = index.columns("a:1")
+            return list(epochs), list(values)
+
+        epochs, values = read_reputation(_columns)
+        assert values == [1.0, 0.2, 0.0]
+        assert len(epochs) == 3 and all(e > 0 for e in epochs)
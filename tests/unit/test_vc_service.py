@@ -1,5 +1,7 @@
 """Tests for W3C Verifiable Credentials in services/credential_service.py."""
 
+from unittest.mock import patch
+
 
 class TestIssueCredential:
     """Tests for issuing verifiable credentials with proofs."""
@@ -60,11 +62,125 @@ class TestVerifyCredential:
         assert result["valid"] is False
         assert result["checks"]["not_revoked"] is False
 
+    def test_verify_by_id_reads_store_once(self, credential_service):
+        from attestix.config import load_credentials
+
+        ids = [
+            credential_service.issue_credential(
+                subject_id="attestix:agent1",
+                credential_type="TestCred",
+                issuer_name="Issuer",
+                claims={"n": n},
+            )["id"]
+            for n in range(3)
+        ]
+        credential_service.revoke_credential(ids[1], "test")
+        ids.append("urn:uuid:nonexistent")
+
+        expected = [credential_service.verify_credential(i) for i in ids]
+        with patch(
+            "attestix.services.credential_service.load_credentials",
+            wraps=load_credentials,
+        ) as loader:
+            results = credential_service.verify_credentials_by_id(ids)
+        assert results == expected
+        assert [r["valid"] for r in results] == [True, False, True, False]
+        assert loader.call_count == 1
+
+    def test_verify_by_id_isolates_unhashable_id(self, credential_service):
+        cred = credential_service.issue_credential("a:1", "T", "I", {"x": 1})
+        results = credential_service.verify_credentials_by_id([cred["id"], ["odd"]])
+        assert len(results) == 2
+        assert results[0]["valid"] is True
+        assert "error" in results[1]
+
+    def test_verify_by_id_store_failure_fills_every_slot(self, credential_service):
+        with patch(
+            "attestix.services.credential_service.load_credentials",
+            side_effect=OSError("disk"),
+        ):
+            results = credential_service.verify_credentials_by_id(["a", "b", "c"])
+        assert len(results) == 3
+        assert all("error" in r for r in results)
+
     def test_nonexistent_credential(self, credential_service):
         result = credential_service.verify_credential("urn:uuid:nonexistent")
         assert result["valid"] is False
         assert result["checks"]["exists"] is False
 
+    def test_repeat_external_verify_hits_signature_cache(self, credential_service):
+        from attestix.services import sig_cache
+
+        cred = credential_service.issue_credential(
+            subject_id="attestix:agent1",
+            credential_type="TestCred",
+            issuer_name="Issuer",
+            claims={"a": 1},
+        )
+        sig_cache.clear_sig_cache()
+        for _ in range(3):
+            assert credential_service.verify_credential_external(cred)["valid"] is True
+        info = sig_cache._verify.cache_info()
+        assert (info.misses, info.hits) == (1, 2)
+
+    def test_cached_signature_does_not_mask_revocation(self, credential_service):
+        cred = credential_service.issue_credential(
+            subject_id="attestix:agent1",
+            credential_type="TestCred",
+            issuer_name="Issuer",
+            claims={"a": 1},
+        )
+        assert credential_service.verify_credential_external(cred)["valid"] is True
+        credential_service.revoke_credential(cred["id"], "test")
+        result = credential_service.verify_credential_external(cred)
+        assert result["valid"] is False
+        assert result["checks"]["signature_valid"] is True
+        assert result["checks"]["not_revoked"] is False
+
+    def test_batch_matches_single_verification(self, credential_service):
+        creds = [
+            credential_service.issue_credential(
+                subject_id="attestix:agent1",
+                credential_type="TestCred",
+                issuer_name="Issuer",
+                claims={"n": n},
+            )
+            for n in range(3)
+        ]
+        credential_service.revoke_credential(creds[1]["id"], "test")
+        batch = credential_service.verify_credentials_external_batch(creds + ["not-a-vc"])
+        assert [r.get("valid") for r in batch[:3]] == [True, False, True]
+        assert batch[:3] == [credential_service.verify_credential_external(c) for c in creds]
+        assert "error" in batch[3]
+
+    def test_batch_isolates_unhashable_id(self, credential_service):
+        cred = credential_service.issue_credential("a:1", "T", "I", {"x": 1})
+        odd = dict(cred, id=["urn:uuid:not-a-string"])
+        batch = credential_service.verify_credentials_external_batch([cred, odd])
+        assert len(batch) == 2
+        assert batch[0]["valid"] is True
+        assert batch[1].get("valid") is not True
+
+    def test_batch_store_failure_fills_every_slot(self, credential_service):
+        with patch(
+            "attestix.services.credential_service.load_credentials",
+            side_effect=OSError("disk"),
+        ):
+            batch = credential_service.verify_credentials_external_batch([{}, {}])
+        assert len(batch) == 2
+        assert all("error" in r for r in batch)
+
+    def test_cached_signature_does_not_mask_tampering(self, credential_service):
+        cred = credential_service.issue_credential(
+            subject_id="attestix:agent1",
+            credential_type="TestCred",
+            issuer_name="Issuer",
+            claims={"a": 1},
+        )
+        assert credential_service.verify_credential_external(cred)["valid"] is True
+        tampered = dict(cred, credentialSubject=dict(cred["credentialSubject"], a=2))
+        assert credential_service.verify_credential_external(tampered)["valid"] is False
+
 
 class TestRevokeCredential:
     """Tests for revoking issued credentials."""
@@ -100,6 +216,40 @@ class TestListCredentials:
         assert len(results) == 1
         assert results[0]["credentialSubject"]["id"] == "a:1"
 
+    def test_count_for_agent(self, credential_service):
+        credential_service.issue_credential("a:1", "T", "I", {"x": 1})
+        credential_service.issue_credential("a:1", "T", "I", {"x": 2})
+        credential_service.issue_credential("a:2", "T", "I", {"x": 3})
+        assert credential_service.count_credentials("a:1") == 2
+        assert credential_service.count_credentials("a:3") == 0
+
+    def test_count_returns_error_for_malformed_store(self, credential_service, tmp_attestix):
+        (tmp_attestix / "credentials.json").write_text(
+            '{"credentials": [{"credentialSubject": "a:1"}]}'
+        )
+        assert "error" in credential_service.count_credentials("a:1")
+
+    def test_list_by_agent_matches_single_lists(self, credential_service):
+        credential_service.issue_credential("a:1", "T", "I", {"x": 1})
+        credential_service.issue_credential("a:1", "U", "I", {"x": 2})
+        credential_service.issue_credential("a:2", "T", "I", {"x": 3})
+        grouped = credential_service.list_credentials_by_agent(
+            ["a:2", "a:1", "a:3"], credential_type="T",
+        )
+        assert list(grouped) == ["a:2", "a:1", "a:3"]
+        for agent_id, creds in grouped.items():
+            assert creds == credential_service.list_credentials(
+                agent_id=agent_id, credential_type="T",
+            )
+        assert grouped["a:3"] == []
+
+    def test_list_by_agent_limit_is_per_agent(self, credential_service):
+        for i in range(3):
+            credential_service.issue_credential("a:1", "T", "I", {"x": i})
+            credential_service.issue_credential("a:2", "T", "I", {"x": i})
+        grouped = credential_service.list_credentials_by_agent(["a:1", "a:2"], limit=2)
+        assert [len(v) for v in grouped.values()] == [2, 2]
+
 
 class TestVerifiablePresentation:
     """Tests for creating verifiable presentations from credentials."""